@@ -0,0 +1,103 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from authentication.models import User
+from hunting.cache import CacheStats
+
+# Поля пользователя, которые хранятся в кэше вместе с токеном. Их хватает для
+# проверок прав (role, is_staff...), остальные поля догружаются из БД при обращении
+CACHED_USER_FIELDS = ('id', 'username', 'role', 'is_active', 'is_staff', 'is_superuser')
+
+stats = CacheStats('auth_tokens')
+
+
+def lazy_user(values):
+    # Пользователь только с известными полями, остальные догружаются из БД при обращении.
+    # Это настоящий экземпляр User, его можно присваивать внешним ключам
+    fields = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    return User.from_db(None, fields, [values[field] for field in fields])
+
+
+def token_cache():
+    # None - кэш токенов отключен: локальный для процесса кэш не увидит сброс из других
+    # процессов, и отозванный токен работал бы до TOKEN_CACHE_TIMEOUT (см. settings.CACHES)
+    cache = caches['tokens']
+    if isinstance(cache, LocMemCache) and not settings.TOKEN_CACHE_ALLOW_LOCAL:
+        return None
+    return cache
+
+
+def token_cache_key(key):
+    # В ключе кэша хэш, а не сам токен
+    return 'auth:token:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+def invalidate_tokens(keys):
+    cache = token_cache()
+    cache_keys = [token_cache_key(key) for key in keys]
+    if cache is None or not cache_keys:
+        return
+    # Как в vacancies/cache.py: сразу и еще раз после коммита
+    cache.delete_many(cache_keys)
+    transaction.on_commit(lambda: cache.delete_many(cache_keys))
+
+
+def invalidate_user_tokens(user_ids):
+    if token_cache() is None:
+        return
+    invalidate_tokens(Token.objects.filter(user_id__in=user_ids).values_list('key', flat=True))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    # TokenAuthentication без запроса Token + User на каждый запрос:
+    # токен -> поля пользователя лежат в кэше TOKEN_CACHE_TIMEOUT секунд.
+    # Кэш сбрасывается при удалении токена (Logout) и изменении пользователя,
+    # см. authentication/signals.py
+    def authenticate_credentials(self, key):
+        cache = token_cache()
+        if cache is None:
+            return super().authenticate_credentials(key)
+
+        cache_key = token_cache_key(key)
+        values = cache.get(cache_key)
+        if values is None:
+            stats.miss()
+            user, token = super().authenticate_credentials(key)
+            values = tuple(getattr(user, field) for field in CACHED_USER_FIELDS)
+            cache.set(cache_key, values, settings.TOKEN_CACHE_TIMEOUT)
+            return user, token
+
+        stats.hit()
+        user = lazy_user(dict(zip(CACHED_USER_FIELDS, values)))
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+        token = Token.from_db(None, ['key', 'user_id'], [key, user.id])
+        token.user = user
+        return user, token
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    # JWTAuthentication без запроса пользователя: id и role берутся из claims токена,
+    # который выдает /user/token/ (RoleTokenObtainPairSerializer). Изменения пользователя
+    # видны только в новых токенах, то есть не позже ACCESS_TOKEN_LIFETIME
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[jwt_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        if 'role' not in validated_token:
+            # токены, выданные до появления claim role
+            return super().get_user(validated_token)
+        return lazy_user({jwt_settings.USER_ID_FIELD: user_id, 'role': validated_token['role']})
@@ -0,0 +1,18 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_user_role'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='vacancy_count',
+            field=models.IntegerField(db_index=True, default=0, editable=False),
+        ),
+    ]
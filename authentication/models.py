@@ -16,4 +16,15 @@ class User(AbstractUser):
 
     sex = models.CharField(max_length=1, choices=SEX, default=MALE)
     role = models.CharField(max_length=8, choices=ROLE, default=UNKNOWN)
+    # Счетчик вакансий пользователя, ведется сигналами vacancies/signals.py,
+    # расхождения исправляет manage.py reconcile_vacancy_counts
+    vacancy_count = models.IntegerField(default=0, editable=False, db_index=True)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Имя из БД: кэш списков вакансий сбрасывается, только если оно изменилось
+        if 'username' in instance.__dict__:
+            instance._loaded_username = instance.username
+        return instance
 
@@ -1,9 +1,14 @@
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
 
 from authentication.models import User
+from hunting.serializers import ModelSerializer
 
 
-class UserCreateSerializer(serializers.ModelSerializer):
+class UserCreateSerializer(ModelSerializer):
 
     class Meta:
         model = User
@@ -16,3 +21,29 @@ class UserCreateSerializer(serializers.ModelSerializer):
         user.save()
 
         return user
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    # role в токене нужна StatelessJWTAuthentication для проверки прав без запроса к БД
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['role'] = user.role
+        return token
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    # Новый access токен получает актуальную роль, а не скопированную из refresh токена
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        access = AccessToken(data['access'])
+        user = User.objects.filter(
+            **{api_settings.USER_ID_FIELD: access[api_settings.USER_ID_CLAIM]}, is_active=True
+        ).only('role').first()
+        if user is None:
+            raise AuthenticationFailed('User inactive or deleted.')
+
+        access['role'] = user.role
+        data['access'] = str(access)
+        return data
@@ -0,0 +1,20 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from authentication.authentication import invalidate_tokens, invalidate_user_tokens
+from authentication.models import User
+
+
+# Сброс кэша CachedTokenAuthentication. При удалении пользователя его токены
+# удаляются каскадом, и сработает token_deleted
+@receiver(post_delete, sender=Token)
+def token_deleted(sender, instance, **kwargs):
+    invalidate_tokens([instance.key])
+
+
+@receiver(post_save, sender=User)
+def user_saved(sender, instance, created, **kwargs):
+    if not created:
+        invalidate_user_tokens([instance.pk])
+
@@ -0,0 +1,138 @@
+import asyncio
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.base import setup_django, make_parser, test_database, percentile
+
+
+# Конкурентная нагрузка на эндпоинты чтения: синхронные DRF view за WSGI (пул потоков,
+# как у gunicorn --threads) против ASGI (один event loop, как у uvicorn) с синхронными
+# и асинхронными view. Запросы идут через обработчики Django в процессе, без сети
+def seed(vacancies, skills, chunk_size=10000):
+    from authentication.models import User
+    from vacancies.counters import reconcile_vacancy_counts
+    from vacancies.models import Vacancy, Skill
+
+    user = User.objects.create_user(username='benchmark', password='benchmark', role='hr')
+    skill_ids = [skill.pk for skill in Skill.objects.bulk_create(
+        [Skill(name=f'skill{i}') for i in range(skills)]
+    )]
+    for start in range(0, vacancies, chunk_size):
+        created = Vacancy.objects.bulk_create([
+            Vacancy(slug=f'vacancy-{start + i}', text='benchmark', user=user)
+            for i in range(min(chunk_size, vacancies - start))
+        ])
+        Vacancy.skills.through.objects.bulk_create([
+            Vacancy.skills.through(vacancy_id=vacancy.pk, skill_id=skill_ids[(vacancy.pk + i) % skills])
+            for vacancy in created
+            for i in range(3)
+        ])
+    reconcile_vacancy_counts()
+    return user
+
+
+def summary(timings, elapsed):
+    return {
+        'rps': len(timings) / elapsed,
+        'p50': statistics.median(timings),
+        'p99': percentile(timings, 99),
+    }
+
+
+def run_wsgi(path, headers, requests, concurrency):
+    from django.db import connection
+    from django.test import Client
+
+    def worker(count):
+        client = Client(**headers)
+        timings = []
+        try:
+            for _ in range(count):
+                started = time.perf_counter()
+                assert client.get(path).status_code == 200
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connection.close()
+        return timings
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = executor.map(worker, [requests // concurrency] * concurrency)
+        timings = [timing for worker_timings in results for timing in worker_timings]
+    return summary(timings, time.perf_counter() - started)
+
+
+def run_asgi(path, headers, requests, concurrency):
+    from django.test import AsyncClient
+
+    # AsyncClient передает дополнительные аргументы как есть в заголовки ASGI
+    extra = {key[len('HTTP_'):].lower().replace('_', '-'): value for key, value in headers.items()}
+
+    async def worker(client, count, timings):
+        for _ in range(count):
+            started = time.perf_counter()
+            response = await client.get(path, **extra)
+            assert response.status_code == 200
+            timings.append((time.perf_counter() - started) * 1000)
+
+    async def main():
+        client = AsyncClient()
+        timings = []
+        await asyncio.gather(*[
+            worker(client, requests // concurrency, timings) for _ in range(concurrency)
+        ])
+        return timings
+
+    started = time.perf_counter()
+    timings = asyncio.run(main())
+    return summary(timings, time.perf_counter() - started)
+
+
+def main():
+    parser = make_parser('Sync (WSGI) vs async (ASGI) read endpoints under concurrent load')
+    parser.add_argument('--vacancies', type=int, default=10_000)
+    parser.add_argument('--skills', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import override_settings
+    from rest_framework.authtoken.models import Token
+
+    # Кэш ответов есть только у синхронных view, для честного сравнения он отключен
+    no_cache = override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        'tokens': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    })
+
+    with test_database(keepdb=args.keepdb), no_cache:
+        started = time.perf_counter()
+        user = seed(args.vacancies, args.skills)
+        print(f'seeded {args.vacancies} vacancies in {time.perf_counter() - started:.1f}s')
+
+        headers = {'HTTP_AUTHORIZATION': 'Token ' + Token.objects.create(user=user).key}
+        detail_id = user.vacancy_set.order_by('id').values_list('id', flat=True)[args.vacancies // 2]
+        endpoints = {
+            'list': ('/vacancy/?page=50', '/vacancy/async/?page=50'),
+            'detail': (f'/vacancy/{detail_id}/', f'/vacancy/async/{detail_id}/'),
+            'by_user': ('/vacancy/by_user/', '/vacancy/async/by_user/'),
+        }
+
+        print(f'{args.requests} requests, concurrency {args.concurrency}')
+        print(f"{'endpoint':<10}{'deployment':<20}{'req/s':>8}{'p50, ms':>10}{'p99, ms':>10}")
+        for name, (sync_path, async_path) in endpoints.items():
+            scenarios = {
+                'wsgi, sync view': lambda: run_wsgi(sync_path, headers, args.requests, args.concurrency),
+                'asgi, sync view': lambda: run_asgi(sync_path, headers, args.requests, args.concurrency),
+                'asgi, async view': lambda: run_asgi(async_path, headers, args.requests, args.concurrency),
+            }
+            for scenario, run in scenarios.items():
+                stats = run()
+                print(f"{name:<10}{scenario:<20}{stats['rps']:>8.0f}"
+                      f"{stats['p50']:>10.2f}{stats['p99']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+
+
+# Бенчмарки запускаются из корня проекта: python -m benchmarks.<имя> [--help]
+# Данные создаются во временной тестовой БД (как у manage.py test) и удаляются в конце,
+# рабочая база не затрагивается
+def setup_django():
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hunting.settings')
+
+    import django
+    django.setup()
+
+
+def make_parser(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--repeat', type=int, default=20, help='замеров на сценарий')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--keepdb', action='store_true', help='не удалять тестовую БД')
+    return parser
+
+
+@contextmanager
+def test_database(keepdb=False):
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment(debug=False)
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=keepdb)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=keepdb)
+        teardown_test_environment()
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    index = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+    return values[index]
+
+
+def measure(func, repeat=20, warmup=2):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    with CaptureQueriesContext(connection) as context:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'p50': statistics.median(timings),
+        'p99': percentile(timings, 99),
+        'mean': statistics.fmean(timings),
+        'queries': len(context.captured_queries) / repeat,
+    }
+
+
+def report(title, results):
+    print(f'\n{title}')
+    print(f"{'scenario':<32}{'p50, ms':>10}{'p99, ms':>10}{'mean, ms':>10}{'queries':>9}")
+    for name, stats in results.items():
+        print(f"{name:<32}{stats['p50']:>10.2f}{stats['p99']:>10.2f}"
+              f"{stats['mean']:>10.2f}{stats['queries']:>9.1f}")
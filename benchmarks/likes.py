@@ -0,0 +1,85 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.base import setup_django, make_parser, test_database, percentile
+
+
+# Нагрузочный тест PUT /vacancy/like/: N потоков одновременно лайкают одну вакансию.
+# Показателен на PostgreSQL (блокировка горячей строки); SQLite сериализует любые записи
+def run_likers(view, factory, vacancy_id, likers, likes_per_liker):
+    from django.db import connection
+
+    barrier = threading.Barrier(likers)
+
+    def liker():
+        timings, errors = [], 0
+        barrier.wait()
+        try:
+            for _ in range(likes_per_liker):
+                request = factory.put('/vacancy/like/', [vacancy_id], format='json')
+                started = time.perf_counter()
+                try:
+                    response = view(request)
+                    if response.status_code != 200:
+                        errors += 1
+                except Exception:
+                    errors += 1
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            connection.close()
+        return timings, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=likers) as executor:
+        results = list(executor.map(lambda _: liker(), range(likers)))
+    elapsed = time.perf_counter() - started
+
+    timings = [timing for liker_timings, _ in results for timing in liker_timings]
+    errors = sum(liker_errors for _, liker_errors in results)
+    return {
+        'elapsed': elapsed,
+        'throughput': (len(timings) - errors) / elapsed,
+        'p50': statistics.median(timings),
+        'p99': percentile(timings, 99),
+        'errors': errors,
+    }
+
+
+def main():
+    parser = make_parser('PUT /vacancy/like/ under concurrent likers')
+    parser.add_argument('--likers', type=int, default=200)
+    parser.add_argument('--likes-per-liker', type=int, default=10)
+    parser.add_argument('--modes', nargs='+', default=['direct', 'buffered', 'sharded'])
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import override_settings
+    from rest_framework.test import APIRequestFactory
+    from vacancies.likes import get_likes_backend, flush_likes
+    from vacancies.models import Vacancy
+    from vacancies.views import VacancyLikeView
+
+    with test_database(keepdb=args.keepdb):
+        view = VacancyLikeView.as_view()
+        factory = APIRequestFactory()
+        expected = args.likers * args.likes_per_liker
+
+        print(f'{args.likers} likers x {args.likes_per_liker} likes on one vacancy')
+        print(f"{'mode':<12}{'likes/s':>10}{'p50, ms':>10}{'p99, ms':>10}{'errors':>8}{'total ok':>10}")
+        for mode in args.modes:
+            with override_settings(VACANCY_LIKES_MODE=mode):
+                vacancy = Vacancy.objects.create(slug=f'likes-{mode}', text='benchmark')
+                stats = run_likers(view, factory, vacancy.pk, args.likers, args.likes_per_liker)
+
+                flush_likes()
+                total = get_likes_backend().annotate(Vacancy.objects.filter(pk=vacancy.pk)).get()
+                total = getattr(total, 'likes_total', total.likes)
+
+            print(f"{mode:<12}{stats['throughput']:>10.0f}{stats['p50']:>10.2f}{stats['p99']:>10.2f}"
+                  f"{stats['errors']:>8}{str(total == expected - stats['errors']):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+import time
+
+from benchmarks.base import setup_django, make_parser, test_database, measure, report
+
+
+def seed(vacancies, per_day, chunk_size=10000):
+    from datetime import date, timedelta
+    from vacancies.models import Vacancy
+
+    for start in range(0, vacancies, chunk_size):
+        size = min(chunk_size, vacancies - start)
+        Vacancy.objects.bulk_create([
+            Vacancy(slug=f'vacancy-{start + i}', text='benchmark', status='open')
+            for i in range(size)
+        ])
+
+    # created ставится auto_now_add, поэтому разносим вакансии по дням отдельно
+    ids = list(Vacancy.objects.order_by('id').values_list('id', flat=True))
+    first_day = date.today() - timedelta(days=len(ids) // per_day)
+    for day, start in enumerate(range(0, len(ids), per_day)):
+        Vacancy.objects.filter(pk__in=ids[start:start + per_day]).update(
+            created=first_day + timedelta(days=day)
+        )
+
+
+def main():
+    parser = make_parser('Глубокие страницы: OFFSET против курсора (created, id)')
+    parser.add_argument('--vacancies', type=int, default=110_000)
+    parser.add_argument('--per-day', type=int, default=100, help='вакансий с одной датой created')
+    parser.add_argument('--pages', type=int, nargs='+', default=[1, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import Client
+    from vacancies.models import Vacancy
+    from vacancies.pagination import VacancyPagination
+
+    with test_database(keepdb=args.keepdb):
+        started = time.perf_counter()
+        seed(args.vacancies, args.per_day)
+        print(f'seeded {args.vacancies} vacancies in {time.perf_counter() - started:.1f}s')
+
+        client = Client()
+        pagination = VacancyPagination()
+        page_size = pagination.page_size
+        ordered = Vacancy.objects.order_by(*pagination.ordering)
+
+        results = {}
+        for page in args.pages:
+            results[f'page={page}'] = measure(
+                lambda: client.get('/vacancy/', {'page': page}), repeat=args.repeat
+            )
+
+            # курсор, указывающий на последнюю строку предыдущей страницы
+            cursor = {'pagination': 'cursor'}
+            if page > 1:
+                last = ordered.values('created', 'id')[(page - 1) * page_size - 1]
+                cursor['cursor'] = pagination.encode_cursor(pagination._position(last))
+            results[f'cursor, page {page}'] = measure(
+                lambda: client.get('/vacancy/', cursor), repeat=args.repeat
+            )
+
+        report('vacancy list pagination', results)
+
+
+if __name__ == '__main__':
+    main()
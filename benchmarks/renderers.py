@@ -0,0 +1,67 @@
+import datetime
+import decimal
+import io
+
+from benchmarks.base import setup_django, make_parser, measure, report
+
+
+# Пропускная способность кодирования ответов API: стандартный JSONRenderer DRF
+# против hunting.json (orjson и запасной вариант на json из stdlib).
+# Данные - страница списка вакансий и крупный ответ выгрузки, БД не нужна
+def make_rows(count):
+    created = datetime.datetime(2023, 3, 1, 12, 30, tzinfo=datetime.timezone.utc)
+    return [{
+        'id': i,
+        'slug': f'vacancy-{i}',
+        'text': 'Требуется разработчик ' * 10,
+        'status': 'open',
+        'created': created.date() + datetime.timedelta(days=i % 30),
+        'modified': created + datetime.timedelta(minutes=i),
+        'salary': decimal.Decimal('1500.50') + i,
+        'min_experience': i % 5,
+        'likes': i * 3,
+        'user': i % 10,
+        'username': f'user{i % 10}',
+        'skills': ['python', 'django', 'postgresql'][:i % 3 + 1],
+    } for i in range(count)]
+
+
+def main():
+    parser = make_parser('DRF JSONRenderer vs orjson-backed hunting.json renderer')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=10_000, help='строк в крупном ответе')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.test import override_settings
+    from rest_framework.parsers import JSONParser as DRFParser
+    from rest_framework.renderers import JSONRenderer as DRFRenderer
+    from hunting import json
+    from hunting.json import JSONRenderer, JSONParser
+
+    payloads = {
+        'page': {'count': 10_000, 'next': None, 'previous': None, 'results': make_rows(args.page_size)},
+        'bulk': make_rows(args.rows),
+    }
+    drf, fast = DRFRenderer(), JSONRenderer()
+
+    for name, data in payloads.items():
+        size = len(drf.render(data))
+        results = {'drf JSONRenderer': measure(lambda: drf.render(data), repeat=args.repeat)}
+        if json.orjson is not None:
+            with override_settings(JSON_BACKEND='orjson'):
+                results['hunting.json, orjson'] = measure(lambda: fast.render(data), repeat=args.repeat)
+        with override_settings(JSON_BACKEND='stdlib'):
+            results['hunting.json, stdlib'] = measure(lambda: fast.render(data), repeat=args.repeat)
+        report(f'{name}: {size / 1024:.0f} KiB, render', results)
+
+        body = drf.render(data)
+        results = {'drf JSONParser': measure(lambda: DRFParser().parse(io.BytesIO(body)), repeat=args.repeat)}
+        if json.orjson is not None:
+            with override_settings(JSON_BACKEND='orjson'):
+                results['hunting.json, orjson'] = measure(lambda: JSONParser().parse(io.BytesIO(body)), repeat=args.repeat)
+        report(f'{name}: parse', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+from benchmarks.base import setup_django, make_parser, test_database, measure, report
+
+
+# Вывод страницы списка и карточек: DRF сериализаторы на моделях против
+# быстрого пути из vacancies/fast_serializers.py на строках .values()
+def seed(vacancies, skills_per_vacancy):
+    from authentication.models import User
+    from vacancies.models import Vacancy, Skill
+    from vacancies.skills import add_vacancy_skills
+
+    user = User.objects.create(username='benchmark', password='!')
+    skills = Skill.objects.bulk_create([Skill(name=f'skill{i}') for i in range(skills_per_vacancy * 2)])
+    created = Vacancy.objects.bulk_create([
+        Vacancy(slug=f'vacancy-{i}', text='benchmark ' * 20, user=user, min_experience=i % 5)
+        for i in range(vacancies)
+    ])
+    add_vacancy_skills(
+        (vacancy.pk, skills[(vacancy.pk + i) % len(skills)].pk)
+        for vacancy in created
+        for i in range(skills_per_vacancy)
+    )
+
+
+def main():
+    parser = make_parser('VacancyListSerializer / VacancyDetailSerializer vs values() fast path')
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--skills', type=int, default=3, help='навыков у вакансии')
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+    from vacancies.fast_serializers import vacancy_list_values, vacancy_detail_values
+    from vacancies.models import Vacancy
+    from vacancies.serializers import VacancyListSerializer, VacancyDetailSerializer
+
+    with test_database(keepdb=args.keepdb):
+        seed(args.page_size, args.skills)
+        render = JSONRenderer().render
+        page = Vacancy.objects.for_list().order_by('id')
+        detail = Vacancy.objects.prefetch_related('skills').order_by('id')
+
+        def drf_list():
+            return render(VacancyListSerializer(page.all(), many=True).data)
+
+        def fast_list():
+            return render(vacancy_list_values.serialize_many(vacancy_list_values.values(page)))
+
+        def drf_detail():
+            return render(VacancyDetailSerializer(detail.all(), many=True).data)
+
+        def fast_detail():
+            return render(vacancy_detail_values.serialize_many(vacancy_detail_values.values(detail)))
+
+        assert drf_list() == fast_list() and drf_detail() == fast_detail()
+
+        # только сериализация уже загруженных данных, без запросов
+        instances = list(page.all())
+        rows = list(vacancy_list_values.values(page))
+        skills = {row['id']: list(skill.name for skill in vacancy.skills.all())
+                  for row, vacancy in zip(rows, instances)}
+
+        results = {
+            'list, drf': measure(drf_list, repeat=args.repeat),
+            'list, values': measure(fast_list, repeat=args.repeat),
+            'detail, drf': measure(drf_detail, repeat=args.repeat),
+            'detail, values': measure(fast_detail, repeat=args.repeat),
+            'list serialize only, drf': measure(
+                lambda: VacancyListSerializer(instances, many=True).data, repeat=args.repeat
+            ),
+            'list serialize only, values': measure(
+                lambda: [vacancy_list_values.to_representation(row, skills) for row in rows],
+                repeat=args.repeat,
+            ),
+        }
+        report(f'{args.page_size} vacancies per page', results)
+
+
+if __name__ == '__main__':
+    main()
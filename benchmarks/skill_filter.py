@@ -0,0 +1,75 @@
+import random
+import time
+
+from benchmarks.base import setup_django, make_parser, test_database, measure, report
+
+
+def seed(vacancies, skills, per_vacancy, rnd, chunk_size=10000):
+    from vacancies.models import Vacancy, Skill
+
+    skill_objs = Skill.objects.bulk_create([Skill(name=f'Skill{i}') for i in range(skills)])
+    skill_ids = [skill.pk for skill in skill_objs]
+    through = Vacancy.skills.through
+
+    for start in range(0, vacancies, chunk_size):
+        size = min(chunk_size, vacancies - start)
+        created = Vacancy.objects.bulk_create([
+            Vacancy(slug=f'vacancy-{start + i}', text='benchmark', status='open')
+            for i in range(size)
+        ])
+        through.objects.bulk_create([
+            through(vacancy_id=vacancy.pk, skill_id=skill_id)
+            for vacancy in created
+            for skill_id in rnd.sample(skill_ids, per_vacancy)
+        ])
+
+
+def run_page(queryset):
+    # То же, что делает список: count для пагинатора и первая страница
+    queryset.count()
+    list(queryset.values_list('id', flat=True)[:10])
+
+
+def main():
+    parser = make_parser('Фильтрация вакансий по ?skill=')
+    parser.add_argument('--vacancies', type=int, default=100_000)
+    parser.add_argument('--skills', type=int, default=50)
+    parser.add_argument('--per-vacancy', type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db.models import Q
+    from vacancies.filters import filter_by_skills
+    from vacancies.models import Vacancy
+
+    with test_database(keepdb=args.keepdb):
+        started = time.perf_counter()
+        seed(args.vacancies, args.skills, args.per_vacancy, random.Random(args.seed))
+        print(f'seeded {args.vacancies} vacancies x {args.skills} skills '
+              f'in {time.perf_counter() - started:.1f}s')
+
+        names = ['skill1', 'skill2', 'skill3']
+        queryset = Vacancy.objects.all()
+        scenarios = {
+            # так фильтр работал раньше: OR по join-у, вакансии дублируются
+            'join icontains (old)': lambda: run_page(queryset.filter(
+                Q(skills__name__icontains=names[0])
+                | Q(skills__name__icontains=names[1])
+                | Q(skills__name__icontains=names[2])
+            )),
+            'join icontains + distinct': lambda: run_page(queryset.filter(
+                Q(skills__name__icontains=names[0])
+                | Q(skills__name__icontains=names[1])
+                | Q(skills__name__icontains=names[2])
+            ).distinct()),
+            'semi-join icontains': lambda: run_page(filter_by_skills(queryset, names)),
+            'exact any': lambda: run_page(filter_by_skills(queryset, names, 'any')),
+            'exact all': lambda: run_page(filter_by_skills(queryset, names[:2], 'all')),
+        }
+        report('skill filter', {
+            name: measure(func, repeat=args.repeat) for name, func in scenarios.items()
+        })
+
+
+if __name__ == '__main__':
+    main()
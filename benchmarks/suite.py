@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+
+from benchmarks.base import setup_django, make_parser, test_database, measure, report
+
+# Набор сценариев горячих путей API с сохраненными базовыми результатами:
+#
+#   python -m benchmarks.suite --size 10k                    # сравнить с базой
+#   python -m benchmarks.suite --size 100k --save-baseline   # записать базу
+#   DB_ENGINE=django.db.backends.postgresql DB_NAME=hunting ... python -m benchmarks.suite
+#
+# База - абсолютные времена одной машины, поэтому в git ее нет (benchmarks/baselines/
+# в .gitignore): каждая машина записывает свою, файл <vendor>-<size>-<машина>.json.
+# Машину задает BENCHMARK_MACHINE (в CI - имя раннера/образа), иначе отпечаток
+# хоста, процессора и версии Python. Прогон падает (код 1), если у сценария стало
+# больше SQL запросов или p50 вырос больше чем на --tolerance (плюс --slack мс на шум).
+# p99 выводится, но не сравнивается - слишком шумный.
+# Кэш ответов отключен, запросы авторизуются JWT без обращения к БД
+
+BASELINES = Path(__file__).resolve().parent / 'baselines'
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+
+def machine_fingerprint():
+    machine = os.environ.get('BENCHMARK_MACHINE')
+    if machine:
+        return machine
+    parts = (platform.node(), platform.machine(), platform.processor(), os.cpu_count(),
+             platform.python_implementation(), platform.python_version())
+    return hashlib.sha1(repr(parts).encode()).hexdigest()[:12]
+
+
+def seed(vacancies, seed):
+    from authentication.models import User
+    from tests.factories import VacancyFactory
+
+    VacancyFactory.create_bulk(vacancies, seed=seed)
+    return User.objects.order_by('id').first()
+
+
+def scenarios(client, vacancies):
+    from vacancies.models import Vacancy
+
+    detail_id = Vacancy.objects.order_by('id').values_list('id', flat=True)[vacancies // 2]
+    counter = iter(range(sys.maxsize))
+
+    return {
+        'list': lambda: client.get('/vacancy/', {'page': 10}),
+        'search': lambda: client.get('/vacancy/', {'text': 'python'}),
+        'skill filter': lambda: client.get('/vacancy/', {'skill': ['perf-skill1', 'perf-skill2']}),
+        'detail': lambda: client.get(f'/vacancy/{detail_id}/'),
+        'create': lambda: client.post(
+            '/vacancy/create/',
+            {'slug': f'benchmark-{next(counter)}', 'text': 'benchmark', 'status': 'draft'},
+            content_type='application/json',
+        ),
+        'like': lambda: client.put('/vacancy/like/', [detail_id], content_type='application/json'),
+        'user_vacancies': lambda: client.get('/vacancy/by_user/'),
+    }
+
+
+def checked(func, status):
+    def run():
+        response = func()
+        assert response.status_code == status, (response.status_code, response.content[:200])
+    return run
+
+
+def compare(results, baseline, tolerance, slack):
+    failures = []
+    for name, stats in results.items():
+        base = baseline['results'].get(name)
+        if base is None:
+            continue
+        if stats['queries'] > base['queries']:
+            failures.append(f"{name}: {stats['queries']:.1f} queries, baseline {base['queries']:.1f}")
+        limit = base['p50'] * (1 + tolerance) + slack
+        if stats['p50'] > limit:
+            failures.append(f"{name}: p50 {stats['p50']:.2f} ms, baseline {base['p50']:.2f} ms "
+                            f"(limit {limit:.2f} ms)")
+    return failures
+
+
+def main():
+    parser = make_parser('Hot-path API benchmark suite with stored baselines')
+    parser.add_argument('--size', choices=SIZES, default='10k', help='вакансий в наборе данных')
+    parser.add_argument('--save-baseline', action='store_true', help='записать результаты как базу')
+    parser.add_argument('--tolerance', type=float, default=0.3, help='допустимый рост p50, доля')
+    parser.add_argument('--slack', type=float, default=1.0, help='допустимый рост p50 сверх доли, мс')
+    parser.add_argument('--baselines', type=Path, default=BASELINES, help='каталог с базами')
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+    from django.test import Client, override_settings
+    from authentication.serializers import RoleTokenObtainPairSerializer
+
+    vacancies = SIZES[args.size]
+    no_cache = override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+        'tokens': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'},
+    })
+
+    with test_database(keepdb=args.keepdb), no_cache:
+        started = time.perf_counter()
+        user = seed(vacancies, args.seed)
+        print(f'{connection.vendor}: seeded {vacancies} vacancies in {time.perf_counter() - started:.1f}s')
+
+        access = RoleTokenObtainPairSerializer.get_token(user).access_token
+        client = Client(HTTP_AUTHORIZATION=f'Bearer {access}')
+        statuses = {'create': 201}
+        results = {
+            name: measure(checked(func, statuses.get(name, 200)), repeat=args.repeat)
+            for name, func in scenarios(client, vacancies).items()
+        }
+        report(f'{connection.vendor}, {args.size} vacancies', results)
+
+    machine = machine_fingerprint()
+    path = args.baselines / f'{connection.vendor}-{args.size}-{machine}.json'
+    if args.save_baseline:
+        args.baselines.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'fingerprint': machine,
+            'repeat': args.repeat,
+            'results': results,
+        }, indent=2, sort_keys=True) + '\n')
+        print(f'\nbaseline saved to {path}')
+        return
+
+    if not path.exists():
+        print(f'\nno baseline for this machine at {path}, run with --save-baseline')
+        return
+
+    failures = compare(results, json.loads(path.read_text()), args.tolerance, args.slack)
+    if failures:
+        print('\nregressions against ' + str(path))
+        print('\n'.join(failures))
+        sys.exit(1)
+    print(f'\nno regressions against {path}')
+
+
+if __name__ == '__main__':
+    main()
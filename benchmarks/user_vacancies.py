@@ -0,0 +1,75 @@
+import random
+import time
+
+from benchmarks.base import setup_django, make_parser, test_database, measure, report
+
+
+def seed(users, vacancies, rnd, chunk_size=20000):
+    from authentication.models import User
+    from vacancies.counters import reconcile_vacancy_counts
+    from vacancies.models import Vacancy
+
+    for start in range(0, users, chunk_size):
+        User.objects.bulk_create([
+            User(username=f'user{start + i}', password='!')
+            for i in range(min(chunk_size, users - start))
+        ])
+    user_ids = list(User.objects.values_list('id', flat=True))
+
+    for start in range(0, vacancies, chunk_size):
+        Vacancy.objects.bulk_create([
+            Vacancy(slug=f'vacancy-{start + i}', text='benchmark', user_id=rnd.choice(user_ids))
+            for i in range(min(chunk_size, vacancies - start))
+        ])
+
+    # bulk_create не шлет сигналов, счетчики выставляем одним проходом
+    reconcile_vacancy_counts()
+    return User.objects.first()
+
+
+def old_user_vacancies(page):
+    # Исходная реализация: аннотация Count('vacancy') считалась три раза
+    from django.core.paginator import Paginator
+    from django.db.models import Count, Avg
+    from authentication.models import User
+
+    user_qs = User.objects.annotate(vacancies=Count('vacancy'))
+    paginator = Paginator(user_qs, 10)
+    page_obj = paginator.get_page(page)
+    items = [{"id": user.id, "name": user.username, "vacancies": user.vacancies} for user in page_obj]
+    return items, paginator.count, user_qs.aggregate(avg=Avg('vacancies'))['avg']
+
+
+def main():
+    parser = make_parser('GET /vacancy/by_user/')
+    parser.add_argument('--users', type=int, default=100_000)
+    parser.add_argument('--vacancies', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.test import APIRequestFactory, force_authenticate
+    from vacancies.views import user_vacancies
+
+    with test_database(keepdb=args.keepdb):
+        started = time.perf_counter()
+        user = seed(args.users, args.vacancies, random.Random(args.seed))
+        print(f'seeded {args.users} users / {args.vacancies} vacancies '
+              f'in {time.perf_counter() - started:.1f}s')
+
+        factory = APIRequestFactory()
+        last_page = args.users // 10
+
+        def new_user_vacancies(page):
+            request = factory.get('/vacancy/by_user/', {'page': page})
+            force_authenticate(request, user=user)
+            return user_vacancies(request)
+
+        results = {}
+        for page in (1, last_page):
+            results[f'old, page {page}'] = measure(lambda: old_user_vacancies(page), repeat=args.repeat)
+            results[f'new, page {page}'] = measure(lambda: new_user_vacancies(page), repeat=args.repeat)
+        report('user_vacancies', results)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,10 @@
-from django.http import JsonResponse
 from django.shortcuts import render
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import UpdateView
 
 from companies.models import Company
+from hunting.json import JsonResponse
 
 
 # Create your views here.
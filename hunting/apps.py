@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class HuntingConfig(AppConfig):
+    name = 'hunting'
+
+    def ready(self):
+        from hunting import instrumentation  # noqa: F401
+        from hunting.db import stats  # noqa: F401
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hunting.settings')
+# Для настроек, зависящих от сервера (CONN_MAX_AGE)
+os.environ.setdefault('DJANGO_SERVER', 'asgi')
 
 application = get_asgi_application()
@@ -0,0 +1,33 @@
+import threading
+
+
+class CacheStats:
+    # Счетчики попаданий и промахов кэша в пределах процесса
+    registry = {}
+
+    def __init__(self, name):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        CacheStats.registry[name] = self
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def as_dict(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else None,
+        }
+
+    @classmethod
+    def all(cls):
+        return {name: stats.as_dict() for name, stats in cls.registry.items()}
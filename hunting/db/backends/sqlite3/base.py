@@ -0,0 +1,9 @@
+from django.db.backends.sqlite3 import base
+
+from hunting.db.pool import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    # Для проверки пула без PostgreSQL: работает только с файловой БД,
+    # у каждого соединения с :memory: своя пустая база
+    pass
@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import deque
+
+from django.db import OperationalError
+
+# Пул соединений с БД в пределах процесса. Подключается через ENGINE
+# hunting.db.backends.postgresql / hunting.db.backends.sqlite3 (см. DB_POOL в settings.py).
+# Django закрывает соединение в конце запроса (CONN_MAX_AGE = 0), а пул вместо
+# закрытия забирает его себе и отдает следующему запросу любого потока -
+# одинаково для потоков WSGI воркера и sync_to_async потоков ASGI.
+
+DEFAULT_OPTIONS = {
+    'MAX_SIZE': 10,  # соединений на процесс
+    'TIMEOUT': 10,  # секунд ждать свободного соединения
+    'MAX_LIFETIME': 3600,  # секунд, после чего соединение пересоздается
+    'CHECK_AFTER': 30,  # секунд простоя, после которых соединение проверяется SELECT 1
+}
+
+pools = {}
+_pools_lock = threading.Lock()
+
+
+class PoolExhausted(OperationalError):
+    pass
+
+
+class ConnectionPool:
+    def __init__(self, alias, max_size=10, timeout=10, max_lifetime=3600, check_after=30):
+        self.alias = alias
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.check_after = check_after
+
+        self.idle = deque()  # (соединение, время создания, время возврата)
+        self.created_at = {}  # id(соединения) -> время создания
+        self.size = 0
+        self.condition = threading.Condition()
+
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.waits = 0
+
+    def acquire(self, connect, check):
+        deadline = time.monotonic() + self.timeout
+        with self.condition:
+            while True:
+                while self.idle:
+                    connection, created, released = self.idle.pop()
+                    if self._healthy(connection, created, released, check):
+                        self.reused += 1
+                        return connection
+                    self._discard(connection)
+
+                if self.size < self.max_size:
+                    self.size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolExhausted(
+                        f'No free connection in pool {self.alias!r} after {self.timeout}s'
+                    )
+                self.waits += 1
+                self.condition.wait(remaining)
+
+        # Новое соединение открываем вне блокировки, чтобы не задерживать другие потоки
+        try:
+            connection = connect()
+        except Exception:
+            with self.condition:
+                self.size -= 1
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.created += 1
+            self.created_at[id(connection)] = time.monotonic()
+        return connection
+
+    def release(self, connection, reset):
+        try:
+            reset(connection)
+        except Exception:
+            with self.condition:
+                self._discard(connection)
+                self.condition.notify()
+            return
+
+        with self.condition:
+            created = self.created_at.get(id(connection), time.monotonic())
+            self.idle.append((connection, created, time.monotonic()))
+            self.condition.notify()
+
+    def _healthy(self, connection, created, released, check):
+        now = time.monotonic()
+        if now - created > self.max_lifetime:
+            return False
+        if now - released > self.check_after:
+            try:
+                check(connection)
+            except Exception:
+                return False
+        return True
+
+    def _discard(self, connection):
+        self.size -= 1
+        self.discarded += 1
+        self.created_at.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def close_all(self):
+        with self.condition:
+            while self.idle:
+                self._discard(self.idle.pop()[0])
+            self.condition.notify_all()
+
+    def stats(self):
+        with self.condition:
+            return {
+                'max_size': self.max_size,
+                'size': self.size,
+                'idle': len(self.idle),
+                'in_use': self.size - len(self.idle),
+                'created': self.created,
+                'reused': self.reused,
+                'discarded': self.discarded,
+                'waits': self.waits,
+            }
+
+
+def get_pool(alias, settings_dict):
+    with _pools_lock:
+        if alias not in pools:
+            options = {**DEFAULT_OPTIONS, **settings_dict.get('POOL', {})}
+            pools[alias] = ConnectionPool(alias, **{key.lower(): value for key, value in options.items()})
+        return pools[alias]
+
+
+def pool_stats():
+    return {alias: pool.stats() for alias, pool in pools.items()}
+
+
+class PooledDatabaseWrapperMixin:
+    # Подмешивается перед DatabaseWrapper встроенного бэкенда Django
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, self.settings_dict)
+
+    def get_new_connection(self, conn_params):
+        return self.pool.acquire(
+            lambda: super(PooledDatabaseWrapperMixin, self).get_new_connection(conn_params),
+            self._check_pooled_connection,
+        )
+
+    def _close(self):
+        if self.connection is not None:
+            # Незавершенная транзакция не должна достаться следующему запросу
+            self.pool.release(self.connection, self._reset_pooled_connection)
+
+    @staticmethod
+    def _check_pooled_connection(connection):
+        cursor = connection.cursor()
+        try:
+            cursor.execute('SELECT 1')
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _reset_pooled_connection(connection):
+        connection.rollback()
@@ -0,0 +1,109 @@
+import hashlib
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from hunting.middleware import Middleware
+
+# Чтение с реплик (settings.DATABASE_REPLICAS) только внутри безопасных HTTP запросов
+# (GET, HEAD, OPTIONS) - это решает ReplicaRoutingMiddleware. Все остальное: запись,
+# запросы после недавней записи того же клиента, команды manage.py - идет в default.
+# Реплика выбирается одна на запрос, чтобы все его чтения видели одно состояние данных
+replica = ContextVar('replica', default=None)
+
+STICKY_COOKIE = 'db_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = replica.get()
+        # Внутри транзакции читаем то, что в ней же и записали
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Реплики - копии default, объекты из них можно связывать между собой
+        return True
+
+
+def pinned_to_primary():
+    # Чтения запроса идут в default, хотя реплики есть: клиент недавно писал.
+    # Такие запросы не должны ни читать, ни заполнять общий кэш ответов: его могли
+    # заполнить с отстающей реплики, а ответ с default другим клиентам не нужен
+    return bool(getattr(settings, 'DATABASE_REPLICAS', [])) and replica.get() is None
+
+
+def sticky_cache():
+    # None - метки в кэше не видны другим процессам (см. settings.REPLICA_STICKY_ALLOW_LOCAL)
+    cache = caches['default']
+    if isinstance(cache, LocMemCache) and not settings.REPLICA_STICKY_ALLOW_LOCAL:
+        return None
+    return cache
+
+
+def sticky_key(request):
+    authorization = request.META.get('HTTP_AUTHORIZATION')
+    if not authorization:
+        return None
+    return 'db:primary:' + hashlib.sha256(authorization.encode()).hexdigest()
+
+
+class ReplicaRoutingMiddleware(Middleware):
+    # Read-your-writes: после успешной записи клиент REPLICA_STICKY_SECONDS секунд
+    # читает с default, пока реплика догоняет. Клиент определяется по заголовку
+    # Authorization (метка в кэше), без него - по cookie. Если общего кэша нет,
+    # клиенты с Authorization всегда читают с default
+    def __call__(self, request):
+        if self._is_coroutine:
+            return self.__acall__(request)
+        token = self.route(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            replica.reset(token)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        token = self.route(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            replica.reset(token)
+        return self.process_response(request, response)
+
+    def route(self, request):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if not replicas or request.method not in SAFE_METHODS or self.is_sticky(request):
+            return replica.set(None)
+        return replica.set(random.choice(replicas))
+
+    def process_response(self, request, response):
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            self.stick(request, response)
+        return response
+
+    def is_sticky(self, request):
+        if STICKY_COOKIE in request.COOKIES:
+            return True
+        key = sticky_key(request)
+        if key is None:
+            return False
+        shared = sticky_cache()
+        return shared is None or shared.get(key) is not None
+
+    def stick(self, request, response):
+        timeout = settings.REPLICA_STICKY_SECONDS
+        key = sticky_key(request)
+        shared = sticky_cache()
+        if key is not None and shared is not None:
+            shared.set(key, 1, timeout)
+        response.set_cookie(STICKY_COOKIE, '1', max_age=timeout, httponly=True, samesite='Lax')
@@ -0,0 +1,53 @@
+import threading
+from collections import Counter
+
+from django.core.signals import request_started
+from django.db.backends.signals import connection_created
+
+from hunting.db.pool import pool_stats
+
+# Сколько запросов обслужено и сколько раз Django открывал соединение с БД.
+# Без пула и с CONN_MAX_AGE = 0 соединений столько же, сколько запросов;
+# при постоянных соединениях или пуле - заметно меньше
+
+_lock = threading.Lock()
+_requests = 0
+_connections = Counter()
+
+
+def count_request(**kwargs):
+    global _requests
+    with _lock:
+        _requests += 1
+
+
+def count_connection(sender, connection, **kwargs):
+    with _lock:
+        _connections[connection.alias] += 1
+
+
+request_started.connect(count_request, dispatch_uid='hunting.db.stats.count_request')
+connection_created.connect(count_connection, dispatch_uid='hunting.db.stats.count_connection')
+
+
+def connection_stats():
+    from django.db import connections
+
+    with _lock:
+        stats = {
+            'requests': _requests,
+            'databases': {
+                alias: {
+                    'engine': connections[alias].settings_dict['ENGINE'],
+                    'conn_max_age': connections[alias].settings_dict['CONN_MAX_AGE'],
+                    'conn_health_checks': connections[alias].settings_dict['CONN_HEALTH_CHECKS'],
+                    'connects': _connections[alias],
+                }
+                for alias in connections
+            },
+        }
+
+    # connects считает и выдачи из пула, а pool.created - реально открытые соединения
+    for alias, pool in pool_stats().items():
+        stats['databases'].setdefault(alias, {})['pool'] = pool
+    return stats
@@ -0,0 +1,265 @@
+import functools
+import logging
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
+from hunting.middleware import Middleware
+
+# Метрики запроса: число SQL запросов и их время, повторы одного и того же запроса
+# (N+1), время сериализации и рендеринга ответа. InstrumentationMiddleware собирает их
+# для каждого запроса, в DEBUG отдает заголовками Server-Timing / X-DB-*, и копит
+# сводку по маршрутам для /metrics (формат Prometheus)
+
+logger = logging.getLogger(__name__)
+
+current = ContextVar('request_metrics', default=None)
+
+# Границы гистограмм: длительность запроса в секундах и число SQL запросов
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# IN (%s, %s, ...) с разным числом значений - один и тот же запрос
+_IN_PLACEHOLDERS = re.compile(r'IN \((?:%s, )*%s\)')
+
+
+def query_signature(sql):
+    return _IN_PLACEHOLDERS.sub('IN (...)', sql)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.sql_time = 0.0
+        self.signatures = Counter()
+        self.statements = Counter()
+        self.timings = defaultdict(float)
+
+    @property
+    def duplicates(self):
+        # Лишние выполнения запросов с теми же SQL и параметрами
+        return sum(count - 1 for count in self.statements.values())
+
+    def n_plus_one(self):
+        threshold = settings.INSTRUMENTATION_N_PLUS_ONE_THRESHOLD
+        return {sql: count for sql, count in self.signatures.items() if count >= threshold}
+
+
+class QueryRecorder:
+    # execute_wrapper каждого соединения, считает запросы в метрики текущего запроса
+    def __call__(self, execute, sql, params, many, context):
+        metrics = current.get()
+        if metrics is None:
+            return execute(sql, params, many, context)
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.queries += 1
+            metrics.sql_time += time.perf_counter() - started
+            metrics.signatures[query_signature(sql)] += 1
+            try:
+                metrics.statements[(sql, repr(params))] += 1
+            except Exception:  # repr параметров не должен ронять запрос
+                pass
+
+
+recorder = QueryRecorder()
+
+
+def install_recorder(sender, connection, **kwargs):
+    # Соединения с БД у каждого потока свои, и запросы async view идут из потоков
+    # sync_to_async, поэтому recorder ставится на соединение при открытии, а не на время
+    # запроса в middleware. Метрики (ContextVar current) sync_to_async передает в поток
+    if recorder not in connection.execute_wrappers:
+        connection.execute_wrappers.append(recorder)
+
+
+connection_created.connect(install_recorder, dispatch_uid='hunting.instrumentation.install_recorder')
+
+
+@contextmanager
+def timer(name):
+    # Время участка в метрики текущего запроса: serializer (hunting.serializers,
+    # ValuesSerializer), render (hunting.json.JSONRenderer и JsonResponse)
+    metrics = current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += time.perf_counter() - started
+
+
+def timed(name):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class MetricsRegistry:
+    # Сводка по маршрутам в пределах процесса
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = Counter()
+        self.sums = defaultdict(Counter)
+        self.duration = defaultdict(lambda: [0] * (len(DURATION_BUCKETS) + 1))
+        self.query_counts = defaultdict(lambda: [0] * (len(QUERY_BUCKETS) + 1))
+
+    def observe(self, route, method, status, metrics, duration):
+        with self._lock:
+            self.requests[(route, method, str(status))] += 1
+            sums = self.sums[route]
+            sums['duration'] += duration
+            sums['queries'] += metrics.queries
+            sums['sql'] += metrics.sql_time
+            sums['duplicates'] += metrics.duplicates
+            sums['n_plus_one'] += len(metrics.n_plus_one())
+            sums['serializer'] += metrics.timings['serializer']
+            sums['render'] += metrics.timings['render']
+            _observe(self.duration[route], DURATION_BUCKETS, duration)
+            _observe(self.query_counts[route], QUERY_BUCKETS, metrics.queries)
+
+    def render(self):
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(samples)
+
+        with self._lock:
+            metric('hunting_requests_total', 'counter', 'HTTP requests.', [
+                f'hunting_requests_total{_labels(route=route, method=method, status=status)} {count}'
+                for (route, method, status), count in sorted(self.requests.items())
+            ])
+            for key, name, help_text in (
+                ('queries', 'hunting_db_queries_total', 'SQL queries executed.'),
+                ('sql', 'hunting_db_query_seconds_total', 'Time spent in SQL queries.'),
+                ('duplicates', 'hunting_db_duplicate_queries_total',
+                 'Repeated SQL queries with the same parameters.'),
+                ('n_plus_one', 'hunting_db_n_plus_one_total',
+                 'Query signatures repeated at least INSTRUMENTATION_N_PLUS_ONE_THRESHOLD times.'),
+                ('serializer', 'hunting_serializer_seconds_total', 'Time spent in serializers.'),
+                ('render', 'hunting_render_seconds_total', 'Time spent rendering responses.'),
+            ):
+                metric(name, 'counter', help_text, [
+                    f'{name}{_labels(route=route)} {_number(sums[key])}'
+                    for route, sums in sorted(self.sums.items())
+                ])
+            metric('hunting_request_duration_seconds', 'histogram', 'Request duration.', [
+                sample
+                for route, buckets in sorted(self.duration.items())
+                for sample in _histogram('hunting_request_duration_seconds', route, DURATION_BUCKETS,
+                                         buckets, self.sums[route]['duration'])
+            ])
+            metric('hunting_db_queries_per_request', 'histogram', 'SQL queries per request.', [
+                sample
+                for route, buckets in sorted(self.query_counts.items())
+                for sample in _histogram('hunting_db_queries_per_request', route, QUERY_BUCKETS,
+                                         buckets, self.sums[route]['queries'])
+            ])
+        return '\n'.join(lines) + '\n'
+
+
+def _observe(buckets, bounds, value):
+    for index, bound in enumerate(bounds):
+        if value <= bound:
+            buckets[index] += 1
+            return
+    buckets[-1] += 1
+
+
+def _histogram(name, route, bounds, buckets, total):
+    samples = []
+    cumulative = 0
+    for bound, count in zip((*bounds, '+Inf'), buckets):
+        cumulative += count
+        samples.append(f'{name}_bucket{_labels(route=route, le=bound)} {cumulative}')
+    samples.append(f'{name}_sum{_labels(route=route)} {_number(total)}')
+    samples.append(f'{name}_count{_labels(route=route)} {cumulative}')
+    return samples
+
+
+def _labels(**labels):
+    escaped = (f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return '{' + ','.join(escaped) + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(round(value, 6)) if isinstance(value, float) else str(value)
+
+
+registry = MetricsRegistry()
+
+
+def route_of(request):
+    match = getattr(request, 'resolver_match', None)
+    return match.route if match is not None else 'unmatched'
+
+
+class InstrumentationMiddleware(Middleware):
+    def __call__(self, request):
+        if self._is_coroutine:
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            current.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current.reset(token)
+        return self.finish(request, response, metrics)
+
+    def finish(self, request, response, metrics):
+        duration = time.perf_counter() - metrics.started
+        route = route_of(request)
+        registry.observe(route, request.method, response.status_code, metrics, duration)
+
+        for sql, count in metrics.n_plus_one().items():
+            logger.warning('Possible N+1 on %s %s: %d x %s', request.method, route, count, sql)
+        if duration * 1000 >= settings.INSTRUMENTATION_SLOW_REQUEST_MS:
+            logger.warning('Slow request %s %s: %.0f ms, %d queries',
+                           request.method, request.path, duration * 1000, metrics.queries)
+
+        if settings.DEBUG:
+            self.add_headers(response, metrics, duration)
+        return response
+
+    def add_headers(self, response, metrics, duration):
+        timings = [
+            f'db;dur={metrics.sql_time * 1000:.2f};desc="{metrics.queries} queries"',
+            *(f'{name};dur={value * 1000:.2f}' for name, value in sorted(metrics.timings.items())),
+            f'total;dur={duration * 1000:.2f}',
+        ]
+        response['Server-Timing'] = ', '.join(timings)
+        response['X-DB-Queries'] = str(metrics.queries)
+        response['X-DB-Duplicate-Queries'] = str(metrics.duplicates)
@@ -0,0 +1,84 @@
+import json
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import renderers, parsers
+from rest_framework.exceptions import ParseError
+from rest_framework.utils.encoders import JSONEncoder
+
+from hunting.instrumentation import timer
+
+try:
+    import orjson
+except ImportError:  # необязательная зависимость, без нее работает json из stdlib
+    orjson = None
+
+# Кодирование JSON для всего API: orjson, если установлен, иначе json из stdlib.
+# Типы, которых нет в JSON (datetime, date, Decimal, UUID, ленивые строки...),
+# преобразуются как в DRF (rest_framework.utils.encoders.JSONEncoder),
+# поэтому ответ не зависит от выбранного бэкенда.
+# settings.JSON_BACKEND: 'orjson' | 'stdlib' | None (выбор автоматически)
+
+_encoder = JSONEncoder()
+
+
+def get_backend():
+    backend = getattr(settings, 'JSON_BACKEND', None)
+    if backend == 'orjson' and orjson is None:
+        raise ImportError("JSON_BACKEND = 'orjson' requires the orjson package")
+    if backend is None:
+        backend = 'orjson' if orjson is not None else 'stdlib'
+    return backend
+
+
+def dumps(data):
+    if get_backend() == 'orjson':
+        # datetime/date/time отдаем в default: формат DRF ('Z' вместо +00:00)
+        return orjson.dumps(
+            data,
+            default=_encoder.default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        data, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'), allow_nan=False
+    ).encode()
+
+
+def loads(data):
+    if get_backend() == 'orjson':
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode()
+    return json.loads(data)
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        with timer('render'):
+            # ?format=json; indent=4 - отступы умеет только стандартный рендерер
+            if self.get_indent(accepted_media_type, renderer_context or {}):
+                return super().render(data, accepted_media_type, renderer_context)
+            return dumps(data)
+
+
+class JSONParser(parsers.JSONParser):
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return loads(stream.read())
+        except ValueError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+
+class JsonResponse(HttpResponse):
+    # Замена django.http.JsonResponse с тем же кодированием, что у JSONRenderer
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                'In order to allow non-dict objects to be serialized set the safe parameter to False.'
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        with timer('render'):
+            content = dumps(data)
+        super().__init__(content=content, **kwargs)
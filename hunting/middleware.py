@@ -0,0 +1,25 @@
+import asyncio
+
+# Основа для своих middleware, которые работают и под WSGI, и под ASGI без переходов
+# между потоком и event loop: если следующий обработчик асинхронный, __call__ отдает
+# корутину __acall__ (так же, как django.utils.deprecation.MiddlewareMixin).
+# Подклассы реализуют оба метода
+
+
+class Middleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if asyncio.iscoroutinefunction(get_response):
+            # Обработчик Django проверяет asyncio.iscoroutinefunction(middleware)
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+        else:
+            self._is_coroutine = None
+
+    def __call__(self, request):
+        raise NotImplementedError
+
+    async def __acall__(self, request):
+        raise NotImplementedError
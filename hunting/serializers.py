@@ -0,0 +1,27 @@
+from rest_framework import serializers
+
+from hunting.instrumentation import timer
+
+# Время сериализации в метрики запроса (hunting/instrumentation.py): сериализаторы API
+# наследуют ModelSerializer отсюда. Считается .data - один раз на ответ, для many=True
+# весь список целиком (вложенные сериализаторы .data не вызывают)
+
+
+class TimedSerializerMixin:
+    @property
+    def data(self):
+        with timer('serializer'):
+            return super().data
+
+
+class TimedListSerializer(TimedSerializerMixin, serializers.ListSerializer):
+    pass
+
+
+class ModelSerializer(TimedSerializerMixin, serializers.ModelSerializer):
+    def __init_subclass__(cls, **kwargs):
+        # many=True создает Meta.list_serializer_class, по умолчанию - с замером времени
+        super().__init_subclass__(**kwargs)
+        meta = cls.__dict__.get('Meta')
+        if meta is not None and not hasattr(meta, 'list_serializer_class'):
+            meta.list_serializer_class = TimedListSerializer
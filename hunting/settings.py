@@ -27,7 +27,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = os.environ.get('SECRET_KEY')
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = os.environ.get('DEBUG', '1') == '1'
 
 ALLOWED_HOSTS = []
 
@@ -48,6 +48,7 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
 
     # === MY APPS ===
+    'hunting',  # общие части проекта: кэш, соединения с БД
     'authentication',
     'vacancies',
     'companies',
@@ -57,7 +58,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # SQL запросы, время сериализации и рендеринга, см. hunting/instrumentation.py
+    'hunting.instrumentation.InstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'hunting.db.routers.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -96,17 +100,88 @@ WSGI_APPLICATION = 'hunting.wsgi.application'
 #         'NAME': BASE_DIR / 'db.sqlite3',
 #     }
 # }
+# Пул соединений в процессе: DB_POOL=<размер> подменяет ENGINE на обертку из hunting/db/backends,
+# соединение возвращается в пул в конце каждого запроса (поэтому CONN_MAX_AGE = 0).
+# Без пула соединение живет CONN_MAX_AGE секунд и проверяется перед повторным использованием.
+# Под ASGI (hunting/asgi.py задает DJANGO_SERVER=asgi) постоянные соединения по умолчанию
+# выключены: каждый поток sync_to_async держал бы свое соединение до CONN_MAX_AGE.
+# Для переиспользования соединений под ASGI - DB_POOL
+POOLED_ENGINES = {
+    'django.db.backends.postgresql': 'hunting.db.backends.postgresql',
+    'django.db.backends.sqlite3': 'hunting.db.backends.sqlite3',
+}
+DB_ENGINE = os.environ.get('DB_ENGINE', 'django.db.backends.postgresql')
+DB_POOL = int(os.environ.get('DB_POOL', 0))
+ASGI = os.environ.get('DJANGO_SERVER') == 'asgi'
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
-        'NAME': 'vacancies',
-        'USER': 'postgres',
-        'PASSWORD': 'wialon',
-        'HOST': 'localhost',
-        'PORT': '5432',
+        'ENGINE': POOLED_ENGINES[DB_ENGINE] if DB_POOL else DB_ENGINE,
+        'NAME': os.environ.get('DB_NAME', 'vacancies'),
+        'USER': os.environ.get('DB_USER', 'postgres'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', 'wialon'),
+        'HOST': os.environ.get('DB_HOST', 'localhost'),
+        'PORT': os.environ.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': 0 if DB_POOL else int(os.environ.get('CONN_MAX_AGE', 0 if ASGI else 60)),
+        'CONN_HEALTH_CHECKS': os.environ.get('CONN_HEALTH_CHECKS', '1') == '1',
+        'POOL': {
+            'MAX_SIZE': DB_POOL,
+            'TIMEOUT': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        },
     }
 }
 
+# Реплики для чтения: DB_REPLICA_HOSTS=host1,host2 (остальные параметры как у default).
+# Безопасный запрос (GET) читает с одной случайной реплики, см. hunting/db/routers.py
+DATABASE_REPLICAS = []
+for number, host in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    DATABASES[f'replica{number}'] = {
+        **DATABASES['default'],
+        'HOST': host.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica{number}')
+
+DATABASE_ROUTERS = ['hunting.db.routers.ReplicaRouter']
+# Сколько секунд после записи клиент читает с default (задержка репликации)
+REPLICA_STICKY_SECONDS = 5
+# Метку записи клиента без cookie (по заголовку Authorization) должны видеть все процессы,
+# она хранится в кэше default. С LocMemCache такие клиенты всегда читают с default,
+# если не задан REPLICA_STICKY_ALLOW_LOCAL=1 (один процесс: runserver, тесты)
+REPLICA_STICKY_ALLOW_LOCAL = os.environ.get('REPLICA_STICKY_ALLOW_LOCAL') == '1'
+
+
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# По умолчанию кэш в памяти процесса (подходит для тестов и разработки).
+# Для продакшена: CACHE_BACKEND=django.core.cache.backends.redis.RedisCache
+# и CACHE_LOCATION=redis://127.0.0.1:6379 (нужен пакет redis),
+# либо файловый django.core.cache.backends.filebased.FileBasedCache
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+        'OPTIONS': {'MAX_ENTRIES': 10000}
+        if 'CACHE_BACKEND' not in os.environ else {},
+    },
+}
+# Кэш токенов CachedTokenAuthentication: сброс при выходе и изменении пользователя должен
+# быть виден всем процессам, поэтому нужен общий бэкенд (Redis, Memcached, файлы).
+# С LocMemCache (у каждого процесса свой) кэш токенов отключен, если не задан
+# TOKEN_CACHE_ALLOW_LOCAL=1 (один процесс: runserver, тесты)
+CACHES['tokens'] = {
+    'BACKEND': os.environ.get('TOKEN_CACHE_BACKEND', CACHES['default']['BACKEND']),
+    'LOCATION': os.environ.get('TOKEN_CACHE_LOCATION', CACHES['default']['LOCATION'] or 'tokens'),
+    'KEY_PREFIX': 'tokens',
+}
+TOKEN_CACHE_ALLOW_LOCAL = os.environ.get('TOKEN_CACHE_ALLOW_LOCAL') == '1'
+
+# Время жизни закэшированных ответов списка и карточки вакансии, секунды
+VACANCY_CACHE_TIMEOUT = 60
+
+# Время жизни записи токен -> пользователь для CachedTokenAuthentication, секунды
+TOKEN_CACHE_TIMEOUT = 300
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
@@ -161,14 +236,22 @@ TOTAL_ON_PAGE = 10
 # которые могут быть использованы при возврате объекта Response.
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        # TokenAuthentication с кэшем токен -> пользователь
+        'authentication.authentication.CachedTokenAuthentication',
+        # JWT без запроса пользователя, id и role из токена
+        'authentication.authentication.StatelessJWTAuthentication',
         # 'rest_framework.authentication.BasicAuthentication',
         # 'rest_framework.authentication.SessionAuthentication',
     ],
+    # JSON через orjson (если установлен), см. hunting/json.py.
+    # Браузерная версия API только для разработки
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
+        'hunting.json.JSONRenderer',
+    ] + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+    'DEFAULT_PARSER_CLASSES': [
+        'hunting.json.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 10,
@@ -184,26 +267,57 @@ SPECTACULAR_SETTINGS = {
     # OTHER SETTINGS
 }
 
+# В токенах /user/token/ кроме user_id есть role, см. authentication/serializers.py
+SIMPLE_JWT = {
+    'TOKEN_OBTAIN_SERIALIZER': 'authentication.serializers.RoleTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'authentication.serializers.RoleTokenRefreshSerializer',
+}
+
 AUTH_USER_MODEL = 'authentication.User'
 
-# LOGGING = {
-#     'disable_existing_loggers': False,
-#     'version': 1,
-#     'handlers': {
-#         'console': {
-#             'class': 'logging.StreamHandler',
-#             'level': 'DEBUG'
-#         }
-#
-#     },
-#     'loggers': {
-#         '': {
-#             'handlers': ['console'],
-#             'level': 'DEBUG',
-#             'propagate':False
-#         },
-#         'django.db':{
-#             'level':'DEBUG',
-#         },
-#     }
-# }
+# Кодирование JSON: None - orjson, если установлен, иначе json из stdlib; либо 'orjson' / 'stdlib'
+JSON_BACKEND = os.environ.get('JSON_BACKEND') or None
+
+# Поиск вакансий по ?text=: None - выбор по СУБД (PostgreSQL - полнотекстовый,
+# остальные - поиск подстроки), либо путь до своего класса бэкенда
+VACANCY_SEARCH_BACKEND = None
+
+# Хранение лайков: 'direct' - UPDATE likes = likes + 1 в строке вакансии,
+# 'buffered' - вставка в буфер и периодический перенос в Vacancy.likes,
+# 'sharded' - счетчик в случайном из VACANCY_LIKES_SHARDS шардов (см. vacancies/likes.py)
+VACANCY_LIKES_MODE = os.environ.get('VACANCY_LIKES_MODE', 'direct')
+VACANCY_LIKES_SHARDS = 16
+# Не чаще раза в столько секунд буфер переносится прямо из запроса лайка,
+# в остальное время - командой manage.py flush_likes
+VACANCY_LIKES_FLUSH_INTERVAL = 5
+
+# Инструментирование запросов (hunting/instrumentation.py): запрос с одним и тем же
+# SQL столько раз и больше считается N+1, запросы дольше порога пишутся в лог
+INSTRUMENTATION_N_PLUS_ONE_THRESHOLD = 5
+INSTRUMENTATION_SLOW_REQUEST_MS = 500
+# Токен для /metrics/ (Authorization: Bearer ...), без него эндпоинт только для администраторов
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'simple': {'format': '%(asctime)s %(levelname)s %(name)s: %(message)s'},
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'simple',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': os.environ.get('LOG_LEVEL', 'INFO'),
+    },
+    'loggers': {
+        # SQL каждого запроса: LOG_SQL=1 (только при DEBUG)
+        'django.db.backends': {
+            'level': 'DEBUG' if os.environ.get('LOG_SQL') == '1' else 'INFO',
+        },
+    },
+}
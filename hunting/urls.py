@@ -22,6 +22,7 @@ from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView, Sp
 # from vacancies.views import VacancyViewSet
 from rest_framework import routers
 
+from hunting.views import cache_stats, db_stats, metrics
 from vacancies.views import SkillsViewSet
 
 router = routers.SimpleRouter()
@@ -39,6 +40,9 @@ urlpatterns = [
     path('vacancy/', include('vacancies.urls')),
     path('company/', include('companies.urls')),
     path('user/', include('authentication.urls')),
+    path('cache/stats/', cache_stats),
+    path('db/stats/', db_stats),
+    path('metrics/', metrics),
 
     # === API Document ===
     # YOUR PATTERNS
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from hunting.cache import CacheStats
+from hunting.db.stats import connection_stats
+from hunting.instrumentation import registry
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    return Response(CacheStats.all())
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def db_stats(request):
+    return Response(connection_stats())
+
+
+def metrics(request):
+    # Для Prometheus: заголовок Authorization: Bearer <METRICS_TOKEN>.
+    # Без METRICS_TOKEN эндпоинт доступен только администраторам (сессия Django)
+    if settings.METRICS_TOKEN:
+        if request.META.get('HTTP_AUTHORIZATION') != f'Bearer {settings.METRICS_TOKEN}':
+            return HttpResponse(status=401)
+    elif not request.user.is_staff:
+        return HttpResponse(status=401 if request.user.is_anonymous else 403)
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,51 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from vacancies.models import Vacancy
+
+
+@pytest.fixture
+def hr_jwt(client, django_user_model):
+    django_user_model.objects.create_user(username="hr", password="wialon", role="hr")
+    response = client.post("/user/token/", {"username": "hr", "password": "wialon"})
+    return response.data
+
+
+def create_vacancy(client, access, slug):
+    return client.post(
+        "/vacancy/create/",
+        {"slug": slug, "text": "123", "status": "draft"},
+        content_type="application/json",
+        HTTP_AUTHORIZATION="Bearer " + access,
+    )
+
+
+@pytest.mark.django_db
+def test_role_claim(hr_jwt, django_user_model):
+    token = AccessToken(hr_jwt["access"])
+
+    assert token["role"] == "hr"
+    assert token["user_id"] == django_user_model.objects.get(username="hr").pk
+
+
+@pytest.mark.django_db
+def test_permission_without_user_query(client, hr_jwt):
+    with CaptureQueriesContext(connection) as context:
+        response = create_vacancy(client, hr_jwt["access"], "first")
+
+    assert response.status_code == 201
+    assert [query for query in context.captured_queries if 'authentication_user' in query['sql']] == []
+    assert Vacancy.objects.filter(slug="first").exists()
+
+
+@pytest.mark.django_db
+def test_refresh_updates_role(client, hr_jwt, django_user_model):
+    django_user_model.objects.filter(username="hr").update(role="employee")
+
+    assert create_vacancy(client, hr_jwt["access"], "first").status_code == 201
+
+    response = client.post("/user/token/refresh/", {"refresh": hr_jwt["refresh"]})
+    assert AccessToken(response.data["access"])["role"] == "employee"
+    assert create_vacancy(client, response.data["access"], "second").status_code == 403
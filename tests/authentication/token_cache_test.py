@@ -0,0 +1,67 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from authentication.authentication import stats
+
+
+def create_vacancy(client, token, slug):
+    return client.post(
+        "/vacancy/create/",
+        {"slug": slug, "text": "123", "status": "draft"},
+        content_type="application/json",
+        HTTP_AUTHORIZATION="Token " + token,
+    )
+
+
+def auth_queries(context):
+    return [query for query in context.captured_queries if 'authtoken_token' in query['sql']]
+
+
+@pytest.mark.django_db
+def test_token_cached(client, hr_token):
+    hits = stats.hits
+
+    assert create_vacancy(client, hr_token, "first").status_code == 201
+    with CaptureQueriesContext(connection) as context:
+        assert create_vacancy(client, hr_token, "second").status_code == 201
+
+    assert auth_queries(context) == []
+    assert stats.hits == hits + 1
+
+
+@pytest.mark.django_db
+def test_logout_invalidates_token(client, hr_token):
+    assert create_vacancy(client, hr_token, "first").status_code == 201
+
+    response = client.post("/user/logout/", HTTP_AUTHORIZATION="Token " + hr_token)
+
+    assert response.status_code == 200
+    assert create_vacancy(client, hr_token, "second").status_code == 401
+
+
+@pytest.mark.django_db
+def test_user_change_invalidates_token(client, hr_token, django_user_model):
+    assert create_vacancy(client, hr_token, "first").status_code == 201
+
+    user = django_user_model.objects.get(username="hr")
+    user.role = "employee"
+    user.save()
+    assert create_vacancy(client, hr_token, "second").status_code == 403
+
+    user.is_active = False
+    user.save()
+    assert create_vacancy(client, hr_token, "third").status_code == 401
+
+
+@pytest.mark.django_db
+def test_local_token_cache_disabled(client, hr_token, settings):
+    settings.TOKEN_CACHE_ALLOW_LOCAL = False
+    misses = stats.misses
+
+    assert create_vacancy(client, hr_token, "first").status_code == 201
+    with CaptureQueriesContext(connection) as context:
+        assert create_vacancy(client, hr_token, "second").status_code == 201
+
+    assert auth_queries(context) != []
+    assert stats.misses == misses
@@ -3,7 +3,7 @@ from pytest_factoryboy import register
 from tests.factories import VacancyFactory, UserFactory
 
 
-pytest_plugins = "tests.fixtures"
+pytest_plugins = ["tests.fixtures", "tests.query_budget"]
 
 register(VacancyFactory)
 register(UserFactory)
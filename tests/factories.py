@@ -2,6 +2,7 @@ import factory.django
 
 from authentication.models import User
 from vacancies.models import Vacancy
+from vacancies.perf_data import seed_perf_data
 
 
 class UserFactory(factory.django.DjangoModelFactory):
@@ -16,6 +17,17 @@ class VacancyFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Vacancy
 
-    slug = "test"
+    slug = factory.Sequence(lambda n: f"test{n}")
     text = "test text"
     user = factory.SubFactory(UserFactory)
+
+    @factory.post_generation
+    def skills(self, create, extracted, **kwargs):
+        if create and extracted:
+            self.skills.add(*extracted)
+
+    @classmethod
+    def create_bulk(cls, size, **kwargs):
+        # Для больших наборов: вакансии с пользователями и навыками вставляются
+        # пачками bulk_create, см. vacancies/perf_data.py
+        return seed_perf_data(size, **kwargs)
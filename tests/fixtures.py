@@ -18,3 +18,22 @@ def hr_token(client, django_user_model):
     )
 
     return response.data["token"]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Кэш в памяти процесса общий для всех тестов
+    from django.core.cache import caches
+
+    for cache in caches.all():
+        cache.clear()
+    yield
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def local_shared_caches(settings):
+    # Тесты идут в одном процессе, локальный кэш токенов и меток реплик здесь безопасен
+    settings.TOKEN_CACHE_ALLOW_LOCAL = True
+    settings.REPLICA_STICKY_ALLOW_LOCAL = True
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+from django.db import connections
+from rest_framework.authtoken.models import Token
+
+from hunting.db.backends.sqlite3.base import DatabaseWrapper
+from hunting.db.pool import pools, PoolExhausted
+
+
+@pytest.fixture
+def make_wrapper(tmp_path, django_db_blocker):
+    # Файловая SQLite вместо PostgreSQL: у :memory: у каждого соединения своя база
+    settings_dict = connections.configure_settings({
+        "default": {"ENGINE": "django.db.backends.dummy"},
+        "pool_test": {
+            "ENGINE": "hunting.db.backends.sqlite3",
+            "NAME": str(tmp_path / "pool.sqlite3"),
+            "POOL": {"MAX_SIZE": 2, "TIMEOUT": 0.2},
+        }
+    })["pool_test"]
+
+    wrappers = []
+
+    def make():
+        wrapper = DatabaseWrapper(settings_dict, alias="pool_test")
+        wrappers.append(wrapper)
+        return wrapper
+
+    with django_db_blocker.unblock():
+        yield make
+        for wrapper in wrappers:
+            if wrapper.connection is not None:
+                wrapper.close()
+        pools.pop("pool_test").close_all()
+
+
+def test_pool_reuses_connections(make_wrapper):
+    wrapper = make_wrapper()
+    wrapper.ensure_connection()
+    raw = wrapper.connection
+    wrapper.close()
+
+    # следующий "запрос" из другого потока получает то же соединение
+    def other_request():
+        other = make_wrapper()
+        other.ensure_connection()
+        assert other.connection is raw
+        with other.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        other.close()
+
+    thread = threading.Thread(target=other_request)
+    thread.start()
+    thread.join()
+
+    stats = pools["pool_test"].stats()
+    assert (stats["created"], stats["reused"], stats["idle"], stats["in_use"]) == (1, 1, 1, 0)
+
+
+def test_pool_limits_size(make_wrapper):
+    first, second, third = make_wrapper(), make_wrapper(), make_wrapper()
+    first.ensure_connection()
+    second.ensure_connection()
+
+    with pytest.raises(PoolExhausted):
+        third.ensure_connection()
+
+    first.close()
+    third.ensure_connection()
+    assert pools["pool_test"].stats()["waits"] >= 1
+
+
+def test_pool_discards_broken_connections(make_wrapper):
+    wrapper = make_wrapper()
+    wrapper.ensure_connection()
+    raw = wrapper.connection
+    raw.close()
+    wrapper.close()
+
+    wrapper.ensure_connection()
+    assert wrapper.connection is not raw
+    assert pools["pool_test"].stats()["discarded"] == 1
+
+
+@pytest.mark.django_db
+def test_db_stats(client, admin_user):
+    token = Token.objects.create(user=admin_user)
+    response = client.get("/db/stats/", HTTP_AUTHORIZATION="Token " + token.key)
+
+    assert response.status_code == 200
+    assert response.data["requests"] >= 1
+    assert "default" in response.data["databases"]
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from django.core.management import call_command
+from django.db import connections
+from django.http import HttpResponse
+from django.test import Client
+
+from hunting.db import routers
+from hunting.db.routers import ReplicaRouter, ReplicaRoutingMiddleware
+from tests.factories import VacancyFactory
+from vacancies.models import Vacancy
+
+
+@pytest.fixture
+def replica(settings, tmp_path, django_db_blocker):
+    # Вторая SQLite база вместо реплики: схема та же, данных нет,
+    # поэтому по ответу видно, из какой базы он прочитан
+    alias = "replica_test"
+    connections.settings[alias] = connections.configure_settings({
+        "default": connections.settings["default"],
+        alias: {"ENGINE": "django.db.backends.sqlite3", "NAME": str(tmp_path / "replica.sqlite3")},
+    })[alias]
+    with django_db_blocker.unblock():
+        call_command("migrate", database=alias, verbosity=0)
+
+    settings.DATABASE_REPLICAS = [alias]
+    yield alias
+
+    with django_db_blocker.unblock():
+        connections[alias].close()
+    del connections[alias]
+    del connections.settings[alias]
+
+
+def vacancy_count(client, **headers):
+    return client.get("/vacancy/", **headers).data["count"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reads_go_to_replica(client, replica):
+    VacancyFactory.create()
+
+    assert vacancy_count(client) == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_your_writes(client, hr_token, replica):
+    auth = {"HTTP_AUTHORIZATION": "Token " + hr_token}
+
+    response = client.post(
+        "/vacancy/create/", {"slug": "new", "text": "new", "status": "draft"}, content_type="application/json", **auth
+    )
+    assert response.status_code == 201
+
+    # другие клиенты читают с реплики, ответ попадает в общий кэш
+    assert vacancy_count(Client()) == 0
+    assert vacancy_count(Client()) == 0
+
+    # тот же клиент (по заголовку Authorization - метка в кэше, и по cookie)
+    # читает с default мимо закэшированного ответа реплики
+    cache_key_only = Client()
+    assert vacancy_count(cache_key_only, **auth) == 1
+    assert vacancy_count(client) == 1
+
+
+def test_routing_middleware_async(rf, settings):
+    settings.DATABASE_REPLICAS = ["replica1"]
+
+    async def get_response(request):
+        return HttpResponse(str(routers.replica.get()))
+
+    middleware = ReplicaRoutingMiddleware(get_response)
+
+    assert asyncio.iscoroutinefunction(middleware)
+    response = asyncio.run(middleware(rf.get("/vacancy/")))
+    assert response.content == b"replica1"
+    assert routers.replica.get() is None
+
+
+def test_one_replica_per_request(rf, settings):
+    settings.DATABASE_REPLICAS = [f"replica{number}" for number in range(10)]
+    router = ReplicaRouter()
+
+    def get_response(request):
+        aliases = {router.db_for_read(Vacancy) for _ in range(20)}
+        return HttpResponse(",".join(aliases))
+
+    response = ReplicaRoutingMiddleware(get_response)(rf.get("/vacancy/"))
+    assert response.content.decode() in settings.DATABASE_REPLICAS
+
+
+def test_sticky_without_shared_cache(rf, settings):
+    # Метку записи в кэше процесса другие процессы не увидят: клиенты с Authorization
+    # читают с default, клиенты без него - с реплики, пока нет cookie
+    settings.DATABASE_REPLICAS = ["replica1"]
+    settings.REPLICA_STICKY_ALLOW_LOCAL = False
+    middleware = ReplicaRoutingMiddleware(lambda request: HttpResponse(str(routers.replica.get())))
+
+    assert middleware(rf.get("/vacancy/", HTTP_AUTHORIZATION="Token key")).content == b"None"
+    assert middleware(rf.get("/vacancy/")).content == b"replica1"
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+
+import pytest
+
+from authentication.models import User
+from hunting.instrumentation import RequestMetrics, current, recorder, registry
+from tests.factories import VacancyFactory
+
+
+@pytest.fixture
+def metrics_registry():
+    registry.reset()
+    yield registry
+    registry.reset()
+
+
+@pytest.mark.django_db
+def test_debug_headers(client, settings):
+    settings.DEBUG = True
+    VacancyFactory.create_batch(3)
+
+    response = client.get("/vacancy/")
+
+    assert response.status_code == 200
+    assert int(response["X-DB-Queries"]) > 0
+    assert response["X-DB-Duplicate-Queries"] == "0"
+    assert "db;dur=" in response["Server-Timing"]
+    assert "serializer;dur=" in response["Server-Timing"]
+    assert "render;dur=" in response["Server-Timing"]
+
+
+@pytest.mark.django_db
+def test_no_headers_without_debug(client, settings):
+    settings.DEBUG = False
+
+    response = client.get("/vacancy/")
+
+    assert "Server-Timing" not in response
+    assert "X-DB-Queries" not in response
+
+
+@pytest.mark.django_db
+def test_duplicates_and_n_plus_one(settings):
+    from django.db import connection
+
+    settings.INSTRUMENTATION_N_PLUS_ONE_THRESHOLD = 3
+    users = [User.objects.create(username=f"user{i}") for i in range(4)]
+    assert recorder in connection.execute_wrappers
+    metrics = RequestMetrics()
+    token = current.set(metrics)
+    try:
+        for user in users:
+            User.objects.filter(pk=user.pk).first()
+        User.objects.filter(pk=users[0].pk).first()
+    finally:
+        current.reset(token)
+
+    assert metrics.queries == 5
+    assert metrics.duplicates == 1
+    assert list(metrics.n_plus_one().values()) == [5]
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint(client, admin_user, settings, metrics_registry):
+    settings.METRICS_TOKEN = None
+    client.get("/vacancy/")
+    client.get("/vacancy/")
+
+    client.force_login(admin_user)
+    response = client.get("/metrics/")
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    text = response.content.decode()
+    assert 'hunting_requests_total{route="vacancy/",method="GET",status="200"} 2' in text
+    assert 'hunting_request_duration_seconds_count{route="vacancy/"} 2' in text
+    assert '# TYPE hunting_db_queries_total counter' in text
+
+
+@pytest.mark.django_db
+def test_metrics_token(client, settings, metrics_registry):
+    settings.METRICS_TOKEN = "secret"
+
+    assert client.get("/metrics/").status_code == 401
+    assert client.get("/metrics/", HTTP_AUTHORIZATION="Bearer secret").status_code == 200
+
+
+@pytest.mark.django_db
+def test_metrics_closed_without_token(client, settings, metrics_registry):
+    settings.METRICS_TOKEN = None
+
+    assert client.get("/metrics/").status_code == 401
+    client.force_login(User.objects.create(username="user"))
+    assert client.get("/metrics/").status_code == 403
+
+
+@pytest.mark.django_db
+def test_serializer_timing_without_patching(client, hr_token, settings):
+    from rest_framework.response import Response
+    from rest_framework.serializers import BaseSerializer
+
+    settings.DEBUG = True
+    vacancy = VacancyFactory.create()
+
+    response = client.get(f"/vacancy/{vacancy.pk}/", HTTP_AUTHORIZATION="Token " + hr_token)
+
+    assert "serializer;dur=" in response["Server-Timing"]
+    assert "render;dur=" in response["Server-Timing"]
+    assert not hasattr(BaseSerializer, "_instrumented")
+    assert not hasattr(Response, "_instrumented")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_requests_without_adapters(settings, caplog):
+    from django.test import AsyncClient
+
+    settings.DEBUG = True
+    VacancyFactory.create_batch(3)
+
+    with caplog.at_level(logging.DEBUG, logger="django.request"):
+        response = asyncio.run(AsyncClient().get("/vacancy/async/"))
+
+    assert response.status_code == 200
+    assert int(response["X-DB-Queries"]) > 0
+    adapted = [record.getMessage() for record in caplog.records if "adapted for middleware hunting" in record.getMessage()]
+    assert adapted == []
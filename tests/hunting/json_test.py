@@ -0,0 +1,62 @@
+import datetime
+import decimal
+import io
+import json
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer as DRFRenderer
+
+from hunting.json import JSONRenderer, JSONParser, JsonResponse, dumps
+
+DATA = {
+    'created': datetime.date(2023, 3, 1),
+    'modified': datetime.datetime(2023, 3, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+    'time': datetime.time(9, 5),
+    'salary': decimal.Decimal('1500.50'),
+    'text': 'Разработчик',
+    'skills': ['python', 'django'],
+    'user': None,
+}
+
+
+@pytest.mark.parametrize('backend', ['orjson', 'stdlib'])
+def test_dumps_matches_drf(settings, backend):
+    settings.JSON_BACKEND = backend
+
+    assert json.loads(dumps(DATA)) == json.loads(DRFRenderer().render(DATA))
+    assert json.loads(dumps(DATA)) == {
+        'created': '2023-03-01',
+        'modified': '2023-03-01T12:30:15.123456Z',
+        'time': '09:05:00',
+        'salary': 1500.5,
+        'text': 'Разработчик',
+        'skills': ['python', 'django'],
+        'user': None,
+    }
+
+
+def test_renderer_indent_falls_back_to_drf():
+    rendered = JSONRenderer().render(DATA, 'application/json; indent=2')
+
+    assert rendered == DRFRenderer().render(DATA, 'application/json; indent=2')
+    assert JSONRenderer().render(None) == b''
+
+
+@pytest.mark.parametrize('backend', ['orjson', 'stdlib'])
+def test_parser(settings, backend):
+    settings.JSON_BACKEND = backend
+
+    assert JSONParser().parse(io.BytesIO('{"text": "Разработчик"}'.encode())) == {'text': 'Разработчик'}
+    with pytest.raises(ParseError):
+        JSONParser().parse(io.BytesIO(b'{"text": '))
+
+
+def test_json_response():
+    response = JsonResponse([DATA['salary']], safe=False, status=201)
+
+    assert response.status_code == 201
+    assert response['Content-Type'] == 'application/json'
+    assert json.loads(response.content) == [1500.5]
+    with pytest.raises(TypeError):
+        JsonResponse([1])
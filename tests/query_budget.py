@@ -0,0 +1,110 @@
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+import pytest
+from django.db import connections
+
+from hunting.instrumentation import query_signature
+
+# Бюджет запросов для эндпоинтов: не больше max_queries SQL запросов и max_rows строк,
+# прочитанных из БД, на один запрос к API.
+#
+#     def test_list(client, query_budget, dataset_size):
+#         VacancyFactory.create_batch(dataset_size)
+#         with query_budget(3, max_rows=20):
+#             client.get("/vacancy/")
+#
+# Тесты с фикстурой dataset_size прогоняются для каждого размера из QUERY_BUDGET_SIZES,
+# так что бюджет, не зависящий от размера данных, ловит рост числа запросов O(n)
+
+QUERY_BUDGET_SIZES = (1, 10, 50)
+
+
+def interpolate(sql, params, many):
+    # Только для сообщения об ошибке, не для выполнения
+    if not params or many:
+        return sql
+    try:
+        return sql % tuple(repr(param) for param in params)
+    except (TypeError, ValueError):
+        return f'{sql} -- {params!r}'
+
+
+class QueryLog:
+    def __init__(self):
+        self.queries = []
+        self.rows = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, params, many))
+        result = execute(sql, params, many, context)
+        self.count_rows(context['cursor'])
+        return result
+
+    def count_rows(self, cursor):
+        # Строки считаются на выборке из курсора: fetchone/fetchmany/fetchall
+        if getattr(cursor, '_query_budget', False):
+            return
+        cursor._query_budget = True
+        for name in ('fetchone', 'fetchmany', 'fetchall'):
+            setattr(cursor, name, self.counting(getattr(cursor, name), name == 'fetchone'))
+
+    def counting(self, fetch, single):
+        def wrapper(*args, **kwargs):
+            result = fetch(*args, **kwargs)
+            if single:
+                self.rows += result is not None
+            else:
+                self.rows += len(result)
+            return result
+        return wrapper
+
+
+def format_queries(queries, max_queries):
+    # Запросы сверх бюджета помечены "+", повторяющиеся с разными параметрами - "xN"
+    signatures = Counter(query_signature(sql) for sql, _, _ in queries)
+    lines = []
+    for number, (sql, params, many) in enumerate(queries, 1):
+        marker = '+' if number > max_queries else ' '
+        repeated = signatures[query_signature(sql)]
+        suffix = f'  [x{repeated}]' if repeated > 1 else ''
+        lines.append(f'{marker} {number:>3}. {interpolate(sql, params, many)}{suffix}')
+    return '\n'.join(lines)
+
+
+@contextmanager
+def capture_queries():
+    log = QueryLog()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(log))
+        yield log
+
+
+@pytest.fixture
+def query_budget():
+    @contextmanager
+    def check(max_queries, max_rows=None):
+        with capture_queries() as log:
+            yield log
+
+        errors = []
+        if len(log.queries) > max_queries:
+            errors.append(f'{len(log.queries)} queries, budget {max_queries}')
+        if max_rows is not None and log.rows > max_rows:
+            errors.append(f'{log.rows} rows fetched, budget {max_rows}')
+        if errors:
+            pytest.fail(
+                'Query budget exceeded: ' + '; '.join(errors) + '\n'
+                + format_queries(log.queries, max_queries),
+                pytrace=False,
+            )
+
+    return check
+
+
+def pytest_generate_tests(metafunc):
+    if 'dataset_size' in metafunc.fixturenames and not any(
+        'dataset_size' in marker.args[0] for marker in metafunc.definition.iter_markers('parametrize')
+    ):
+        metafunc.parametrize('dataset_size', QUERY_BUDGET_SIZES)
@@ -0,0 +1,26 @@
+import pytest
+
+from tests.factories import VacancyFactory, UserFactory
+
+
+@pytest.mark.django_db
+def test_user_vacancies(client, hr_token, django_assert_num_queries):
+    author = UserFactory()
+    VacancyFactory.create_batch(3, user=author)
+
+    # токен + агрегат (total, avg) + страница пользователей
+    with django_assert_num_queries(3):
+        response = client.get(
+            "/vacancy/by_user/",
+            HTTP_AUTHORIZATION="Token " + hr_token
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert data["num_page"] == 1
+    assert data["avg"] == 1.5
+    assert {item["name"]: item["vacancies"] for item in data["items"]} == {
+        "hr": 0,
+        author.username: 3,
+    }
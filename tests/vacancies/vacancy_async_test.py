@@ -0,0 +1,67 @@
+import pytest
+
+from tests.factories import VacancyFactory, UserFactory
+from vacancies.models import Skill
+
+
+@pytest.mark.django_db
+def test_async_vacancy_list(client):
+    python = Skill.objects.create(name="python")
+    VacancyFactory.create_batch(12, user=UserFactory(), skills=[python])
+    VacancyFactory.create_batch(3)
+
+    for query in ("", "?page=2", "?skill=python"):
+        expected = client.get("/vacancy/" + query).json()
+        response = client.get("/vacancy/async/" + query)
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["count"] == expected["count"]
+        assert (data["next"] is None) == (expected["next"] is None)
+        assert (data["previous"] is None) == (expected["previous"] is None)
+        assert len(data["results"]) == len(expected["results"])
+
+    # страницы совпадают с синхронным списком строка в строку (порядок -created, -id)
+    for page in (1, 2):
+        expected = client.get(f"/vacancy/?page={page}").json()["results"]
+        assert client.get(f"/vacancy/async/?page={page}").json()["results"] == expected
+
+    assert client.get("/vacancy/async/?skill=python&skill_match=bad").status_code == 400
+
+
+@pytest.mark.django_db
+def test_async_vacancy_list_status_filter(client):
+    VacancyFactory.create_batch(2, status="open")
+    VacancyFactory.create_batch(3, status="closed")
+
+    response = client.get("/vacancy/async/?status=open")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert {item["status"] for item in data["results"]} == {"open"}
+    assert client.get("/vacancy/async/?status=bad").status_code == 400
+
+
+@pytest.mark.django_db
+def test_async_vacancy_detail(client, hr_token):
+    vacancy = VacancyFactory.create(skills=[Skill.objects.create(name="python")])
+    auth = {"HTTP_AUTHORIZATION": "Token " + hr_token}
+
+    response = client.get(f"/vacancy/async/{vacancy.pk}/", **auth)
+    assert response.status_code == 200
+    assert response.json() == client.get(f"/vacancy/{vacancy.pk}/", **auth).json()
+
+    assert client.get(f"/vacancy/async/{vacancy.pk + 1}/", **auth).status_code == 404
+    assert client.get(f"/vacancy/async/{vacancy.pk}/").status_code == 401
+    assert client.get(f"/vacancy/async/{vacancy.pk}/", HTTP_AUTHORIZATION="Token bad").status_code == 401
+
+
+@pytest.mark.django_db
+def test_async_user_vacancies(client, hr_token):
+    VacancyFactory.create_batch(3, user=UserFactory())
+    auth = {"HTTP_AUTHORIZATION": "Token " + hr_token}
+
+    response = client.get("/vacancy/async/by_user/", **auth)
+    assert response.status_code == 200
+    assert response.json() == client.get("/vacancy/by_user/", **auth).json()
@@ -0,0 +1,74 @@
+import pytest
+from django.utils import timezone
+
+from authentication.models import User
+from tests.factories import VacancyFactory
+from vacancies.models import Vacancy, Skill
+
+
+@pytest.mark.django_db
+def test_vacancy_list_cache(client, django_assert_num_queries):
+    vacancy = VacancyFactory.create()
+
+    assert client.get("/vacancy/?skill=python&page=1")["X-Cache"] == "MISS"
+    with django_assert_num_queries(0):
+        response = client.get("/vacancy/?page=1&skill=python")
+    assert response["X-Cache"] == "HIT"
+
+    vacancy.text = "changed"
+    vacancy.save()
+    response = client.get("/vacancy/")
+    assert response["X-Cache"] == "MISS"
+    assert response.data["results"][0]["text"] == "changed"
+
+
+@pytest.mark.django_db
+def test_vacancy_detail_cache_invalidation(client, hr_token):
+    vacancy = VacancyFactory.create()
+    url = f"/vacancy/{vacancy.pk}/"
+    auth = {"HTTP_AUTHORIZATION": "Token " + hr_token}
+
+    assert client.get(url, **auth)["X-Cache"] == "MISS"
+    assert client.get(url, **auth)["X-Cache"] == "HIT"
+
+    client.put("/vacancy/like/", [vacancy.pk], content_type="application/json", **auth)
+    response = client.get(url, **auth)
+    assert response["X-Cache"] == "MISS"
+    assert response.data["likes"] == 1
+
+    vacancy.skills.add(Skill.objects.create(name="python"))
+    response = client.get(url, **auth)
+    assert response.data["skills"] == ["python"]
+
+    Vacancy.objects.get(pk=vacancy.pk).delete()
+    assert client.get(url, **auth).status_code == 404
+
+
+@pytest.mark.django_db
+def test_vacancy_list_cache_username_change(client):
+    vacancy = VacancyFactory.create()
+    user = User.objects.get(pk=vacancy.user_id)
+
+    client.get("/vacancy/")
+    user.last_login = timezone.now()
+    user.save(update_fields=["last_login"])
+    user.first_name = "changed"
+    user.save()
+    assert client.get("/vacancy/")["X-Cache"] == "HIT"
+
+    user.username = "renamed"
+    user.save()
+    response = client.get("/vacancy/")
+    assert response["X-Cache"] == "MISS"
+    assert response.data["results"][0]["username"] == "renamed"
+
+
+@pytest.mark.django_db
+def test_vacancy_list_cache_scheme(client):
+    VacancyFactory.create_batch(11)
+
+    assert client.get("/vacancy/")["X-Cache"] == "MISS"
+    response = client.get("/vacancy/", secure=True)
+    assert response["X-Cache"] == "MISS"
+    assert response.data["next"].startswith("https://")
+    assert client.get("/vacancy/")["X-Cache"] == "HIT"
@@ -0,0 +1,111 @@
+import pytest
+from django.core.cache import cache
+
+from tests.factories import VacancyFactory
+from vacancies.models import Skill, Vacancy
+
+
+@pytest.mark.django_db
+def test_vacancy_detail_not_modified(client, hr_token, django_assert_num_queries):
+    vacancy = VacancyFactory.create()
+    url = f"/vacancy/{vacancy.pk}/"
+    auth = {"HTTP_AUTHORIZATION": "Token " + hr_token}
+
+    response = client.get(url, **auth)
+    etag, last_modified = response["ETag"], response["Last-Modified"]
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag, **auth)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    # после изменения вакансии ETag другой
+    client.put("/vacancy/like/", [vacancy.pk], content_type="application/json", **auth)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag, **auth)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+    # без кэша ответов 304 дает один запрос modified, без сериализации (токен в своем кэше)
+    etag = response["ETag"]
+    cache.clear()
+    with django_assert_num_queries(1):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag, **auth)
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_vacancy_list_not_modified(client):
+    vacancies = VacancyFactory.create_batch(2)
+
+    response = client.get("/vacancy/")
+    etag = response["ETag"]
+    assert client.get("/vacancy/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert client.get("/vacancy/?page=2", HTTP_IF_NONE_MATCH=etag).status_code != 304
+
+    vacancies[0].skills.add(Skill.objects.create(name="python"))
+    assert client.get("/vacancy/", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    etag = client.get("/vacancy/")["ETag"]
+    vacancies[1].delete()
+    assert client.get("/vacancy/", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_vacancy_list_etag_after_username_change(client):
+    vacancy = VacancyFactory.create()
+    etag = client.get("/vacancy/")["ETag"]
+
+    user = vacancy.user
+    user.username = "renamed"
+    user.save()
+
+    response = client.get("/vacancy/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["results"][0]["username"] == "renamed"
+
+
+@pytest.mark.django_db
+def test_skills_not_modified(client):
+    skill = Skill.objects.create(name="python")
+
+    response = client.get("/skill/")
+    assert client.get("/skill/", HTTP_IF_NONE_MATCH=response["ETag"]).status_code == 304
+
+    response = client.get(f"/skill/{skill.pk}/")
+    etag = response["ETag"]
+    assert client.get(f"/skill/{skill.pk}/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    skill.name = "django"
+    skill.save()
+    assert client.get(f"/skill/{skill.pk}/", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_vacancy_cursor_page_etag_without_count(client):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    VacancyFactory.create_batch(15)
+    params = {"pagination": "cursor"}
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get("/vacancy/", params)
+    assert response.status_code == 200
+    assert not [query for query in context.captured_queries if "COUNT(" in query["sql"].upper()]
+
+    etag = response["ETag"]
+    cache.clear()
+    assert client.get("/vacancy/", params, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # изменение строки страницы меняет ETag, строки за ее пределами - нет
+    last_page = client.get(response.data["next"]).data["results"]
+    Vacancy.objects.filter(pk=last_page[0]["id"]).update(text="changed")
+    cache.clear()
+    assert client.get("/vacancy/", params, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    first = response.data["results"][0]["id"]
+    vacancy = Vacancy.objects.get(pk=first)
+    vacancy.text = "changed"
+    vacancy.save()
+    cache.clear()
+    assert client.get("/vacancy/", params, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
@@ -0,0 +1,37 @@
+import pytest
+from django.core.management import call_command
+
+from tests.factories import VacancyFactory, UserFactory
+from vacancies.models import Vacancy
+
+
+@pytest.mark.django_db
+def test_vacancy_count_follows_vacancy_changes():
+    first, second = UserFactory(), UserFactory()
+    vacancies = VacancyFactory.create_batch(2, user=first)
+
+    first.refresh_from_db()
+    assert first.vacancy_count == 2
+
+    vacancy = Vacancy.objects.get(pk=vacancies[0].pk)
+    vacancy.user = second
+    vacancy.save()
+    Vacancy.objects.get(pk=vacancies[1].pk).delete()
+
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert (first.vacancy_count, second.vacancy_count) == (0, 1)
+
+
+@pytest.mark.django_db
+def test_reconcile_vacancy_counts():
+    user = UserFactory()
+    Vacancy.objects.bulk_create([Vacancy(slug=f"bulk{i}", text="bulk", user=user) for i in range(3)])
+
+    user.refresh_from_db()
+    assert user.vacancy_count == 0
+
+    call_command("reconcile_vacancy_counts")
+
+    user.refresh_from_db()
+    assert user.vacancy_count == 3
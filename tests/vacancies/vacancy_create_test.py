@@ -1,6 +1,11 @@
 from datetime import date
 
 import pytest
+from django.db import IntegrityError
+from rest_framework.exceptions import ValidationError
+
+from vacancies.models import Vacancy
+from vacancies.serializers import unique_slug
 
 
 @pytest.mark.django_db
@@ -33,3 +38,29 @@ def test_create_vacancy(client, hr_token):
 
     assert response.status_code == 201
     assert response.data == expected_response
+
+
+@pytest.mark.django_db
+def test_create_vacancy_duplicate_slug(client, hr_token, django_assert_num_queries):
+    data = {"slug": "123", "text": "123", "status": "draft"}
+    headers = {"HTTP_AUTHORIZATION": "Token " + hr_token}
+    assert client.post("/vacancy/create/", data, content_type="application/json", **headers).status_code == 201
+
+    # без SELECT для проверки уникальности: savepoint, вставка, откат к savepoint, release
+    with django_assert_num_queries(4):
+        response = client.post("/vacancy/create/", data, content_type="application/json", **headers)
+
+    assert response.status_code == 400
+    assert response.data == {"slug": ["This field must be unique."]}
+    assert Vacancy.objects.count() == 1
+
+
+def test_unique_slug_other_integrity_errors():
+    # Ошибка другого ограничения, даже со словом slug, не превращается в ошибку поля
+    with pytest.raises(IntegrityError):
+        with unique_slug():
+            raise IntegrityError("NOT NULL constraint failed: vacancies_vacancy.slug")
+
+    with pytest.raises(ValidationError):
+        with unique_slug():
+            raise IntegrityError("UNIQUE constraint failed: vacancies_vacancy.slug")
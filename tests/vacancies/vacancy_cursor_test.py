@@ -0,0 +1,75 @@
+import pytest
+
+from tests.factories import VacancyFactory, UserFactory
+from vacancies.models import Skill
+
+
+@pytest.mark.django_db
+def test_vacancy_cursor_pagination_walk(client):
+    vacancies = VacancyFactory.create_batch(25, user=UserFactory())
+    expected = sorted((vacancy.pk for vacancy in vacancies), reverse=True)
+
+    response = client.get("/vacancy/", {"pagination": "cursor"})
+    pages = [response.data]
+    while pages[-1]["next"]:
+        pages.append(client.get(pages[-1]["next"]).data)
+
+    assert [len(page["results"]) for page in pages] == [10, 10, 5]
+    assert [item["id"] for page in pages for item in page["results"]] == expected
+    assert "count" not in pages[0]
+    assert pages[0]["previous"] is None
+
+    previous = client.get(pages[2]["previous"]).data
+    assert previous["results"] == pages[1]["results"]
+
+
+@pytest.mark.django_db
+def test_vacancy_cursor_pagination_count(client):
+    VacancyFactory.create_batch(3, user=UserFactory())
+
+    exact = client.get("/vacancy/", {"pagination": "cursor", "count": "exact"})
+    approx = client.get("/vacancy/", {"pagination": "cursor", "count": "approx"})
+
+    assert exact.data["count"] == 3
+    assert approx.data["count"] >= 0
+
+
+@pytest.mark.django_db
+def test_vacancy_cursor_invalid(client):
+    response = client.get("/vacancy/", {"cursor": "garbage"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_skill_cursor_pagination(client):
+    skills = Skill.objects.bulk_create([Skill(name=f"skill{i}") for i in range(12)])
+
+    first = client.get("/skill/", {"pagination": "cursor"}).data
+    second = client.get(first["next"]).data
+
+    assert [item["id"] for item in first["results"] + second["results"]] == \
+        [skill.pk for skill in skills]
+    assert second["next"] is None
+
+
+class RankingSearchBackend:
+    # Как PostgresSearchBackend с rank=1: поиск задает свой порядок выборки
+    ranked = True
+
+    def search(self, queryset, text, rank=False):
+        queryset = queryset.filter(text__icontains=text)
+        return queryset.order_by("-likes", "-id") if rank else queryset
+
+
+@pytest.mark.django_db
+def test_vacancy_cursor_with_rank(client, settings):
+    settings.VACANCY_SEARCH_BACKEND = "tests.vacancies.vacancy_cursor_test.RankingSearchBackend"
+    VacancyFactory.create_batch(3, text="python")
+
+    response = client.get("/vacancy/", {"text": "python", "rank": 1, "pagination": "cursor"})
+    assert response.status_code == 400
+    assert "pagination" in response.data
+
+    assert client.get("/vacancy/", {"text": "python", "pagination": "cursor"}).status_code == 200
+    assert client.get("/vacancy/", {"text": "python", "rank": 1}).status_code == 200
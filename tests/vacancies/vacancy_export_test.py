@@ -0,0 +1,35 @@
+import json
+
+import pytest
+from django.core.management import call_command
+
+from tests.factories import VacancyFactory
+from vacancies.models import Skill, Vacancy
+from vacancies.serializers import VacancyListSerializer
+
+
+@pytest.mark.django_db
+def test_export_vacancies_jsonl(client, hr_token):
+    skill = Skill.objects.create(name="python")
+    VacancyFactory.create_batch(3, skills=[skill])
+    VacancyFactory.create(user=None)
+
+    response = client.get("/vacancy/export/", HTTP_AUTHORIZATION="Token " + hr_token)
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+    assert rows == VacancyListSerializer(Vacancy.objects.order_by("id"), many=True).data
+
+
+@pytest.mark.django_db
+def test_export_vacancies_csv_command(tmp_path):
+    vacancy = VacancyFactory.create(skills=Skill.objects.bulk_create([Skill(name="a"), Skill(name="b")]))
+    path = tmp_path / "vacancies.csv"
+
+    call_command("export_vacancies", "--format", "csv", "--output", str(path))
+
+    assert path.read_text().splitlines() == [
+        "id,text,slug,status,created,username,skills",
+        f"{vacancy.pk},test text,{vacancy.slug},draft,{vacancy.created.isoformat()},{vacancy.user.username},a;b",
+    ]
@@ -0,0 +1,66 @@
+import pytest
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.renderers import JSONRenderer
+
+from tests.factories import VacancyFactory, UserFactory
+from vacancies.fast_serializers import ValuesSerializer, vacancy_list_values, vacancy_detail_values
+from vacancies.likes import BufferedLikes
+from vacancies.models import Vacancy, Skill
+from vacancies.serializers import VacancyListSerializer, VacancyDetailSerializer
+from vacancies.views import VacancyListView
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.fixture
+def vacancies():
+    python, django = Skill.objects.create(name="python"), Skill.objects.create(name="django")
+    VacancyFactory.create_batch(3, user=UserFactory(), skills=[django, python], min_experience=2)
+    VacancyFactory.create(user=None, text="без автора", status="open", updated_at="2100-01-01")
+    return Vacancy.objects.order_by("id")
+
+
+@pytest.mark.django_db
+def test_list_output_matches_drf(vacancies):
+    expected = VacancyListSerializer(vacancies.prefetch_related("skills"), many=True).data
+
+    assert render(vacancy_list_values.serialize_many(vacancy_list_values.values(vacancies))) == render(expected)
+
+
+@pytest.mark.django_db
+def test_detail_output_matches_drf(vacancies):
+    BufferedLikes().add([vacancies[0].pk])
+    BufferedLikes().add([vacancies[0].pk])
+    annotated = BufferedLikes().annotate(vacancies)
+
+    for queryset in (vacancies, annotated):
+        expected = VacancyDetailSerializer(queryset, many=True).data
+        actual = vacancy_detail_values.serialize_many(vacancy_detail_values.values(queryset))
+        assert render(actual) == render(expected)
+
+
+class SkillIdsSerializer(VacancyListSerializer):
+    skills = PrimaryKeyRelatedField(many=True, read_only=True)
+
+
+class SkillIdsValuesSerializer(ValuesSerializer):
+    serializer_class = SkillIdsSerializer
+    sources = {'username': 'user__username'}
+
+
+@pytest.mark.django_db
+def test_unsupported_many_to_many_falls_back_to_drf(client, vacancies, monkeypatch):
+    values_serializer = SkillIdsValuesSerializer()
+    expected = SkillIdsSerializer(vacancies.prefetch_related("skills"), many=True).data
+
+    assert not values_serializer.supported
+    assert render(values_serializer.serialize_queryset(vacancies)) == render(expected)
+
+    monkeypatch.setattr(VacancyListView, "serializer_class", SkillIdsSerializer)
+    monkeypatch.setattr(VacancyListView, "values_serializer", values_serializer)
+    response = client.get("/vacancy/")
+    assert response.status_code == 200
+    assert sorted(skills for item in response.data["results"] for skills in item["skills"]) == \
+        sorted(Vacancy.skills.through.objects.values_list("skill_id", flat=True))
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+from django.core.management import call_command
+
+from tests.factories import VacancyFactory
+from vacancies.importers import VacancyImporter
+from vacancies.models import Vacancy
+
+
+@pytest.mark.django_db
+def test_import_vacancies_jsonl(client, hr_token):
+    VacancyFactory.create(slug="taken")
+    rows = [
+        {"slug": "python", "text": "python", "status": "open", "skills": ["python", "django"]},
+        {"slug": "closed", "text": "closed", "status": "closed"},
+        {"slug": "taken", "text": "taken", "status": "open"},
+        {"slug": "python", "text": "again", "status": "open"},
+    ]
+    body = "\n".join(json.dumps(row) for row in rows) + "\n{broken"
+
+    response = client.post(
+        "/vacancy/import/",
+        body,
+        content_type="application/x-ndjson",
+        HTTP_AUTHORIZATION="Token " + hr_token
+    )
+
+    assert response.status_code == 200
+    assert response.data["created"] == 1
+    assert [error["row"] for error in response.data["errors"]] == [2, 3, 4, 5]
+
+    vacancy = Vacancy.objects.get(slug="python")
+    assert vacancy.user.username == "hr"
+    assert sorted(vacancy.skills.values_list("name", flat=True)) == ["django", "python"]
+    assert vacancy.user.vacancy_count == 1
+
+
+@pytest.mark.django_db
+def test_import_vacancies_csv_command(tmp_path):
+    path = tmp_path / "vacancies.csv"
+    path.write_text(
+        "slug,text,status,min_experience,skills\n"
+        "first,first,open,2,python;sql\n"
+        "second,second,draft,,\n"
+        "third,third,draft,-1,\n"
+    )
+
+    call_command("import_vacancies", str(path), "--chunk-size", "2")
+
+    assert sorted(Vacancy.objects.values_list("slug", flat=True)) == ["first", "second"]
+    assert Vacancy.objects.get(slug="first").min_experience == 2
+
+
+@pytest.mark.django_db
+def test_import_invalid_status():
+    rows = [
+        (1, {"slug": "first", "text": "first", "status": "unknown"}, None),
+        (2, {"slug": "second", "text": "second", "status": "open"}, None),
+    ]
+
+    report = VacancyImporter().run(rows)
+
+    assert report.created == 1
+    assert [error["row"] for error in report.errors] == [1]
+    assert "status" in report.errors[0]["errors"]
+
+
+@pytest.mark.django_db
+def test_import_slug_taken_during_import(monkeypatch):
+    # slug появился в БД после проверки пачки: остальные строки все равно сохраняются
+    VacancyFactory.create(slug="taken")
+    monkeypatch.setattr(VacancyImporter, "existing_slugs", lambda self, slugs: set())
+    rows = [
+        (1, {"slug": "first", "text": "first", "status": "open", "skills": ["python"]}, None),
+        (2, {"slug": "taken", "text": "taken", "status": "open"}, None),
+        (3, {"slug": "third", "text": "third", "status": "draft"}, None),
+    ]
+
+    report = VacancyImporter().run(rows)
+
+    assert report.created == 2
+    assert report.errors == [{"row": 2, "errors": {"slug": ["This field must be unique."]}}]
+    assert sorted(Vacancy.objects.values_list("slug", flat=True)) == ["first", "taken", "third"]
+    assert list(Vacancy.objects.get(slug="first").skills.values_list("name", flat=True)) == ["python"]
@@ -0,0 +1,65 @@
+import pytest
+from django.core.management import call_command
+
+from tests.factories import VacancyFactory
+from vacancies.models import Vacancy, VacancyLikeBuffer, VacancyLikeShard
+
+
+def like(client, token, vacancy):
+    response = client.put(
+        "/vacancy/like/", [vacancy.pk], content_type="application/json",
+        HTTP_AUTHORIZATION="Token " + token,
+    )
+    assert response.status_code == 200
+    return response.json()[0]["likes"]
+
+
+@pytest.mark.django_db
+def test_direct_likes(client, hr_token, settings):
+    settings.VACANCY_LIKES_MODE = "direct"
+    vacancy = VacancyFactory.create()
+
+    assert like(client, hr_token, vacancy) == 1
+    assert like(client, hr_token, vacancy) == 2
+    assert Vacancy.objects.get(pk=vacancy.pk).likes == 2
+
+
+@pytest.mark.django_db
+def test_buffered_likes(client, hr_token, settings):
+    settings.VACANCY_LIKES_MODE = "buffered"
+    vacancy = VacancyFactory.create()
+
+    # первый лайк за интервал сразу переносится в вакансию, следующие копятся в буфере
+    assert like(client, hr_token, vacancy) == 1
+    assert like(client, hr_token, vacancy) == 2
+    assert like(client, hr_token, vacancy) == 3
+    assert Vacancy.objects.get(pk=vacancy.pk).likes == 1
+    assert VacancyLikeBuffer.objects.count() == 2
+
+    response = client.get(f"/vacancy/{vacancy.pk}/", HTTP_AUTHORIZATION="Token " + hr_token)
+    assert response.data["likes"] == 3
+
+    call_command("flush_likes")
+    assert Vacancy.objects.get(pk=vacancy.pk).likes == 3
+    assert not VacancyLikeBuffer.objects.exists()
+
+
+@pytest.mark.django_db
+def test_sharded_likes(client, hr_token, settings, django_assert_num_queries):
+    settings.VACANCY_LIKES_MODE = "sharded"
+    settings.VACANCY_LIKES_SHARDS = 4
+    vacancy = VacancyFactory.create(likes=5)
+    url = f"/vacancy/{vacancy.pk}/"
+    etag = client.get(url, HTTP_AUTHORIZATION="Token " + hr_token)["ETag"]
+
+    for expected in range(6, 26):
+        assert like(client, hr_token, vacancy) == expected
+
+    assert Vacancy.objects.get(pk=vacancy.pk).likes == 5
+    assert VacancyLikeShard.objects.filter(vacancy=vacancy).count() <= 4
+
+    # сумма шардов приходит подзапросом, без запроса на каждую вакансию; токен уже в кэше
+    with django_assert_num_queries(3):
+        response = client.get(url, HTTP_AUTHORIZATION="Token " + hr_token, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data["likes"] == 25
@@ -0,0 +1,26 @@
+import pytest
+
+from tests.factories import VacancyFactory, UserFactory
+from vacancies.models import Vacancy, Skill
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("size", [10, 100, 1000])
+def test_vacancy_list_query_count(client, django_assert_num_queries, size):
+    skills = Skill.objects.bulk_create([Skill(name=f"skill{i}") for i in range(3)])
+    vacancies = VacancyFactory.create_batch(size, user=UserFactory())
+    Vacancy.skills.through.objects.bulk_create([
+        Vacancy.skills.through(vacancy_id=vacancy.pk, skill_id=skill.pk)
+        for vacancy in vacancies
+        for skill in skills
+    ])
+
+    # count + страница вакансий с пользователями + навыки страницы
+    with django_assert_num_queries(3):
+        response = client.get("/vacancy/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == size
+    for item in response.data["results"]:
+        assert item["username"]
+        assert sorted(item["skills"]) == ["skill0", "skill1", "skill2"]
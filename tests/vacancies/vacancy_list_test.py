@@ -25,7 +25,8 @@ def test_vacancy_list(client):
         "count": 10,
         "next": None,
         "previous": None,
-        "results": VacancyListSerializer(vacancies, many=True).data
+        # новые первыми: порядок -created, -id
+        "results": VacancyListSerializer(vacancies[::-1], many=True).data
         # "results": [{
         #     "id": vacancy.pk,
         #     "text": "test text",
@@ -42,3 +43,16 @@ def test_vacancy_list(client):
     assert response.status_code == 200
     assert response.data == expected_response
 
+
+
+@pytest.mark.django_db
+def test_vacancy_list_status_filter(client):
+    VacancyFactory.create_batch(2, status="open")
+    VacancyFactory.create_batch(3, status="closed")
+
+    response = client.get("/vacancy/", {"status": "open"})
+
+    assert response.status_code == 200
+    assert response.data["count"] == 2
+    assert {item["status"] for item in response.data["results"]} == {"open"}
+    assert client.get("/vacancy/", {"status": "bad"}).status_code == 400
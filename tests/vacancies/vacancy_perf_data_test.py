@@ -0,0 +1,49 @@
+import pytest
+from django.core.management import call_command
+
+from authentication.models import User
+from tests.factories import VacancyFactory
+from vacancies.counters import reconcile_vacancy_counts
+from vacancies.models import Vacancy, Skill
+
+
+def snapshot():
+    return list(Vacancy.objects.order_by("slug").values_list("slug", "text", "status", "user__username"))
+
+
+@pytest.mark.django_db
+def test_create_bulk(django_assert_max_num_queries):
+    # пачки по 100: запросов не больше десятка на пачку, а не по одному на строку
+    with django_assert_max_num_queries(40):
+        created = VacancyFactory.create_bulk(1000, users=30, skills=10, skills_per_vacancy=2, chunk_size=100)
+
+    assert created == {"users": 30, "skills": 10, "vacancies": 1000, "links": 2000}
+    assert Vacancy.objects.count() == 1000
+    assert User.objects.count() == 30
+    assert Skill.objects.count() == 10
+    assert Vacancy.skills.through.objects.count() == 2000
+    assert reconcile_vacancy_counts(dry_run=True) == 0
+
+
+@pytest.mark.django_db
+def test_create_bulk_deterministic():
+    VacancyFactory.create_bulk(200, seed=7)
+    first = snapshot()
+    Vacancy.objects.all().delete()
+    User.objects.all().delete()
+
+    VacancyFactory.create_bulk(200, seed=7)
+    assert snapshot() == first
+
+    Vacancy.objects.all().delete()
+    User.objects.all().delete()
+    VacancyFactory.create_bulk(200, seed=8)
+    assert snapshot() != first
+
+
+@pytest.mark.django_db
+def test_seed_perf_data_command():
+    call_command("seed_perf_data", "--vacancies", "100", "--prefix", "cmd")
+
+    assert Vacancy.objects.filter(slug__startswith="cmd-").count() == 100
+    assert User.objects.get(username="cmd-user0").check_password("cmd")
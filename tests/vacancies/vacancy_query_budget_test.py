@@ -0,0 +1,98 @@
+import pytest
+
+from authentication.models import User
+from tests.factories import VacancyFactory, UserFactory
+from vacancies.cache import invalidate_all
+from vacancies.models import Vacancy, Skill
+
+# Бюджеты не зависят от dataset_size: запросы на каждую строку не пройдут
+
+
+def seed(size):
+    skills = Skill.objects.bulk_create([Skill(name=f"skill{i}") for i in range(3)])
+    users = UserFactory.create_batch(min(size, 5))
+    vacancies = [VacancyFactory.create(slug=f"vacancy-{i}", user=users[i % len(users)]) for i in range(size)]
+    Vacancy.skills.through.objects.bulk_create([
+        Vacancy.skills.through(vacancy_id=vacancy.pk, skill_id=skill.pk)
+        for vacancy in vacancies
+        for skill in skills
+    ])
+    return vacancies
+
+
+@pytest.mark.django_db
+def test_list_budget(client, query_budget, dataset_size):
+    seed(dataset_size)
+
+    # count + страница + навыки страницы; строк не больше страницы с навыками
+    with query_budget(3, max_rows=1 + 10 + 10 * 3):
+        response = client.get("/vacancy/")
+
+    assert response.status_code == 200
+    assert response.data["count"] == dataset_size
+
+
+@pytest.mark.django_db
+def test_list_skill_filter_budget(client, query_budget, dataset_size):
+    seed(dataset_size)
+
+    with query_budget(3, max_rows=1 + 10 + 10 * 3):
+        response = client.get("/vacancy/", {"skill": ["skill1", "skill2"]})
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_detail_budget(client, hr_token, query_budget, dataset_size):
+    vacancies = seed(dataset_size)
+    url = f"/vacancy/{vacancies[-1].pk}/"
+    client.get(url, HTTP_AUTHORIZATION="Token " + hr_token)  # токен в кэше
+    invalidate_all()
+
+    # валидаторы (ETag), строка вакансии, навыки
+    with query_budget(3, max_rows=1 + 1 + 3):
+        response = client.get(url, HTTP_AUTHORIZATION="Token " + hr_token)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_user_vacancies_budget(client, hr_token, query_budget, dataset_size):
+    seed(dataset_size)
+    client.get("/vacancy/by_user/", HTTP_AUTHORIZATION="Token " + hr_token)  # токен в кэше
+    invalidate_all()
+
+    # агрегат + страница пользователей
+    with query_budget(2, max_rows=1 + 10):
+        response = client.get("/vacancy/by_user/", HTTP_AUTHORIZATION="Token " + hr_token)
+
+    assert response.status_code == 200
+    assert response.json()["total"] == User.objects.count()
+
+
+@pytest.mark.django_db
+def test_budget_failure_shows_queries(query_budget):
+    UserFactory.create_batch(3)
+
+    with pytest.raises(pytest.fail.Exception) as error:
+        with query_budget(1):
+            for user in User.objects.all():
+                User.objects.filter(pk=user.pk).exists()
+
+    message = str(error.value)
+    assert "4 queries, budget 1" in message
+    assert "+   2." in message
+    assert "[x3]" in message
+
+
+@pytest.mark.django_db
+def test_budget_counts_rows(query_budget):
+    UserFactory.create_batch(3)
+
+    with query_budget(1) as log:
+        assert len(list(User.objects.all())) == 3
+    assert log.rows == 3
+
+    with pytest.raises(pytest.fail.Exception, match="3 rows fetched, budget 2"):
+        with query_budget(1, max_rows=2):
+            list(User.objects.all())
@@ -9,7 +9,7 @@ def test_retrieve_vacancy(client, vacancy, hr_token):
         "id": vacancy.pk,
         "created": date.today().strftime("%Y-%m-%d"),
         "skills": [],
-        "slug": "test",
+        "slug": vacancy.slug,
         "text": "test text",
         "status": "draft",
         "min_experience": None,
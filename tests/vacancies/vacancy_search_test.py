@@ -0,0 +1,32 @@
+import pytest
+
+from tests.factories import VacancyFactory
+from vacancies.search import get_search_backend
+
+
+@pytest.mark.django_db
+def test_vacancy_search_by_text(client):
+    python_vacancy = VacancyFactory.create(text="Ищем python разработчика")
+    VacancyFactory.create(text="Ищем java разработчика")
+
+    response = client.get("/vacancy/", {"text": "python"})
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.data["results"]] == [python_vacancy.pk]
+
+
+@pytest.mark.django_db
+def test_vacancy_search_ranked(client):
+    # более релевантная вакансия создана раньше: без ранжирования она была бы второй
+    best = VacancyFactory.create(text="python и снова python")
+    other = VacancyFactory.create(text="python")
+    VacancyFactory.create(text="java")
+
+    response = client.get("/vacancy/", {"text": "python", "rank": 1})
+
+    assert response.status_code == 200
+    ids = [item["id"] for item in response.data["results"]]
+    assert sorted(ids) == sorted([best.pk, other.pk])
+    if not get_search_backend().ranked:
+        pytest.skip("search backend does not rank results")
+    assert ids == [best.pk, other.pk]
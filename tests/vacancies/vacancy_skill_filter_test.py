@@ -0,0 +1,54 @@
+import pytest
+
+from tests.factories import VacancyFactory
+from vacancies.models import Skill
+
+
+@pytest.fixture
+def skilled_vacancies():
+    python, django, java = Skill.objects.bulk_create(
+        [Skill(name="Python"), Skill(name="Django"), Skill(name="Java")]
+    )
+    both = VacancyFactory.create(skills=[python, django])
+    only_python = VacancyFactory.create(skills=[python])
+    only_java = VacancyFactory.create(skills=[java])
+    return both, only_python, only_java
+
+
+def result_ids(response):
+    assert response.status_code == 200
+    return sorted(item["id"] for item in response.data["results"])
+
+
+@pytest.mark.django_db
+def test_skill_filter_substring_has_no_duplicates(client, skilled_vacancies):
+    both, only_python, _ = skilled_vacancies
+
+    response = client.get("/vacancy/", {"skill": ["pyth", "djan"]})
+
+    assert result_ids(response) == sorted([both.pk, only_python.pk])
+
+
+@pytest.mark.django_db
+def test_skill_filter_any(client, skilled_vacancies):
+    both, only_python, only_java = skilled_vacancies
+
+    response = client.get("/vacancy/", {"skill": ["python ", "JAVA", "pyth"], "skill_match": "any"})
+
+    assert result_ids(response) == sorted([both.pk, only_python.pk, only_java.pk])
+
+
+@pytest.mark.django_db
+def test_skill_filter_all(client, skilled_vacancies):
+    both, _, _ = skilled_vacancies
+
+    response = client.get("/vacancy/", {"skill": ["python", "django"], "skill_match": "all"})
+
+    assert result_ids(response) == [both.pk]
+
+
+@pytest.mark.django_db
+def test_skill_filter_unknown_match(client):
+    response = client.get("/vacancy/", {"skill": "python", "skill_match": "some"})
+
+    assert response.status_code == 400
@@ -0,0 +1,41 @@
+import pytest
+
+from vacancies.models import Skill, Vacancy
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("size", [1, 10, 100])
+def test_create_vacancy_skills_query_count(client, hr_token, django_assert_num_queries, size):
+    names = [f"skill{i}" for i in range(size)]
+    Skill.objects.create(name=names[0])
+
+    data = {
+        "slug": "123",
+        "text": "123",
+        "status": "draft",
+        "skills": names,
+    }
+
+    # токен, savepoint, вставка вакансии (уникальность slug проверяет БД), вставка навыков,
+    # выборка навыков, вставка связей, release savepoint, навыки в ответе
+    with django_assert_num_queries(8):
+        response = client.post(
+            "/vacancy/create/",
+            data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION="Token " + hr_token
+        )
+
+    assert response.status_code == 201
+    assert sorted(response.data["skills"]) == sorted(names)
+    assert Skill.objects.count() == size
+    assert Vacancy.objects.get().skills.count() == size
+
+
+@pytest.mark.django_db
+def test_create_duplicate_skill(client):
+    Skill.objects.create(name="python")
+
+    response = client.post("/skill/", {"name": "python"}, content_type="application/json")
+
+    assert response.status_code == 400
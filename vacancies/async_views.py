@@ -0,0 +1,173 @@
+from collections import defaultdict
+from functools import wraps
+from math import ceil
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import Count, Avg
+from django.http import HttpResponseNotAllowed
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param, remove_query_param
+
+from authentication.models import User
+from hunting import settings
+from hunting.json import JsonResponse
+from vacancies.filters import filter_by_skills, filter_by_status
+from vacancies.likes import get_likes_backend
+from vacancies.models import Vacancy
+from vacancies.pagination import VacancyPagination
+from vacancies.search import get_search_backend
+from vacancies.serializers import VacancyListSerializer, VacancyDetailSerializer
+
+# Асинхронные (ASGI) версии эндпоинтов чтения: список, карточка вакансии и by_user.
+# Ответы совпадают с синхронными DRF view, но запрос не проходит через поток
+# обертки sync_to_async целиком - в поток уходят только обращения к БД.
+# Кэш ответов, ETag и пагинация по курсору есть только у синхронных view.
+# values_list().aiterator() в Django 4.1 выполняет запрос в async контексте
+# (SynchronousOnlyOperation), поэтому везде используется values().
+
+
+def authenticate(request):
+    # Аутентификаторы DRF синхронные (запросы к БД), вызываются через sync_to_async
+    for authenticator_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        authenticator = authenticator_class()
+        result = authenticator.authenticate(request)
+        if result is not None:
+            return result[0]
+    return AnonymousUser()
+
+
+def error_response(exc):
+    # Формат как у rest_framework.views.exception_handler
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+    return JsonResponse(data, status=exc.status_code, safe=False)
+
+
+def async_api_view(permission_required=False):
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return HttpResponseNotAllowed(['GET'])
+
+            try:
+                request.user = await sync_to_async(authenticate)(request)
+                if permission_required and not request.user.is_authenticated:
+                    raise NotAuthenticated()
+                return await view(request, *args, **kwargs)
+            except APIException as exc:
+                response = error_response(exc)
+                if exc.status_code == 401:
+                    response['WWW-Authenticate'] = 'Token'
+                return response
+
+        return wrapper
+
+    return decorator
+
+
+def get_page_number(value, num_pages):
+    # Как Paginator.get_page: неверный номер - первая страница, слишком большой - последняя
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return 1
+    return min(max(number, 1), num_pages)
+
+
+def page_links(request, page, num_pages):
+    url = request.build_absolute_uri()
+    next_link = replace_query_param(url, 'page', page + 1) if page < num_pages else None
+    if page <= 1:
+        previous_link = None
+    elif page == 2:
+        previous_link = remove_query_param(url, 'page')
+    else:
+        previous_link = replace_query_param(url, 'page', page - 1)
+    return next_link, previous_link
+
+
+async def load_skill_names(ids):
+    # prefetch_related с aiterator() не работает, навыки страницы собираем сами одним запросом
+    names = defaultdict(list)
+    through = Vacancy.skills.through.objects.filter(vacancy_id__in=ids).order_by('skill_id')
+    async for row in through.values('vacancy_id', 'skill__name').aiterator():
+        names[row['vacancy_id']].append(row['skill__name'])
+    return names
+
+
+@async_api_view()
+async def vacancy_list(request):
+    queryset = Vacancy.objects.order_by(*VacancyPagination.ordering)
+
+    text = request.GET.get('text')
+    if text:
+        queryset = get_search_backend().search(queryset, text, rank=request.GET.get('rank') == '1')
+    status = request.GET.get('status')
+    if status:
+        queryset = filter_by_status(queryset, status)
+    skills = request.GET.getlist('skill')
+    if skills:
+        queryset = filter_by_skills(queryset, skills, match=request.GET.get('skill_match'))
+
+    page_size = api_settings.PAGE_SIZE
+    count = await queryset.acount()
+    num_pages = max(1, ceil(count / page_size))
+    page = get_page_number(request.GET.get('page'), num_pages)
+
+    fields = [name for name in VacancyListSerializer.Meta.fields if name not in ('username', 'skills')]
+    rows = [
+        row async for row in queryset[(page - 1) * page_size:page * page_size].values(
+            *fields, 'user__username'
+        ).aiterator()
+    ]
+    skill_names = await load_skill_names([row['id'] for row in rows])
+
+    results = []
+    for row in rows:
+        row['created'] = row['created'].isoformat()
+        row['username'] = row.pop('user__username')
+        row['skills'] = skill_names[row['id']]
+        results.append(row)
+
+    next_link, previous_link = page_links(request, page, num_pages)
+    return JsonResponse({
+        'count': count,
+        'next': next_link,
+        'previous': previous_link,
+        'results': results,
+    })
+
+
+@async_api_view(permission_required=True)
+async def vacancy_detail(request, pk):
+    queryset = get_likes_backend().annotate(Vacancy.objects.prefetch_related('skills'))
+    try:
+        # aget выполняет get() вместе с prefetch_related в потоке, сериализатор БД уже не трогает
+        vacancy = await queryset.aget(pk=pk)
+    except Vacancy.DoesNotExist:
+        return JsonResponse({'detail': 'Not found.'}, status=404)
+
+    return JsonResponse(VacancyDetailSerializer(vacancy).data)
+
+
+@async_api_view(permission_required=True)
+async def user_vacancies(request):
+    totals = await User.objects.aaggregate(total=Count('id'), avg=Avg('vacancy_count'))
+    per_page = settings.TOTAL_ON_PAGE
+    num_pages = max(1, ceil(totals['total'] / per_page))
+    page = get_page_number(request.GET.get('page'), num_pages)
+
+    users = User.objects.order_by('id')[(page - 1) * per_page:page * per_page]
+    items = [
+        {'id': user['id'], 'name': user['username'], 'vacancies': user['vacancy_count']}
+        async for user in users.values('id', 'username', 'vacancy_count').aiterator()
+    ]
+
+    return JsonResponse({
+        'items': items,
+        'total': totals['total'],
+        'num_page': num_pages,
+        'avg': totals['avg'],
+    })
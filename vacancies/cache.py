@@ -0,0 +1,111 @@
+import hashlib
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+from hunting.cache import CacheStats
+from hunting.db.routers import pinned_to_primary
+from vacancies.conditional import replay_conditional
+
+# Ключи ответов содержат версии: при изменении данных версия меняется,
+# и старые записи просто перестают читаться (истекают по таймауту).
+# list - все списки, all - вообще все ответы (например, переименован навык)
+LIST_VERSION = 'vacancies:version:list'
+ALL_VERSION = 'vacancies:version:all'
+
+CACHED_HEADERS = ('ETag', 'Last-Modified')
+
+stats = CacheStats('vacancies')
+
+
+def object_version(pk):
+    return f'vacancies:version:{pk}'
+
+
+def _new_version():
+    return uuid.uuid4().hex[:12]
+
+
+def _versions(*keys):
+    versions = cache.get_many(keys)
+    missing = {key: _new_version() for key in keys if key not in versions}
+    if missing:
+        cache.set_many(missing, timeout=None)
+        versions.update(missing)
+    return [versions[key] for key in keys]
+
+
+def normalize_params(params):
+    # Порядок параметров и значений ?skill= не важен, пустые значения и page=1 отбрасываются
+    normalized = []
+    for key in sorted(params):
+        values = sorted(value.strip() for value in params.getlist(key) if value.strip())
+        if values and not (key == 'page' and values == ['1']):
+            normalized.append((key, values))
+    return normalized
+
+
+def list_cache_key(request):
+    list_version, all_version = _versions(LIST_VERSION, ALL_VERSION)
+    # Ссылки next/previous в ответе абсолютные: схема и хост входят в ключ
+    params = repr((request.build_absolute_uri('/'), normalize_params(request.query_params)))
+    digest = hashlib.md5(params.encode()).hexdigest()
+    return f'vacancies:list:{all_version}:{list_version}:{digest}'
+
+
+def detail_cache_key(pk):
+    version, all_version = _versions(object_version(pk), ALL_VERSION)
+    return f'vacancies:detail:{pk}:{all_version}:{version}'
+
+
+def cached_response(request, key, get_response):
+    if pinned_to_primary():
+        # read-your-writes: мимо кэша, см. hunting/db/routers.py
+        return get_response()
+
+    entry = cache.get(key)
+    if entry is not None:
+        stats.hit()
+        data, headers = entry
+        response = replay_conditional(request, Response(data, headers=headers))
+        response['X-Cache'] = 'HIT'
+        return response
+
+    stats.miss()
+    response = get_response()
+    if response.status_code == 200:
+        headers = {name: response[name] for name in CACHED_HEADERS if response.has_header(name)}
+        cache.set(key, (response.data, headers), settings.VACANCY_CACHE_TIMEOUT)
+    response['X-Cache'] = 'MISS'
+    return response
+
+
+def _on_commit(func):
+    # Сбрасываем сразу и еще раз после фиксации транзакции: иначе параллельный запрос
+    # успеет положить в кэш данные, прочитанные до коммита
+    func()
+    transaction.on_commit(func)
+
+
+def invalidate_vacancies(pks):
+    pks = list(pks)
+
+    def invalidate():
+        version = _new_version()
+        cache.set_many(
+            {LIST_VERSION: version, **{object_version(pk): version for pk in pks}},
+            timeout=None,
+        )
+
+    _on_commit(invalidate)
+
+
+def invalidate_vacancy_lists():
+    _on_commit(lambda: cache.set(LIST_VERSION, _new_version(), timeout=None))
+
+
+def invalidate_all():
+    _on_commit(lambda: cache.set(ALL_VERSION, _new_version(), timeout=None))
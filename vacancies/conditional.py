@@ -0,0 +1,103 @@
+import hashlib
+
+from django.db.models import Max, Count
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+# Условные GET: ETag и Last-Modified считаются по полю modified одним коротким
+# запросом, поэтому на неизменившийся ресурс отвечаем 304 без сериализации.
+
+
+def make_validators(modified, *parts):
+    etag = quote_etag(hashlib.md5(repr((modified, parts)).encode()).hexdigest())
+    last_modified = int(modified.timestamp()) if modified else None
+    return etag, last_modified
+
+
+def queryset_state(queryset):
+    # Количество строк входит в ETag, чтобы заметить удаление
+    state = queryset.order_by().aggregate(modified=Max('modified'), count=Count('pk'))
+    return state['modified'], state['count']
+
+
+def page_state(paginator, queryset, request):
+    # Для курсора без ?count=exact: только строки самой страницы, без прохода по всей выборке
+    page = paginator.page_slice(queryset.prefetch_related(None), request)[0]
+    rows = list(page.values_list('id', 'modified'))
+    modified = max((row[1] for row in rows), default=None)
+    return modified, [row[0] for row in rows]
+
+
+def object_validators(queryset, pk):
+    # Аннотации (например, likes_total из vacancies/likes.py) меняются без modified,
+    # поэтому тоже входят в ETag
+    fields = ['modified', *queryset.query.annotations]
+    try:
+        row = queryset.filter(pk=pk).values_list(*fields).first()
+    except (TypeError, ValueError):
+        # Некорректный pk: пусть ответ 404 сформирует сама view
+        return None
+    if row is None:
+        return None
+    modified, *annotations = row
+    etag, last_modified = make_validators(modified, pk, *annotations)
+    # По времени изменения аннотированный ответ не проверить, остается только ETag
+    return etag, None if annotations else last_modified
+
+
+def set_validators(response, validators):
+    etag, last_modified = validators
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def conditional_response(request, validators, get_response):
+    if validators is None:
+        return get_response()
+
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = get_response()
+    if response.status_code in (200, 304):
+        set_validators(response, validators)
+    return response
+
+
+def replay_conditional(request, response):
+    # Ответ из кэша уже содержит ETag / Last-Modified, сверяем с ними
+    return get_conditional_response(
+        request,
+        etag=response.get('ETag'),
+        last_modified=parse_http_date_safe(response.get('Last-Modified', '')),
+        response=response,
+    )
+
+
+class ConditionalGetMixin:
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        paginator = self.paginator
+        if paginator is not None and hasattr(paginator, 'counts_exactly') \
+                and not paginator.counts_exactly(request):
+            # COUNT(*) по всей выборке здесь не нужен, ETag считается по строкам страницы
+            modified, state = page_state(paginator, queryset, request)
+        else:
+            modified, state = queryset_state(queryset)
+            if paginator is not None:
+                # Количество уже известно, пагинатор не будет делать COUNT(*) повторно
+                paginator.known_count = state
+
+        validators = make_validators(modified, state, sorted(request.query_params.lists()))
+        return conditional_response(
+            request, validators, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs)
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        validators = object_validators(self.get_queryset(), pk)
+        return conditional_response(
+            request, validators, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+        )
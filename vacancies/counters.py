@@ -0,0 +1,32 @@
+from django.db.models import F, Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from authentication.models import User
+from vacancies.models import Vacancy
+
+
+def adjust_vacancy_count(user_id, delta):
+    # Атомарное изменение в БД (UPDATE ... SET vacancy_count = vacancy_count + delta)
+    if user_id is None or not delta:
+        return
+    User.objects.filter(pk=user_id).update(vacancy_count=F('vacancy_count') + delta)
+
+
+def actual_vacancy_count():
+    vacancies = Vacancy.objects.filter(user=OuterRef('pk')).order_by().values(
+        'user'
+    ).annotate(count=Count('pk')).values('count')
+    return Coalesce(Subquery(vacancies), 0)
+
+
+def reconcile_vacancy_counts(dry_run=False):
+    # Пересчет одним UPDATE только для разошедшихся пользователей
+    drifted = User.objects.annotate(actual=actual_vacancy_count()).exclude(
+        vacancy_count=F('actual')
+    )
+    count = drifted.count()
+    if count and not dry_run:
+        User.objects.filter(pk__in=drifted.values('pk')).update(
+            vacancy_count=actual_vacancy_count()
+        )
+    return count
@@ -0,0 +1,61 @@
+import csv
+import json
+from itertools import islice
+
+from vacancies.importers import CSV_SKILLS_SEPARATOR
+from vacancies.models import Vacancy
+from vacancies.serializers import VacancyListSerializer
+from vacancies.skills import skill_names_by_vacancy
+
+# Набор и порядок полей как у VacancyListSerializer
+EXPORT_FIELDS = VacancyListSerializer.Meta.fields
+EXPORT_VALUES = ('id', 'text', 'slug', 'status', 'created', 'user__username')
+
+
+def iter_vacancy_rows(queryset=None, chunk_size=2000):
+    # Строки читаются курсором (на PostgreSQL - серверным) пачками по chunk_size,
+    # навыки подтягиваются одним запросом на пачку, модели и сериализаторы DRF не создаются
+    if queryset is None:
+        queryset = Vacancy.objects.all()
+    rows = queryset.order_by('id').values_list(*EXPORT_VALUES).iterator(chunk_size=chunk_size)
+
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+
+        skills = skill_names_by_vacancy([row[0] for row in chunk])
+        for pk, text, slug, status, created, username in chunk:
+            yield {
+                'id': pk,
+                'text': text,
+                'slug': slug,
+                'status': status,
+                'created': created.isoformat(),
+                'username': username,
+                'skills': skills[pk],
+            }
+
+
+def iter_jsonl(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + '\n'
+
+
+class _Echo:
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        row['skills'] = CSV_SKILLS_SEPARATOR.join(row['skills'])
+        yield writer.writerow([row[field] for field in EXPORT_FIELDS])
+
+
+FORMATS = {
+    'jsonl': (iter_jsonl, 'application/x-ndjson'),
+    'csv': (iter_csv, 'text/csv'),
+}
@@ -0,0 +1,150 @@
+from django.http import Http404
+from django.utils.functional import cached_property
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField, SlugRelatedField
+from rest_framework.response import Response
+
+from hunting.instrumentation import timed
+
+from vacancies.serializers import VacancyListSerializer, VacancyDetailSerializer
+from vacancies.skills import skill_names_by_vacancy
+
+# Быстрый путь вывода для сериализаторов вакансий: строки .values() вместо моделей,
+# навыки одним запросом на страницу. План (поле ответа -> ключ строки и преобразование)
+# строится один раз по полям самого DRF сериализатора, поэтому JSON получается тот же.
+# Если у сериализатора есть поле, которое так вывести нельзя (другие many-to-many),
+# view работают обычным путем DRF через модели
+
+SKILLS = object()
+METHOD = object()
+
+# Значения из БД уже нужного типа, to_representation для них можно не вызывать
+PLAIN_FIELDS = (serializers.CharField, serializers.IntegerField, serializers.ChoiceField)
+
+
+class ValuesSerializer:
+    serializer_class = None
+    # Ключ в .values() для полей, чей source не является полем модели
+    sources = {}
+    # Поля .values(), которые нужны методам get_<поле> для SerializerMethodField
+    method_sources = {}
+
+    @cached_property
+    def plan(self):
+        # None - быстрый путь не поддерживает поля сериализатора
+        plan = []
+        for name, field in self.serializer_class().fields.items():
+            if isinstance(field, ManyRelatedField):
+                if not self.is_skill_names(field):
+                    return None
+                plan.append((name, SKILLS, None))
+            elif isinstance(field, serializers.SerializerMethodField):
+                plan.append((name, METHOD, getattr(self, f'get_{name}')))
+            elif isinstance(field, RelatedField):
+                # .values('user') отдает user_id - то же, что выводит PrimaryKeyRelatedField
+                plan.append((name, field.source, None))
+            else:
+                key = self.sources.get(name, field.source)
+                convert = None if isinstance(field, PLAIN_FIELDS) else field.to_representation
+                plan.append((name, key, convert))
+        return plan
+
+    @staticmethod
+    def is_skill_names(field):
+        # Имена навыков вакансии, их отдает skill_names_by_vacancy
+        child = field.child_relation
+        return field.source == 'skills' and isinstance(child, SlugRelatedField) and child.slug_field == 'name'
+
+    @property
+    def supported(self):
+        return self.plan is not None
+
+    @cached_property
+    def value_fields(self):
+        fields = {'id'}
+        for name, key, _ in self.plan:
+            if key is METHOD:
+                fields.update(self.method_sources.get(name, ()))
+            elif key is not SKILLS:
+                fields.add(key)
+        return sorted(fields)
+
+    def values(self, queryset):
+        # Аннотации (likes_total, rank) остаются в строках
+        return queryset.prefetch_related(None).values(*self.value_fields, *queryset.query.annotations)
+
+    def to_representation(self, row, skills=None):
+        data = {}
+        for name, key, convert in self.plan:
+            if key is SKILLS:
+                data[name] = skills[row['id']]
+            elif key is METHOD:
+                data[name] = convert(row)
+            else:
+                value = row[key]
+                data[name] = value if convert is None or value is None else convert(value)
+        return data
+
+    @timed('serializer')
+    def serialize_many(self, rows):
+        rows = list(rows)
+        skills = skill_names_by_vacancy([row['id'] for row in rows])
+        return [self.to_representation(row, skills) for row in rows]
+
+    def serialize(self, row):
+        return self.serialize_many([row])[0]
+
+    def serialize_queryset(self, queryset):
+        if not self.supported:
+            return self.serializer_class(queryset, many=True).data
+        return self.serialize_many(self.values(queryset))
+
+
+class VacancyListValuesSerializer(ValuesSerializer):
+    serializer_class = VacancyListSerializer
+    sources = {'username': 'user__username'}
+
+
+class VacancyDetailValuesSerializer(ValuesSerializer):
+    serializer_class = VacancyDetailSerializer
+    method_sources = {'likes': ['likes']}
+
+    def get_likes(self, row):
+        # Как VacancyDetailSerializer.get_likes
+        return row.get('likes_total', row['likes'])
+
+
+# План строится при первом использовании и дальше общий для всех запросов
+vacancy_list_values = VacancyListValuesSerializer()
+vacancy_detail_values = VacancyDetailValuesSerializer()
+
+
+class ValuesListMixin:
+    # ListModelMixin.list, но страница выбирается через .values() и выводится values_serializer
+    values_serializer = None
+
+    def list(self, request, *args, **kwargs):
+        if not self.values_serializer.supported:
+            return super().list(request, *args, **kwargs)
+        queryset = self.values_serializer.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.values_serializer.serialize_many(page))
+        return Response(self.values_serializer.serialize_many(queryset))
+
+
+class ValuesRetrieveMixin:
+    values_serializer = None
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.values_serializer.supported:
+            return super().retrieve(request, *args, **kwargs)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.values_serializer.values(self.filter_queryset(self.get_queryset()))
+
+        row = queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}).first()
+        if row is None:
+            raise Http404
+        self.check_object_permissions(request, row)
+        return Response(self.values_serializer.serialize(row))
@@ -0,0 +1,49 @@
+from django.db.models import Q, Count
+from django.db.models.functions import Lower
+from rest_framework.exceptions import ValidationError
+
+from vacancies.models import Vacancy, Skill
+
+SKILL_MATCH_ANY = 'any'
+SKILL_MATCH_ALL = 'all'
+SKILL_MATCHES = (SKILL_MATCH_ANY, SKILL_MATCH_ALL)
+STATUSES = tuple(value for value, _ in Vacancy.STATUS)
+
+
+def filter_by_status(queryset, status):
+    # Идет по индексам (status, created) и vacancy_open_created_idx
+    if status not in STATUSES:
+        raise ValidationError({'status': f"Expected one of: {', '.join(STATUSES)}"})
+    return queryset.filter(status=status)
+
+
+def normalize_skill(name):
+    return name.strip().lower()
+
+
+def filter_by_skills(queryset, skills, match=None):
+    # Фильтрация идет полусоединением pk IN (SELECT vacancy_id FROM vacancy_skills ...),
+    # поэтому вакансии не дублируются и DISTINCT по широким строкам не нужен
+    links = Vacancy.skills.through.objects
+
+    if match is None:
+        # Старый режим: вхождение подстроки хотя бы одного навыка
+        skills_q = Q()
+        for skill in skills:
+            skills_q |= Q(skill__name__icontains=skill)
+        return queryset.filter(pk__in=links.filter(skills_q).values('vacancy_id'))
+
+    if match not in SKILL_MATCHES:
+        raise ValidationError({'skill_match': f"Expected one of: {', '.join(SKILL_MATCHES)}"})
+
+    # Точное совпадение без учета регистра, идет по индексу skill_name_lower_idx
+    names = {normalize_skill(skill) for skill in skills} - {''}
+    skill_ids = Skill.objects.alias(lname=Lower('name')).filter(lname__in=names).values('pk')
+    links = links.filter(skill__in=skill_ids)
+
+    if match == SKILL_MATCH_ALL:
+        links = links.values('vacancy_id').annotate(
+            matched=Count(Lower('skill__name'), distinct=True)
+        ).filter(matched=len(names))
+
+    return queryset.filter(pk__in=links.values('vacancy_id'))
@@ -0,0 +1,191 @@
+import codecs
+import csv
+import json
+import time
+from itertools import islice
+
+from django.db import transaction, IntegrityError, DataError
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+from vacancies.counters import adjust_vacancy_count
+from vacancies.models import Vacancy
+from vacancies.serializers import (
+    VacancyCreateSerializer, NotInStatusValidator, SLUG_CONSTRAINT, violates_constraint,
+)
+from vacancies.signals import vacancies_changed
+from vacancies.skills import get_or_create_skills, add_vacancy_skills
+
+CSV_SKILLS_SEPARATOR = ';'
+
+
+class VacancyImportSerializer(VacancyCreateSerializer):
+    # Правила VacancyCreateSerializer, но без запросов на каждую строку:
+    # уникальность slug и навыки проверяются сразу для всей пачки в VacancyImporter
+    slug = serializers.CharField(max_length=50)
+    # Значение, которое не влезет в колонку, должно стать ошибкой строки, а не DataError пачки
+    status = serializers.ChoiceField(choices=Vacancy.STATUS, validators=[NotInStatusValidator('closed')])
+    skills = serializers.ListField(child=serializers.CharField(max_length=20), required=False)
+
+    class Meta(VacancyCreateSerializer.Meta):
+        exclude = ["search_vector", "modified", "user"]
+
+
+class ImportReport:
+    def __init__(self):
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+        self.started = time.perf_counter()
+        self.elapsed = 0
+
+    def add_error(self, row, errors):
+        self.failed += 1
+        self.errors.append({'row': row, 'errors': errors})
+
+    @property
+    def rows_per_sec(self):
+        total = self.created + self.failed
+        return round(total / self.elapsed, 1) if self.elapsed else 0
+
+    def as_dict(self):
+        return {
+            'created': self.created,
+            'failed': self.failed,
+            'elapsed': round(self.elapsed, 3),
+            'rows_per_sec': self.rows_per_sec,
+            'errors': self.errors,
+        }
+
+
+def read_jsonl(lines):
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield number, None, {'non_field_errors': ['Invalid JSON.']}
+            continue
+        if not isinstance(data, dict):
+            yield number, None, {'non_field_errors': ['Expected a JSON object.']}
+            continue
+        yield number, data, None
+
+
+def read_csv(lines):
+    # Первая строка - заголовок, навыки в одной колонке через ';'
+    for number, data in enumerate(csv.DictReader(lines), start=2):
+        data = {key: value for key, value in data.items() if key and value not in ('', None)}
+        if 'skills' in data:
+            data['skills'] = [
+                skill.strip() for skill in data['skills'].split(CSV_SKILLS_SEPARATOR) if skill.strip()
+            ]
+        yield number, data, None
+
+
+READERS = {
+    'jsonl': read_jsonl,
+    'csv': read_csv,
+}
+
+
+def decode_lines(stream, encoding='utf-8'):
+    return codecs.iterdecode(stream, encoding)
+
+
+class VacancyImporter:
+    def __init__(self, user=None, chunk_size=1000):
+        self.user = user
+        self.chunk_size = chunk_size
+        self.serializer = VacancyImportSerializer()
+        self.seen_slugs = set()
+
+    def run(self, rows):
+        # rows - итератор (номер строки, данные, ошибка разбора) из read_jsonl / read_csv
+        report = ImportReport()
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                break
+            self.import_chunk(chunk, report)
+
+        report.errors.sort(key=lambda error: error['row'])
+        report.elapsed = time.perf_counter() - report.started
+        return report
+
+    def import_chunk(self, chunk, report):
+        valid = []
+        for number, data, error in chunk:
+            if error:
+                report.add_error(number, error)
+                continue
+            try:
+                valid.append((number, self.serializer.run_validation(data)))
+            except ValidationError as exc:
+                report.add_error(number, exc.detail)
+
+        existing = self.existing_slugs([data['slug'] for _, data in valid])
+
+        rows = []
+        for number, data in valid:
+            if data['slug'] in existing or data['slug'] in self.seen_slugs:
+                report.add_error(number, {'slug': ['This field must be unique.']})
+                continue
+            self.seen_slugs.add(data['slug'])
+
+            data.pop('id', None)
+            skills = data.pop('skills', [])
+            rows.append((number, data, skills))
+
+        if not rows:
+            return
+
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    vacancies = self.save(rows)
+            except (IntegrityError, DataError):
+                # Строку пропустила проверка выше, но не БД (например, slug вставили
+                # параллельно): пачку сохраняем построчно, чтобы найти ее и сохранить остальные
+                vacancies = self.save_each(rows, report)
+
+            if vacancies:
+                # bulk_create не шлет сигналов: счетчик автора и кэш списков правим сами
+                adjust_vacancy_count(self.user.pk if self.user else None, len(vacancies))
+                vacancies_changed.send(sender=Vacancy, pks=[vacancy.pk for vacancy in vacancies])
+
+        report.created += len(vacancies)
+
+    def existing_slugs(self, slugs):
+        return set(Vacancy.objects.filter(slug__in=slugs).values_list('slug', flat=True))
+
+    def save(self, rows):
+        vacancies = Vacancy.objects.bulk_create([Vacancy(user=self.user, **data) for _, data, _ in rows])
+
+        skill_ids = {
+            skill.name: skill.pk
+            for skill in get_or_create_skills(name for _, _, names in rows for name in names)
+        }
+        add_vacancy_skills(
+            (vacancy.pk, skill_ids[name])
+            for vacancy, (_, _, names) in zip(vacancies, rows)
+            for name in names
+        )
+        return vacancies
+
+    def save_each(self, rows, report):
+        vacancies = []
+        for row in rows:
+            try:
+                with transaction.atomic():
+                    vacancies.extend(self.save([row]))
+            except IntegrityError as error:
+                if violates_constraint(error, Vacancy, SLUG_CONSTRAINT):
+                    report.add_error(row[0], {'slug': ['This field must be unique.']})
+                else:
+                    report.add_error(row[0], {'non_field_errors': ['Violates a database constraint.']})
+            except DataError:
+                report.add_error(row[0], {'non_field_errors': ['Value does not fit the database column.']})
+        return vacancies
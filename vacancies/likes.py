@@ -0,0 +1,131 @@
+import logging
+import random
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction, DatabaseError, IntegrityError
+from django.db.models import F, Count, Sum, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from vacancies.models import Vacancy, VacancyLikeBuffer, VacancyLikeShard
+from vacancies.signals import vacancies_changed
+
+FLUSH_LOCK = 'vacancies:likes:flush'
+
+logger = logging.getLogger(__name__)
+
+
+class DirectLikes:
+    # Исходный вариант: каждый лайк - UPDATE строки вакансии
+    def add(self, pks):
+        Vacancy.objects.filter(pk__in=pks).update(likes=F('likes') + 1, modified=timezone.now())
+        vacancies_changed.send(sender=Vacancy, pks=list(pks))
+
+    def annotate(self, queryset):
+        return queryset
+
+
+class BufferedLikes:
+    # Лайк - вставка строки в VacancyLikeBuffer, горячая строка вакансии не блокируется.
+    # Итог = Vacancy.likes + еще не перенесенные лайки (annotate)
+    def add(self, pks):
+        existing = list(Vacancy.objects.filter(pk__in=pks).values_list('pk', flat=True))
+        VacancyLikeBuffer.objects.bulk_create([VacancyLikeBuffer(vacancy_id=pk) for pk in existing])
+        vacancies_changed.send(sender=Vacancy, pks=existing)
+
+        # Перенос запускает только один запрос за интервал. Лайк уже сохранен,
+        # поэтому ошибка переноса не должна ронять запрос: строки дождутся следующего
+        if cache.add(FLUSH_LOCK, 1, timeout=settings.VACANCY_LIKES_FLUSH_INTERVAL):
+            try:
+                flush_likes()
+            except DatabaseError:
+                logger.exception('Failed to flush buffered likes')
+
+    def annotate(self, queryset):
+        pending = VacancyLikeBuffer.objects.filter(vacancy=OuterRef('pk')).order_by().values(
+            'vacancy'
+        ).annotate(count=Count('pk')).values('count')
+        return queryset.annotate(likes_total=F('likes') + Coalesce(Subquery(pending), 0))
+
+
+class ShardedLikes:
+    # Лайк увеличивает счетчик в случайном шарде: одновременные лайки одной вакансии
+    # чаще всего блокируют разные строки. Чтение точное: Vacancy.likes + сумма шардов
+    def add(self, pks):
+        existing = list(Vacancy.objects.filter(pk__in=pks).values_list('pk', flat=True))
+        for pk in existing:
+            self.increment(pk, random.randrange(settings.VACANCY_LIKES_SHARDS))
+        vacancies_changed.send(sender=Vacancy, pks=existing)
+
+    def increment(self, vacancy_id, shard):
+        shards = VacancyLikeShard.objects.filter(vacancy_id=vacancy_id, shard=shard)
+        if shards.update(count=F('count') + 1):
+            return
+        try:
+            with transaction.atomic():
+                VacancyLikeShard.objects.create(vacancy_id=vacancy_id, shard=shard, count=1)
+        except IntegrityError:
+            # Шард успел создать параллельный запрос
+            shards.update(count=F('count') + 1)
+
+    def annotate(self, queryset):
+        shards = VacancyLikeShard.objects.filter(vacancy=OuterRef('pk')).order_by().values(
+            'vacancy'
+        ).annotate(total=Sum('count')).values('total')
+        return queryset.annotate(likes_total=F('likes') + Coalesce(Subquery(shards), 0))
+
+
+LIKES_BACKENDS = {
+    'direct': DirectLikes,
+    'buffered': BufferedLikes,
+    'sharded': ShardedLikes,
+}
+
+
+def get_likes_backend():
+    mode = settings.VACANCY_LIKES_MODE
+    if mode not in LIKES_BACKENDS:
+        raise ImproperlyConfigured(
+            f"VACANCY_LIKES_MODE must be one of: {', '.join(LIKES_BACKENDS)}, got {mode!r}"
+        )
+    return LIKES_BACKENDS[mode]()
+
+
+def flush_likes(batch_size=10000):
+    # Переносит буфер в Vacancy.likes пачками. Строки буфера блокируются с SKIP LOCKED,
+    # поэтому параллельные переносы не считают один лайк дважды
+    flushed = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                VacancyLikeBuffer.objects.select_for_update(skip_locked=True)
+                .order_by('pk').values_list('pk', 'vacancy_id')[:batch_size]
+            )
+            if not rows:
+                break
+
+            deleted, _ = VacancyLikeBuffer.objects.filter(pk__in=[pk for pk, _ in rows]).delete()
+            if deleted != len(rows):
+                # Часть строк уже перенес другой процесс (СУБД без SELECT ... FOR UPDATE)
+                transaction.set_rollback(True)
+                break
+
+            # Одним UPDATE на каждое значение прироста, а не на каждую вакансию
+            by_increment = defaultdict(list)
+            for vacancy_id, count in Counter(vacancy_id for _, vacancy_id in rows).items():
+                by_increment[count].append(vacancy_id)
+
+            now = timezone.now()
+            for count, vacancy_ids in by_increment.items():
+                Vacancy.objects.filter(pk__in=vacancy_ids).update(likes=F('likes') + count, modified=now)
+
+            vacancies_changed.send(sender=Vacancy, pks=[vacancy_id for _, vacancy_id in rows])
+
+        flushed += len(rows)
+        if len(rows) < batch_size:
+            break
+
+    return flushed
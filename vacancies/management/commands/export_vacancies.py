@@ -0,0 +1,24 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from vacancies.export import iter_vacancy_rows, FORMATS
+
+
+class Command(BaseCommand):
+    help = 'Export all vacancies with skills and usernames as JSON Lines or CSV'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(FORMATS), default='jsonl')
+        parser.add_argument('--output', help='file path, stdout by default')
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        render, _ = FORMATS[options['format']]
+        lines = render(iter_vacancy_rows(chunk_size=options['chunk_size']))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                output.writelines(lines)
+        else:
+            sys.stdout.writelines(lines)
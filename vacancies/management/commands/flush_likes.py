@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from vacancies.likes import flush_likes
+
+
+class Command(BaseCommand):
+    help = "Move buffered likes (VACANCY_LIKES_MODE = 'buffered') into Vacancy.likes"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        flushed = flush_likes(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'flushed {flushed} likes'))
@@ -0,0 +1,42 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from authentication.models import User
+from vacancies.importers import VacancyImporter, READERS
+
+
+class Command(BaseCommand):
+    help = 'Import vacancies from a JSON Lines or CSV file ("-" reads stdin)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=sorted(READERS), help='by default taken from the file extension')
+        parser.add_argument('--chunk-size', type=int, default=1000)
+        parser.add_argument('--user', help='username of the vacancies owner')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('csv' if path.endswith('.csv') else 'jsonl')
+
+        user = None
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"User {options['user']} not found")
+
+        importer = VacancyImporter(user=user, chunk_size=options['chunk_size'])
+        if path == '-':
+            report = importer.run(READERS[file_format](sys.stdin))
+        else:
+            with open(path, encoding='utf-8', newline='') as lines:
+                report = importer.run(READERS[file_format](lines))
+
+        for error in report.errors:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'], ensure_ascii=False)}")
+        self.stdout.write(self.style.SUCCESS(
+            f'created {report.created}, failed {report.failed}, '
+            f'{report.elapsed:.2f}s, {report.rows_per_sec} rows/sec'
+        ))
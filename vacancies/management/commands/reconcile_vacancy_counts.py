@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from vacancies.counters import reconcile_vacancy_counts
+
+
+class Command(BaseCommand):
+    help = 'Recalculate User.vacancy_count where it drifted from the vacancy table'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='only report drifted users')
+
+    def handle(self, *args, **options):
+        drifted = reconcile_vacancy_counts(dry_run=options['dry_run'])
+        action = 'found' if options['dry_run'] else 'fixed'
+        self.stdout.write(self.style.SUCCESS(f'{action} {drifted} drifted users'))
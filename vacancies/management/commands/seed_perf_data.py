@@ -0,0 +1,35 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from vacancies.perf_data import seed_perf_data
+
+
+class Command(BaseCommand):
+    help = 'Generate users, skills and vacancies for performance measurements'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--vacancies', type=int, default=100_000)
+        parser.add_argument('--users', type=int, help='by default one per 20 vacancies')
+        parser.add_argument('--skills', type=int, default=50)
+        parser.add_argument('--skills-per-vacancy', type=int, default=3)
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--prefix', default='perf', help='prefix of usernames, slugs and skill names')
+        parser.add_argument('--chunk-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        created = seed_perf_data(
+            options['vacancies'],
+            users=options['users'],
+            skills=options['skills'],
+            skills_per_vacancy=options['skills_per_vacancy'],
+            seed=options['seed'],
+            prefix=options['prefix'],
+            chunk_size=options['chunk_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"created {created['users']} users, {created['skills']} skills, "
+            f"{created['vacancies']} vacancies, {created['links']} skill links "
+            f"in {time.perf_counter() - started:.1f}s"
+        ))
@@ -0,0 +1,70 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:25
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+SEARCH_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['search_vector'], name='vacancy_search_vector_gin'
+)
+
+# Вектор пересчитывается самой БД при вставке и изменении text,
+# поэтому bulk_create и update() тоже держат его в актуальном состоянии
+CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION vacancies_vacancy_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector('russian', coalesce(NEW.text, ''));
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER vacancies_vacancy_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF text ON vacancies_vacancy
+    FOR EACH ROW EXECUTE FUNCTION vacancies_vacancy_search_vector_update();
+
+UPDATE vacancies_vacancy SET search_vector = to_tsvector('russian', coalesce(text, ''));
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS vacancies_vacancy_search_vector_trigger ON vacancies_vacancy;
+DROP FUNCTION IF EXISTS vacancies_vacancy_search_vector_update();
+"""
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('vacancies', 'Vacancy'), SEARCH_INDEX)
+    schema_editor.execute(CREATE_TRIGGER)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_TRIGGER)
+    schema_editor.remove_index(apps.get_model('vacancies', 'Vacancy'), SEARCH_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0008_vacancy_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vacancy',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        # GIN индекс и триггер есть только в PostgreSQL, на SQLite остается лишь колонка
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='vacancy', index=SEARCH_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_index, drop_search_index),
+            ],
+        ),
+    ]
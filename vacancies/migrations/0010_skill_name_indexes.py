@@ -0,0 +1,25 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:26
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0009_vacancy_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='skill_name_lower_idx'),
+        ),
+        # Промежуточная таблица создана Django автоматически, индекса skill_id -> vacancy_id
+        # у нее нет (уникальный индекс идет в обратном порядке), добавляем его вручную
+        migrations.RunSQL(
+            'CREATE INDEX vacancy_skills_skill_vacancy_idx '
+            'ON vacancies_vacancy_skills (skill_id, vacancy_id)',
+            'DROP INDEX vacancy_skills_skill_vacancy_idx',
+        ),
+    ]
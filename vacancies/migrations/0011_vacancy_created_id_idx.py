@@ -0,0 +1,17 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0010_skill_name_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['-created', '-id'], name='vacancy_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:32
+
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_vacancy_count(apps, schema_editor):
+    User = apps.get_model('authentication', 'User')
+    Vacancy = apps.get_model('vacancies', 'Vacancy')
+
+    vacancies = Vacancy.objects.filter(user=OuterRef('pk')).order_by().values(
+        'user'
+    ).annotate(count=Count('pk')).values('count')
+    User.objects.update(vacancy_count=Coalesce(Subquery(vacancies), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_user_vacancy_count'),
+        ('vacancies', '0011_vacancy_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_vacancy_count, migrations.RunPython.noop),
+    ]
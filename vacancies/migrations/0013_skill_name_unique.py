@@ -0,0 +1,43 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:32
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def merge_duplicate_skills(apps, schema_editor):
+    # Перед уникальным ограничением сливаем одноименные навыки в навык с меньшим id
+    Skill = apps.get_model('vacancies', 'Skill')
+    Through = apps.get_model('vacancies', 'Vacancy').skills.through
+
+    duplicates = Skill.objects.values('name').annotate(
+        keep_id=Min('id'), total=Count('id')
+    ).filter(total__gt=1)
+
+    for duplicate in duplicates:
+        skill_ids = Skill.objects.filter(name=duplicate['name']).exclude(
+            pk=duplicate['keep_id']
+        ).values_list('pk', flat=True)
+        vacancy_ids = Through.objects.filter(skill_id__in=skill_ids).values_list(
+            'vacancy_id', flat=True
+        ).distinct()
+
+        Through.objects.bulk_create(
+            [Through(vacancy_id=vacancy_id, skill_id=duplicate['keep_id']) for vacancy_id in vacancy_ids],
+            ignore_conflicts=True,
+        )
+        Skill.objects.filter(pk__in=list(skill_ids)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0012_backfill_user_vacancy_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_skills, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='skill',
+            constraint=models.UniqueConstraint(fields=('name',), name='skill_name_unique'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0013_skill_name_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='modified',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='modified',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
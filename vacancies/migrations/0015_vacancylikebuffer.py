@@ -0,0 +1,22 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0014_modified'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VacancyLikeBuffer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pending_likes', to='vacancies.vacancy')),
+            ],
+        ),
+    ]
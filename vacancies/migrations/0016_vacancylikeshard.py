@@ -0,0 +1,27 @@
+# Generated by Django 4.1.7 on 2026-10-18 06:45
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0015_vacancylikebuffer'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VacancyLikeShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.PositiveSmallIntegerField()),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='like_shards', to='vacancies.vacancy')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='vacancylikeshard',
+            constraint=models.UniqueConstraint(fields=('vacancy', 'shard'), name='vacancy_like_shard_unique'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:08
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def rename_duplicate_slugs(apps, schema_editor):
+    # Перед уникальным ограничением: у повторяющихся slug первая вакансия (меньший id)
+    # сохраняет slug, остальные получают суффикс -<id>
+    Vacancy = apps.get_model('vacancies', 'Vacancy')
+    max_length = Vacancy._meta.get_field('slug').max_length
+
+    duplicates = Vacancy.objects.values('slug').annotate(
+        keep_id=Min('id'), total=Count('id')
+    ).filter(total__gt=1)
+
+    for duplicate in duplicates:
+        vacancies = Vacancy.objects.filter(slug=duplicate['slug']).exclude(pk=duplicate['keep_id'])
+        for pk in vacancies.values_list('pk', flat=True):
+            suffix = f'-{pk}'
+            slug = duplicate['slug'][:max_length - len(suffix)] + suffix
+            while Vacancy.objects.filter(slug=slug).exists():
+                suffix = '-' + suffix.lstrip('-') + 'x'
+                slug = duplicate['slug'][:max_length - len(suffix)] + suffix
+            Vacancy.objects.filter(pk=pk).update(slug=slug)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vacancies', '0016_vacancylikeshard'),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_slugs, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='vacancy',
+            constraint=models.UniqueConstraint(fields=('slug',), name='vacancy_slug_unique'),
+        ),
+        # обычный индекс slug заменен уникальным
+        migrations.AlterField(
+            model_name='vacancy',
+            name='slug',
+            field=models.SlugField(db_index=False),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(fields=['status', 'created'], name='vacancy_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='vacancy',
+            index=models.Index(condition=models.Q(('status', 'open')), fields=['-created', '-id'], name='vacancy_open_created_idx'),
+        ),
+    ]
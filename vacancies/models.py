@@ -1,8 +1,11 @@
 from datetime import date
 
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models.functions import Lower
 
 from authentication.models import User  # моя модель пользователя
 
@@ -16,14 +19,38 @@ def check_date_not_past(value: date):
 class Skill(models.Model):
     name = models.CharField(max_length=20)
     is_active = models.BooleanField(default=True)
+    # Время последнего изменения для ETag / Last-Modified, см. vacancies/conditional.py
+    modified = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         verbose_name = 'Навык'
         verbose_name_plural = 'Навыки'
+        indexes = [
+            models.Index(Lower('name'), name='skill_name_lower_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['name'], name='skill_name_unique'),
+        ]
 
     def __str__(self):
         return self.name
 
+
+class VacancyQuerySet(models.QuerySet):
+    # Спланированный запрос для списка: пользователь подтягивается join-ом,
+    # навыки одним запросом на страницу, а не по запросу на каждую вакансию
+    def for_list(self):
+        return self.select_related('user').only(
+            'id', 'text', 'slug', 'status', 'created', 'user__username',
+        ).prefetch_related('skills')
+
+
+class VacancyManager(models.Manager.from_queryset(VacancyQuerySet)):
+    # Поисковый вектор нужен только в WHERE, в выборку его не тянем
+    def get_queryset(self):
+        return super().get_queryset().defer('search_vector')
+
+
 class Vacancy(models.Model):
     STATUS = [
         ('draft', 'Черновик'),
@@ -31,7 +58,8 @@ class Vacancy(models.Model):
         ('closed', 'Закрыто')
     ]
 
-    slug = models.SlugField(max_length=50)
+    # Обычный индекс не нужен, его заменяет уникальный vacancy_slug_unique
+    slug = models.SlugField(max_length=50, db_index=False)
     text = models.CharField(max_length=1000)
     status = models.CharField(max_length=6, choices=STATUS, default='draft')
     created = models.DateField(auto_now_add=True)
@@ -42,15 +70,67 @@ class Vacancy(models.Model):
     min_experience = models.IntegerField(null=True, validators=[MinValueValidator(0)])
     updated_at = models.DateField(null=True, validators=[check_date_not_past])  # свой валидатор
 
+    # Время последнего изменения для ETag / Last-Modified, см. vacancies/conditional.py.
+    # update() его не трогает, там modified=timezone.now() указывается явно
+    modified = models.DateTimeField(auto_now=True, db_index=True)
+
+    # Заполняется триггером БД из text (только PostgreSQL), см. vacancies/search.py
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = VacancyManager()
+
     class Meta:
         verbose_name = 'Вакансия'
         verbose_name_plural = 'Вакансии'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='vacancy_search_vector_gin'),
+            # ключ постраничного вывода по курсору, см. vacancies/pagination.py
+            models.Index(fields=['-created', '-id'], name='vacancy_created_id_idx'),
+            # ?status= в списке вакансий; открытые - самый частый случай, для них
+            # отдельный частичный индекс в порядке вывода
+            models.Index(fields=['status', 'created'], name='vacancy_status_created_idx'),
+            models.Index(
+                fields=['-created', '-id'], condition=models.Q(status='open'), name='vacancy_open_created_idx',
+            ),
+        ]
+        constraints = [
+            # Уникальность slug проверяет БД, сериализаторы превращают IntegrityError в ошибку поля
+            models.UniqueConstraint(fields=['slug'], name='vacancy_slug_unique'),
+        ]
 
     def __str__(self):
         return self.slug
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Запоминаем автора из БД, чтобы при смене user поправить счетчики вакансий
+        if 'user_id' in instance.__dict__:
+            instance._loaded_user_id = instance.user_id
+        return instance
+
     @property
     def username(self):
         return self.user.username if self.user else None
 
 
+
+
+class VacancyLikeBuffer(models.Model):
+    # Отложенные лайки (VACANCY_LIKES_MODE = 'buffered'): только вставки, без блокировки
+    # строки вакансии; периодически переносятся в Vacancy.likes, см. vacancies/likes.py
+    vacancy = models.ForeignKey(Vacancy, on_delete=models.CASCADE, related_name='pending_likes')
+    created = models.DateTimeField(auto_now_add=True)
+
+
+class VacancyLikeShard(models.Model):
+    # Лайки по шардам (VACANCY_LIKES_MODE = 'sharded'): параллельные лайки одной вакансии
+    # попадают в разные строки; итог = Vacancy.likes + сумма шардов, см. vacancies/likes.py
+    vacancy = models.ForeignKey(Vacancy, on_delete=models.CASCADE, related_name='like_shards')
+    shard = models.PositiveSmallIntegerField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['vacancy', 'shard'], name='vacancy_like_shard_unique'),
+        ]
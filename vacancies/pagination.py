@@ -0,0 +1,252 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import OrderedDict
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q, F, Func, Value, BooleanField
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param, remove_query_param
+
+
+class RowComparison(Func):
+    # (a, b) < (A, B): составной индекс по (a, b) читается одним диапазоном
+    output_field = BooleanField()
+
+    def __init__(self, fields, lookup, values):
+        self.operator = {'lt': '<', 'gt': '>'}[lookup]
+        super().__init__(*[F(field) for field in fields], *[Value(value) for value in values])
+
+    def as_sql(self, compiler, connection, **extra_context):
+        parts, params = [], []
+        for expression in self.get_source_expressions():
+            sql, expression_params = compiler.compile(expression)
+            parts.append(sql)
+            params.extend(expression_params)
+
+        half = len(parts) // 2
+        sql = f"({', '.join(parts[:half])}) {self.operator} ({', '.join(parts[half:])})"
+        return sql, params
+
+
+class KeysetPagination(PageNumberPagination):
+    # Постраничный вывод по ключу (created, id) вместо OFFSET: следующая страница
+    # ищется условием WHERE по последней строке предыдущей, без COUNT(*).
+    # Режим включается параметром ?pagination=cursor или наличием ?cursor=,
+    # иначе работает обычная пагинация по номеру страницы.
+    ordering = ('-created', '-id')
+    cursor_query_param = 'cursor'
+    mode_query_param = 'pagination'
+    count_query_param = 'count'  # ?count=exact | approx
+    invalid_cursor_message = 'Invalid cursor'
+
+    keyset = False
+    known_count = None  # задается заранее, если количество уже посчитано (см. vacancies/conditional.py)
+
+    def django_paginator_class(self, object_list, per_page):
+        paginator = Paginator(object_list, per_page)
+        if self.known_count is not None:
+            paginator.count = self.known_count
+        return paginator
+
+    def is_keyset(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or request.query_params.get(self.mode_query_param) == 'cursor'
+        )
+
+    def counts_exactly(self, request):
+        # Нужен ли полный COUNT(*): всегда для страниц по номеру, по курсору - только ?count=exact
+        return not self.is_keyset(request) or request.query_params.get(self.count_query_param) == 'exact'
+
+    def page_slice(self, queryset, request):
+        # Запрос страницы по курсору (с одной лишней строкой - есть ли продолжение)
+        if queryset.query.order_by and tuple(queryset.query.order_by) != tuple(self.ordering):
+            # Свой порядок выборки (ранг поиска, ?rank=1) курсор по ключу не сохранит
+            raise ValidationError({
+                self.mode_query_param: [f"Cursor pagination requires ordering by {', '.join(self.ordering)}"]
+            })
+        self.model = queryset.model
+        page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [self._invert(field) for field in ordering]
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._after(ordering, position))
+        return queryset[:page_size + 1], page_size, position, reverse
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.is_keyset(request)
+        if not self.keyset:
+            # Страницы по номеру в том же порядке, что и по курсору (и в async списке),
+            # если выборка не упорядочена сама (например, по рангу поиска)
+            if not queryset.ordered:
+                queryset = queryset.order_by(*self.ordering)
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.base_url = remove_query_param(request.build_absolute_uri(), self.page_query_param)
+        self.count = self.get_count(queryset, request)
+
+        page, page_size, position, reverse = self.page_slice(queryset, request)
+        results = list(page)
+        has_more = len(results) > page_size
+        results = results[:page_size]
+        if reverse:
+            results.reverse()
+
+        has_next = has_more if not reverse else True
+        has_previous = position is not None if not reverse else has_more
+
+        self.next_position = self._position(results[-1]) if has_next and results else None
+        self.previous_position = self._position(results[0]) if has_previous and results else None
+        return results
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+
+        response = OrderedDict()
+        if self.count is not None:
+            response['count'] = self.count
+        response['next'] = self.get_next_link()
+        response['previous'] = self.get_previous_link()
+        response['results'] = data
+        return Response(response)
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+        if self.previous_position is None:
+            return None
+        return replace_query_param(
+            self.base_url, self.cursor_query_param,
+            self.encode_cursor(self.previous_position, reverse=True)
+        )
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        return parameters + [
+            {
+                'name': self.mode_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Set to "cursor" to use keyset pagination.',
+                'schema': {'type': 'string', 'enum': ['cursor']},
+            },
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'The pagination cursor value.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Include a total in keyset mode: "exact" or planner-based "approx".',
+                'schema': {'type': 'string', 'enum': ['exact', 'approx']},
+            },
+        ]
+
+    def get_count(self, queryset, request):
+        mode = request.query_params.get(self.count_query_param)
+        if mode == 'exact' and self.known_count is not None:
+            return self.known_count
+        if mode == 'approx' and connections[queryset.db].vendor == 'postgresql':
+            # Оценка планировщика вместо полного прохода по таблице
+            plan = json.loads(queryset.order_by().explain(format='json'))
+            return int(plan[0]['Plan']['Plan Rows'])
+        if mode in ('exact', 'approx'):
+            return queryset.count()
+        return None
+
+    def encode_cursor(self, position, reverse=False):
+        payload = {'p': position}
+        if reverse:
+            payload['r'] = 1
+        data = json.dumps(payload, separators=(',', ':')).encode()
+        return urlsafe_b64encode(data).decode('ascii')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(urlsafe_b64decode(encoded.encode('ascii')))
+            values = payload['p']
+            if len(values) != len(self.ordering):
+                raise ValueError
+            position = [
+                self.model._meta.get_field(self._name(field)).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except Exception:
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, bool(payload.get('r'))
+
+    def _position(self, obj):
+        values = []
+        for field in self.ordering:
+            name = self._name(field)
+            value = obj[name] if isinstance(obj, dict) else getattr(obj, name)
+            values.append(value if isinstance(value, int) else str(value))
+        return values
+
+    def _after(self, ordering, position):
+        descending = {field.startswith('-') for field in ordering}
+        if len(descending) == 1:
+            return RowComparison(
+                [self._name(field) for field in ordering],
+                'lt' if descending.pop() else 'gt',
+                position,
+            )
+        return self._after_mixed(ordering, position)
+
+    def _after_mixed(self, ordering, position):
+        # Разные направления сортировки не сравнить кортежем:
+        # (a ASC, b DESC) после (A, B): a >= A AND (a > A OR b < B)
+        field, value = ordering[0], position[0]
+        name = self._name(field)
+        op = 'lt' if field.startswith('-') else 'gt'
+        if len(ordering) == 1:
+            return Q(**{f'{name}__{op}': value})
+
+        op_or_equal = op + 'e'
+        return Q(**{f'{name}__{op_or_equal}': value}) & (
+            Q(**{f'{name}__{op}': value}) | self._after_mixed(ordering[1:], position[1:])
+        )
+
+    @staticmethod
+    def _name(field):
+        return field.lstrip('-')
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith('-') else '-' + field
+
+
+class VacancyPagination(KeysetPagination):
+    ordering = ('-created', '-id')
+
+
+class SkillPagination(KeysetPagination):
+    ordering = ('id',)
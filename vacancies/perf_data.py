@@ -0,0 +1,75 @@
+import random
+from collections import Counter
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from authentication.models import User
+from vacancies.cache import invalidate_all
+from vacancies.models import Vacancy
+from vacancies.skills import get_or_create_skills, add_vacancy_skills
+
+# Данные для замеров производительности: пользователи, навыки, вакансии и связи
+# генерируются в памяти пачками (random.choices на всю пачку сразу) и вставляются
+# bulk_create, без сигналов и запросов на каждую строку. При одинаковом seed
+# получаются одни и те же данные. Используется в manage.py seed_perf_data,
+# VacancyFactory.create_bulk (тесты) и benchmarks/suite.py
+
+WORDS = [
+    'python', 'django', 'postgresql', 'backend', 'frontend', 'devops', 'аналитик',
+    'разработчик', 'тестировщик', 'удаленно', 'офис', 'junior', 'middle', 'senior',
+]
+STATUSES = ['draft', 'open', 'closed']
+STATUS_WEIGHTS = [1, 6, 3]
+
+
+def seed_perf_data(vacancies, users=None, skills=50, skills_per_vacancy=3, seed=0,
+                   prefix='perf', role=User.HR, chunk_size=10000):
+    rnd = random.Random(seed)
+    users = users or max(1, vacancies // 20)
+    skills_per_vacancy = min(skills_per_vacancy, skills)
+
+    # Владелец каждой вакансии выбирается заранее, поэтому vacancy_count
+    # пользователей известен до вставки и пересчет не нужен
+    owners = rnd.choices(range(users), k=vacancies)
+    counts = Counter(owners)
+    password = make_password(prefix)
+
+    with transaction.atomic():
+        user_ids = []
+        for start in range(0, users, chunk_size):
+            user_ids.extend(user.pk for user in User.objects.bulk_create([
+                User(username=f'{prefix}-user{i}', password=password, role=role, vacancy_count=counts[i])
+                for i in range(start, min(users, start + chunk_size))
+            ]))
+
+        skill_ids = [skill.pk for skill in get_or_create_skills(f'{prefix}-skill{i}' for i in range(skills))]
+
+        for start in range(0, vacancies, chunk_size):
+            size = min(chunk_size, vacancies - start)
+            statuses = rnd.choices(STATUSES, STATUS_WEIGHTS, k=size)
+            words = rnd.choices(WORDS, k=size * 8)
+            created = Vacancy.objects.bulk_create([
+                Vacancy(
+                    slug=f'{prefix}-{start + i}',
+                    text=' '.join(words[i * 8:(i + 1) * 8]),
+                    status=statuses[i],
+                    min_experience=rnd.randrange(6),
+                    likes=rnd.randrange(100),
+                    user_id=user_ids[owners[start + i]],
+                )
+                for i in range(size)
+            ])
+            add_vacancy_skills(
+                (vacancy.pk, skill_id)
+                for vacancy in created
+                for skill_id in rnd.sample(skill_ids, skills_per_vacancy)
+            )
+
+    invalidate_all()
+    return {
+        'users': users,
+        'skills': skills,
+        'vacancies': vacancies,
+        'links': vacancies * skills_per_vacancy,
+    }
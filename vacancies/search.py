@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F
+from django.utils.module_loading import import_string
+
+# Конфигурация словаря PostgreSQL, такая же используется в триггере миграции 0009
+SEARCH_CONFIG = 'russian'
+
+
+class SubstringSearchBackend:
+    # Запасной вариант для SQLite (тестовые прогоны): поиск подстроки без ранжирования
+    ranked = False
+
+    def search(self, queryset, text, rank=False):
+        return queryset.filter(text__icontains=text)
+
+
+class PostgresSearchBackend:
+    # Полнотекстовый поиск по предрассчитанной колонке search_vector (GIN индекс)
+    ranked = True
+
+    def search(self, queryset, text, rank=False):
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+        queryset = queryset.filter(search_vector=query)
+
+        if rank:
+            queryset = queryset.annotate(
+                rank=SearchRank(F('search_vector'), query)
+            ).order_by('-rank', '-id')
+
+        return queryset
+
+
+def get_search_backend(using='default'):
+    backend = getattr(settings, 'VACANCY_SEARCH_BACKEND', None)
+    if backend:
+        return import_string(backend)()
+
+    if connections[using].vendor == 'postgresql':
+        return PostgresSearchBackend()
+    return SubstringSearchBackend()
@@ -1,8 +1,13 @@
+from contextlib import contextmanager
+
+from django.db import transaction, IntegrityError
 from rest_framework import serializers
 from rest_framework.relations import PrimaryKeyRelatedField
-from rest_framework.validators import UniqueValidator
+
+from hunting.serializers import ModelSerializer
 
 from vacancies.models import Vacancy, Skill
+from vacancies.skills import get_or_create_skills, add_vacancy_skills
 
 
 # Свой валидатор в виде класса
@@ -17,10 +22,45 @@ class NotInStatusValidator:
             raise serializers.ValidationError("Incorrect status")
 
 
-class SkillSerializer(serializers.ModelSerializer):
+SLUG_CONSTRAINT = 'vacancy_slug_unique'
+
+
+def violates_constraint(error, model, name):
+    # PostgreSQL сообщает имя ограничения в diag, SQLite - только столбцы уникального ограничения
+    diag = getattr(error.__cause__, 'diag', None)
+    if diag is not None:
+        return diag.constraint_name == name
+    constraint = next(constraint for constraint in model._meta.constraints if constraint.name == name)
+    columns = ', '.join(
+        f'{model._meta.db_table}.{model._meta.get_field(field).column}' for field in constraint.fields
+    )
+    return str(error) == f'UNIQUE constraint failed: {columns}' or name in str(error)
+
+
+@contextmanager
+def unique_slug():
+    # Уникальность slug проверяет ограничение vacancy_slug_unique в БД, без запроса заранее.
+    # Использовать снаружи transaction.atomic(), чтобы после ошибки откатилась только вставка
+    try:
+        yield
+    except IntegrityError as error:
+        if not violates_constraint(error, Vacancy, SLUG_CONSTRAINT):
+            raise
+        raise serializers.ValidationError({'slug': ['This field must be unique.']})
+
+
+class SkillSerializer(ModelSerializer):
     class Meta:
         model = Skill
-        fields = '__all__'
+        exclude = ["modified"]
+
+    # Уникальность имени проверяет ограничение skill_name_unique в БД
+    def save(self, **kwargs):
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError:
+            raise serializers.ValidationError({'name': ['Skill with this name already exists.']})
 
 
 # class VacancySerializer(serializers.Serializer):
@@ -30,22 +70,28 @@ class SkillSerializer(serializers.ModelSerializer):
 #     status = serializers.CharField(max_length=6)
 #     created = serializers.DateField()
 #     username = serializers.CharField(max_length=100)
-class VacancyListSerializer(serializers.ModelSerializer):
+class VacancyListSerializer(ModelSerializer):
     username = serializers.CharField()
     skills = serializers.SlugRelatedField(many=True, read_only=True, slug_field="name")
     class Meta:
         model = Vacancy
         fields = ["id", "text", "slug", "status", "created", "username", "skills"]
 
-class VacancyDetailSerializer(serializers.ModelSerializer):
+class VacancyDetailSerializer(ModelSerializer):
     skills = serializers.SlugRelatedField(
         many=True, read_only=True, slug_field="name")
+    # likes_total добавляет бэкенд лайков (vacancies/likes.py), если часть лайков еще в буфере
+    likes = serializers.SerializerMethodField()
+
+    def get_likes(self, obj):
+        return getattr(obj, 'likes_total', obj.likes)
+
     class Meta:
         model = Vacancy
-        fields = "__all__"
+        exclude = ["search_vector", "modified"]
 
 
-class VacancyCreateSerializer(serializers.ModelSerializer):
+class VacancyCreateSerializer(ModelSerializer):
     # Вывод ID, но поле не обязательное required=False
     id = serializers.IntegerField(required=False)
     skills = serializers.SlugRelatedField(
@@ -54,32 +100,27 @@ class VacancyCreateSerializer(serializers.ModelSerializer):
         queryset=Skill.objects.all(),
         slug_field="name"
     )
-    slug = serializers.CharField(
-        max_length=50,
-        validators=[UniqueValidator(queryset=Vacancy.objects.all())]
-    )
+    slug = serializers.CharField(max_length=50)
     status = serializers.CharField(max_length=8, validators=[NotInStatusValidator('closed')])
 
     class Meta:
         model = Vacancy
-        fields = "__all__"
+        exclude = ["search_vector", "modified"]
 
     def is_valid(self, raise_exception=False):
         self._skills = self.initial_data.pop("skills", [])
         return super().is_valid(raise_exception=raise_exception)
 
     def create(self, validated_data):
-        vacancy = Vacancy.objects.create(**validated_data)
-
-        for skill in self._skills:
-            skill_obj, _ = Skill.objects.get_or_create(name=skill)
-            vacancy.skills.add(skill_obj)
-
-        vacancy.save()
+        with unique_slug(), transaction.atomic():
+            vacancy = Vacancy.objects.create(**validated_data)
+            add_vacancy_skills(
+                (vacancy.pk, skill.pk) for skill in get_or_create_skills(self._skills)
+            )
         return vacancy
 
 
-class VacancyUpdateSerializer(serializers.ModelSerializer):
+class VacancyUpdateSerializer(ModelSerializer):
     skills = serializers.SlugRelatedField(
         required=False,
         many=True,
@@ -98,17 +139,15 @@ class VacancyUpdateSerializer(serializers.ModelSerializer):
         return super().is_valid(raise_exception=raise_exception)
 
     def save(self):
-        vacancy = super().save()
-
-        for skill in self._skills:
-            skill_obj, _ = Skill.objects.get_or_create(name=skill)
-            vacancy.skills.add(skill_obj)
-
-        vacancy.save()
+        with unique_slug(), transaction.atomic():
+            vacancy = super().save()
+            add_vacancy_skills(
+                (vacancy.pk, skill.pk) for skill in get_or_create_skills(self._skills)
+            )
         return vacancy
 
 
-class VacancyDestroySerializer(serializers.ModelSerializer):
+class VacancyDestroySerializer(ModelSerializer):
     model = Vacancy
     fields = ["id", ]
 
@@ -0,0 +1,91 @@
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver, Signal
+from django.utils import timezone
+
+from authentication.models import User
+from vacancies.cache import invalidate_vacancies, invalidate_vacancy_lists, invalidate_all
+from vacancies.counters import adjust_vacancy_count
+from vacancies.models import Vacancy, Skill
+
+# Изменения в обход save(): лайки, массовый импорт. Аргумент pks - список id вакансий
+vacancies_changed = Signal()
+
+
+def touch_vacancies(queryset):
+    # update() не обновляет auto_now поля, modified проставляем сами
+    queryset.update(modified=timezone.now())
+
+
+@receiver(post_save, sender=Vacancy)
+def update_vacancy_count_on_save(sender, instance, created, **kwargs):
+    if created:
+        adjust_vacancy_count(instance.user_id, 1)
+    else:
+        # _loaded_user_id - значение из БД на момент загрузки (см. Vacancy.from_db),
+        # у объектов, собранных вручную, оно неизвестно и счетчик не трогаем
+        old_user_id = getattr(instance, '_loaded_user_id', instance.user_id)
+        if old_user_id != instance.user_id:
+            adjust_vacancy_count(old_user_id, -1)
+            adjust_vacancy_count(instance.user_id, 1)
+
+    instance._loaded_user_id = instance.user_id
+
+
+@receiver(post_delete, sender=Vacancy)
+def update_vacancy_count_on_delete(sender, instance, **kwargs):
+    adjust_vacancy_count(getattr(instance, '_loaded_user_id', instance.user_id), -1)
+
+
+@receiver(post_save, sender=Vacancy)
+@receiver(post_delete, sender=Vacancy)
+def invalidate_vacancy_cache(sender, instance, **kwargs):
+    invalidate_vacancies([instance.pk])
+
+
+@receiver(vacancies_changed)
+def invalidate_changed_vacancies_cache(sender, pks, **kwargs):
+    invalidate_vacancies(pks)
+
+
+@receiver(m2m_changed, sender=Vacancy.skills.through)
+def invalidate_vacancy_skills_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    if reverse and action == 'pre_clear':
+        # skill.vacancy_set.clear(): после очистки связей уже не найти затронутые вакансии
+        touch_vacancies(Vacancy.objects.filter(skills=instance))
+    if not action.startswith('post_'):
+        return
+    if reverse:
+        # skill.vacancy_set.add(...): меняются вакансии из pk_set
+        if pk_set:
+            touch_vacancies(Vacancy.objects.filter(pk__in=pk_set))
+        invalidate_all()
+    else:
+        touch_vacancies(Vacancy.objects.filter(pk=instance.pk))
+        invalidate_vacancies([instance.pk])
+
+
+@receiver(pre_save, sender=Skill)
+@receiver(pre_delete, sender=Skill)
+def touch_skill_vacancies(sender, instance, **kwargs):
+    # Имя навыка выводится в вакансиях, их ETag тоже должен смениться
+    if instance.pk is not None:
+        touch_vacancies(Vacancy.objects.filter(skills=instance))
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def invalidate_skill_cache(sender, **kwargs):
+    invalidate_all()
+
+
+@receiver(post_save, sender=User)
+def invalidate_username_cache(sender, instance, created, update_fields=None, **kwargs):
+    # В списке вакансий выводится имя автора: его вакансиям нужен новый ETag, а спискам -
+    # сброс кэша. Сохранение других полей (last_login при входе) их не трогает;
+    # у объектов, собранных вручную, прежнее имя неизвестно - считаем, что изменилось
+    if created or (update_fields is not None and 'username' not in update_fields):
+        return
+    if getattr(instance, '_loaded_username', None) != instance.username:
+        touch_vacancies(Vacancy.objects.filter(user=instance))
+        invalidate_vacancy_lists()
+    instance._loaded_username = instance.username
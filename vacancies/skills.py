@@ -0,0 +1,33 @@
+from vacancies.models import Vacancy, Skill
+
+
+def get_or_create_skills(names):
+    # Вместо get_or_create на каждый навык: одна вставка с игнорированием
+    # конфликтов по уникальному имени и одна выборка всех навыков
+    names = list(dict.fromkeys(names))
+    if not names:
+        return []
+
+    Skill.objects.bulk_create([Skill(name=name) for name in names], ignore_conflicts=True)
+    skills = {skill.name: skill for skill in Skill.objects.filter(name__in=names)}
+    return [skills[name] for name in names]
+
+
+def add_vacancy_skills(links):
+    # links - пары (vacancy_id, skill_id), вставляются в промежуточную таблицу одним запросом
+    through = Vacancy.skills.through
+    through.objects.bulk_create(
+        [through(vacancy_id=vacancy_id, skill_id=skill_id) for vacancy_id, skill_id in links],
+        ignore_conflicts=True,
+    )
+
+
+def skill_names_by_vacancy(vacancy_ids):
+    # Имена навыков для набора вакансий одним запросом, в порядке id навыка
+    skills = {vacancy_id: [] for vacancy_id in vacancy_ids}
+    links = Vacancy.skills.through.objects.filter(
+        vacancy_id__in=vacancy_ids
+    ).order_by('skill_id').values_list('vacancy_id', 'skill__name')
+    for vacancy_id, name in links:
+        skills[vacancy_id].append(name)
+    return skills
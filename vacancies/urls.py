@@ -1,16 +1,23 @@
 from django.urls import path
 
-from vacancies import views
+from vacancies import views, async_views
 
 
 urlpatterns = [
     path('', views.VacancyListView.as_view()),
     path('<int:pk>/', views.VacancyDetailView.as_view()),
     path('create/', views.VacancyCreateView.as_view()),
+    path('import/', views.VacancyImportView.as_view()),
+    path('export/', views.VacancyExportView.as_view()),
     path('<int:pk>/update/', views.VacancyUpdateView.as_view()),
     path('<int:pk>/delete/', views.VacancyDeleteView.as_view()),
     path('by_user/', views.user_vacancies),
     path('like/', views.VacancyLikeView.as_view()),
+
+    # асинхронные версии для ASGI (hunting/asgi.py)
+    path('async/', async_views.vacancy_list),
+    path('async/<int:pk>/', async_views.vacancy_detail),
+    path('async/by_user/', async_views.user_vacancies),
 ]
 # urlpatterns += router.urls
 
@@ -1,18 +1,32 @@
 from django.core.paginator import Paginator
-from django.db.models import Q, F, Count, Avg
-from django.http import JsonResponse, HttpResponse
+from django.db.models import Count, Avg
+from django.http import HttpResponse, StreamingHttpResponse
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.generics import ListAPIView, RetrieveAPIView,CreateAPIView, \
     UpdateAPIView, DestroyAPIView
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet
 
 from authentication.models import User
 from hunting import settings
+from hunting.json import JsonResponse
+from vacancies.cache import cached_response, list_cache_key, detail_cache_key
+from vacancies.conditional import ConditionalGetMixin
+from vacancies.export import iter_vacancy_rows, FORMATS as EXPORT_FORMATS
+from vacancies.fast_serializers import ValuesListMixin, ValuesRetrieveMixin, \
+    vacancy_list_values, vacancy_detail_values
+from vacancies.filters import filter_by_skills, filter_by_status
+from vacancies.importers import VacancyImporter, read_jsonl, read_csv, decode_lines
+from vacancies.likes import get_likes_backend
 from vacancies.models import Vacancy, Skill
+from vacancies.pagination import VacancyPagination, SkillPagination
 from vacancies.permissions import VacancyCreatePermission
+from vacancies.search import get_search_backend
 from vacancies.serializers import VacancyListSerializer, VacancyDetailSerializer, \
     VacancyCreateSerializer, VacancyUpdateSerializer, \
     VacancyDestroySerializer, SkillSerializer
@@ -32,45 +46,63 @@ def hello(request):
         summary='Create skills'
     )
 )
-class SkillsViewSet(ModelViewSet):
+class SkillsViewSet(ConditionalGetMixin, ModelViewSet):
     queryset = Skill.objects.all()
     serializer_class = SkillSerializer
+    pagination_class = SkillPagination
 
 
-class VacancyListView(ListAPIView):
-    queryset = Vacancy.objects.all()
+class VacancyListView(ConditionalGetMixin, ValuesListMixin, ListAPIView):
+    queryset = Vacancy.objects.for_list()
     serializer_class = VacancyListSerializer
+    values_serializer = vacancy_list_values  # вывод без моделей, см. vacancies/fast_serializers.py
+    pagination_class = VacancyPagination
 
     @extend_schema(
         description="Retrieve vacancy list",
         summary="Vacancy list"
     )
     def get(self, request, *args, **kwargs):
+        return cached_response(
+            request, list_cache_key(request), lambda: self.list(request, *args, **kwargs)
+        )
+
+    def filter_queryset(self, queryset):
+        request = self.request
+
         vacancy_text = request.GET.get('text', None)
         if vacancy_text:
-            self.queryset = self.queryset.filter(
-                text__icontains=vacancy_text
+            queryset = get_search_backend().search(
+                queryset, vacancy_text, rank=request.GET.get('rank') == '1'
             )
 
-        skills = request.GET.getlist('skill', None)
-        skills_q = None
-        for skill in skills:
-            if skills_q is None:
-                skills_q = Q(skills__name__icontains=skill)
-            else:
-                skills_q |= Q(skills__name__icontains=skill)
+        status = request.GET.get('status')
+        if status:
+            queryset = filter_by_status(queryset, status)
 
-        if skills_q:
-            self.queryset = self.queryset.filter(skills_q)
+        skills = request.GET.getlist('skill', None)
+        if skills:
+            queryset = filter_by_skills(
+                queryset, skills, match=request.GET.get('skill_match')
+            )
 
-        return super().get(request, *args, **kwargs)
+        return queryset
 
 
-class VacancyDetailView(RetrieveAPIView):
+class VacancyDetailView(ConditionalGetMixin, ValuesRetrieveMixin, RetrieveAPIView):
     queryset = Vacancy.objects.all()
     serializer_class = VacancyDetailSerializer
+    values_serializer = vacancy_detail_values
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        return get_likes_backend().annotate(super().get_queryset())
+
+    def get(self, request, *args, **kwargs):
+        return cached_response(
+            request, detail_cache_key(kwargs['pk']), lambda: self.retrieve(request, *args, **kwargs)
+        )
+
 
 class VacancyCreateView(CreateAPIView):
     queryset = Vacancy.objects.all()
@@ -89,12 +121,51 @@ class VacancyDeleteView(DestroyAPIView):
     serializer_class = VacancyDestroySerializer
 
 
+class VacancyImportView(APIView):
+    permission_classes = [IsAuthenticated, VacancyCreatePermission]
+
+    @extend_schema(
+        description="Bulk import vacancies from JSON Lines (default) or CSV (Content-Type: text/csv)",
+        summary="Vacancy import",
+        request=None,
+    )
+    def post(self, request, *args, **kwargs):
+        # Тело читается построчно из потока, целиком в память не загружается
+        reader = read_csv if request.content_type.startswith('text/csv') else read_jsonl
+        lines = decode_lines(request.stream or [])
+
+        report = VacancyImporter(user=request.user).run(reader(lines))
+        return Response(report.as_dict())
+
+
+class VacancyExportView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        description="Stream all vacancies as JSON Lines (default) or CSV (?output=csv)",
+        summary="Vacancy export",
+    )
+    def get(self, request, *args, **kwargs):
+        output = request.query_params.get('output', 'jsonl')
+        if output not in EXPORT_FORMATS:
+            raise ValidationError({'output': f"Expected one of: {', '.join(EXPORT_FORMATS)}"})
+
+        render, content_type = EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(render(iter_vacancy_rows()), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="vacancies.{output}"'
+        return response
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def user_vacancies(request):
-    user_qs = User.objects.annotate(vacancies=Count('vacancy'))
+    # Количество вакансий хранится в User.vacancy_count, поэтому и страница,
+    # и агрегат читают только таблицу пользователей, без GROUP BY по вакансиям
+    user_qs = User.objects.only('id', 'username', 'vacancy_count').order_by('id')
+    totals = User.objects.aggregate(total=Count('id'), avg=Avg('vacancy_count'))
 
     paginator = Paginator(user_qs, settings.TOTAL_ON_PAGE)
+    paginator.count = totals['total']  # count уже известен, без отдельного COUNT(*)
     page_number = request.GET.get("page")
     page_obj = paginator.get_page(page_number)
 
@@ -103,14 +174,14 @@ def user_vacancies(request):
         users.append({
             "id": user.id,
             "name": user.username,
-            "vacancies": user.vacancies,
+            "vacancies": user.vacancy_count,
         })
 
     response = {
         "items": users,
         "total": paginator.count,
         "num_page": paginator.num_pages,
-        "avg": user_qs.aggregate(avg=Avg('vacancies'))['avg']
+        "avg": totals['avg'],
     }
 
     return JsonResponse(response, )
@@ -123,12 +194,11 @@ class VacancyLikeView(UpdateAPIView):
 
     @extend_schema(deprecated=True) # deprecated=True - пользоваться уже нельзя устарел
     def put(self, request, *args, **kwargs):
-        Vacancy.objects.filter(pk__in=request.data).update(likes=F('likes') + 1)
+        likes = get_likes_backend()
+        likes.add(request.data)
 
-        return JsonResponse(
-            VacancyDetailSerializer(Vacancy.objects.filter(pk__in=request.data), many=True).data,
-            safe=False,
-        )
+        vacancies = likes.annotate(Vacancy.objects.filter(pk__in=request.data))
+        return JsonResponse(vacancy_detail_values.serialize_queryset(vacancies), safe=False)
 
 
 